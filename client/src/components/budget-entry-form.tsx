@@ -39,9 +39,10 @@ export type BudgetEntry = {
   payee: string;
   dvNumber: string;
   remarks?: string;
+  rowVersion: number;
 };
 
-export type InsertBudgetEntry = Omit<BudgetEntry, "id">;
+export type InsertBudgetEntry = Omit<BudgetEntry, "id" | "rowVersion">;
 
 
 const EXPENDITURE_PROGRAMS = [
@@ -51,6 +51,7 @@ type InsertCollection = {
 
 type Collection = InsertCollection & {
   id: string;
+  rowVersion: number;
 };
 
 type BackendCollection = {
@@ -67,6 +68,7 @@ type BackendCollection = {
   payor: string;
   or_number: string;
   remarks?: string;
+  row_version?: number;
 };
 
 interface CollectionFormProps {
@@ -78,7 +80,8 @@ interface CollectionFormProps {
 function frontendToBackend(
   frontendData: InsertCollection,
   createdBy: number,
-  collectionId?: string
+  collectionId?: string,
+  rowVersion?: number
 ): BackendCollection {
   const backendData: BackendCollection = {
     created_by: createdBy,
@@ -97,6 +100,7 @@ function frontendToBackend(
 
   if (collectionId) {
     backendData.id = parseInt(collectionId);
+    backendData.row_version = rowVersion;
   }
 
   return backendData;
@@ -108,6 +112,7 @@ export function CollectionForm({ collection, trigger }: CollectionFormProps) {
   const [transactionId, setTransactionId] = useState("");
   const [idGenerationError, setIdGenerationError] = useState(false);
   const isEditMode = !!collection;
+  const [rowVersion, setRowVersion] = useState(collection?.rowVersion);
 
   // TODO: Get this from your auth context/session
   const currentUserId = 1;
@@ -172,6 +177,7 @@ export function CollectionForm({ collection, trigger }: CollectionFormProps) {
         });
       }
     } else if (collection) {
+      setRowVersion(collection.rowVersion);
       form.reset({
         transactionId: collection.transactionId,
         transactionDate: toDateInputValue(collection.transactionDate),
@@ -237,7 +243,8 @@ useEffect(() => {
       const backendData = frontendToBackend(
         data,
         currentUserId,
-        isEditMode ? collection.id : undefined
+        isEditMode ? collection.id : undefined,
+        rowVersion
       );
 
       const endpoint = isEditMode ? api.collections.update : api.collections.create;
@@ -248,6 +255,30 @@ useEffect(() => {
         body: JSON.stringify(backendData),
       });
 
+      if (result.status === 409 && result.current) {
+        // Someone saved this collection after it was loaded: show their copy
+        // and its new row_version so the user can re-apply their edit.
+        const current = result.current;
+        setRowVersion(current.row_version);
+        form.reset({
+          transactionId: current.transaction_id,
+          transactionDate: toDateInputValue(current.transaction_date),
+          natureOfCollection: current.nature_of_collection,
+          category: current.category,
+          subcategory: current.subcategory,
+          purpose: current.purpose || "",
+          fundSource: current.fund_source,
+          amount: String(current.amount),
+          payor: current.payor,
+          orNumber: current.or_number,
+          remarks: current.remarks || "",
+        });
+        queryClient.invalidateQueries({ queryKey: ["collections"] });
+        throw new Error(
+          "This collection was changed by someone else. The form now shows the latest version; review it and save again."
+        );
+      }
+
       if (result.error) {
         throw new Error(result.error);
       }
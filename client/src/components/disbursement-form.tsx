@@ -54,6 +54,7 @@ type BackendDisbursement = {
   payee: string;
   or_number: string;
   remarks?: string;
+  row_version?: number;
 };
 
 // Frontend types
@@ -73,6 +74,7 @@ type InsertDisbursement = {
 
 type Disbursement = InsertDisbursement & {
   id: string;
+  rowVersion: number;
 };
 
 interface DisbursementFormProps {
@@ -85,7 +87,8 @@ function frontendToBackend(
   frontendData: InsertDisbursement,
   createdBy: number,
   disbursementId?: string,
-  allocationId: number = 1
+  allocationId: number = 1,
+  rowVersion?: number
 ): BackendDisbursement {
   const backendData: BackendDisbursement = {
     created_by: createdBy,
@@ -105,6 +108,7 @@ function frontendToBackend(
 
   if (disbursementId) {
     backendData.id = parseInt(disbursementId);
+    backendData.row_version = rowVersion;
   }
 
   return backendData;
@@ -120,6 +124,7 @@ export function DisbursementForm({
   const [transactionId, setTransactionId] = useState("");
   const [idGenerationError, setIdGenerationError] = useState(false);
   const isEditMode = !!disbursement;
+  const [rowVersion, setRowVersion] = useState(disbursement?.rowVersion);
 
   // TODO: Get this from your auth context/session
   const currentUserId = 1;
@@ -184,6 +189,7 @@ export function DisbursementForm({
         });
       }
     } else if (disbursement) {
+      setRowVersion(disbursement.rowVersion);
       form.reset({
         transactionId: disbursement.transactionId,
         transactionDate: toDateInputValue(disbursement.transactionDate),
@@ -249,7 +255,9 @@ useEffect(() => {
       const backendData = frontendToBackend(
         data,
         currentUserId,
-        isEditMode ? disbursement.id : undefined
+        isEditMode ? disbursement.id : undefined,
+        undefined,
+        rowVersion
       );
 
       const endpoint = isEditMode ? api.disbursements.update : api.disbursements.create;
@@ -260,6 +268,30 @@ useEffect(() => {
         body: JSON.stringify(backendData),
       });
 
+      if (result.status === 409 && result.current) {
+        // Someone saved this disbursement after it was loaded: show their copy
+        // and its new row_version so the user can re-apply their edit.
+        const current = result.current;
+        setRowVersion(current.row_version);
+        form.reset({
+          transactionId: current.transaction_id,
+          transactionDate: toDateInputValue(current.transaction_date),
+          natureOfDisbursement: current.nature_of_disbursement,
+          category: current.category,
+          subcategory: current.subcategory,
+          programDescription: current.program_description || "",
+          fundSource: current.fund_source,
+          amount: String(current.amount),
+          payee: current.payee,
+          dvNumber: current.or_number,
+          remarks: current.remarks || "",
+        });
+        queryClient.invalidateQueries({ queryKey: ["disbursements"] });
+        throw new Error(
+          "This disbursement was changed by someone else. The form now shows the latest version; review it and save again."
+        );
+      }
+
       if (result.error) {
         throw new Error(result.error);
       }
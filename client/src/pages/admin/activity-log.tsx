@@ -17,7 +17,23 @@ import {
   TableRow,
 } from "../../components/ui/table";
 import { Badge } from "../../components/ui/badge";
-import { Users, Activity, LogOut, ArrowLeft, Loader2 } from "lucide-react";
+import { Input } from "../../components/ui/input";
+import {
+  Select,
+  SelectContent,
+  SelectItem,
+  SelectTrigger,
+  SelectValue,
+} from "../../components/ui/select";
+import {
+  Users,
+  Activity,
+  LogOut,
+  ArrowLeft,
+  Loader2,
+  ChevronLeft,
+  ChevronRight,
+} from "lucide-react";
 import { UserMenu } from "../../components/user-menu";
 import logoPath from "../../assets/san_agustin.jpg";
 
@@ -47,6 +63,11 @@ const MOCK_ADMIN_USER = {
   role: "admin",
 };
 
+const API_BASE_URL = import.meta.env.VITE_API_URL || "http://127.0.0.1:5000/api";
+
+// /get-all-docs is paged on the server; one page per request
+const PAGE_SIZE = 50;
+
 /* =======================
    LAYOUT
 ======================= */
@@ -159,23 +180,47 @@ export default function ActivityLogPage() {
   const [activityLogs, setActivityLogs] = useState<ActivityLog[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  const [typeFilter, setTypeFilter] = useState("all");
+  const [yearFilter, setYearFilter] = useState("");
+  const [statusFilter, setStatusFilter] = useState("all");
+  // cursor of the page being shown; null is the newest page
+  const [cursor, setCursor] = useState<string | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [prevCursor, setPrevCursor] = useState<string | null>(null);
+
+  // only a complete year is sent; the server rejects anything else
+  const year = /^\d{4}$/.test(yearFilter) ? yearFilter : "";
 
   useEffect(() => {
     fetchActivityLogs();
-  }, []);
+  }, [cursor, typeFilter, year, statusFilter]);
+
+  // a new filter starts again from the newest page
+  const changeFilter = (setFilter: (value: string) => void) => (value: string) => {
+    setFilter(value);
+    setCursor(null);
+  };
 
   const fetchActivityLogs = async () => {
     try {
       setLoading(true);
       setError(null);
-      
-      const response = await fetch("http://127.0.0.1:5000/api/get-all-docs");
+
+      const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+      if (cursor) params.set("cursor", cursor);
+      if (typeFilter !== "all") params.set("type", typeFilter);
+      if (year) params.set("year", year);
+      if (statusFilter !== "all") params.set("status", statusFilter);
+
+      const response = await fetch(`${API_BASE_URL}/get-all-docs?${params}`);
       
       if (!response.ok) {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
       
       const data = await response.json();
+      setNextCursor(response.headers.get("X-Next-Cursor"));
+      setPrevCursor(response.headers.get("X-Prev-Cursor"));
       
       // Transform API data to match ActivityLog interface
       const transformedData: ActivityLog[] = data.map((item: any) => {
@@ -186,25 +231,25 @@ export default function ActivityLogPage() {
         let amount = "0.00";
         let date = "";
         
-        if (item.transaction_id?.startsWith("COLL-")) {
+        if (item.doc_type === "collection" || item.transaction_id?.startsWith("COLL-")) {
           type = "collection";
           description = item.nature_of_collection || "Collection";
           category = item.nature_of_collection || "Collection";
           amount = item.amount || "0.00";
           date = item.transaction_date || item.created_at;
-        } else if (item.transaction_id?.startsWith("DISB-")) {
+        } else if (item.doc_type === "disbursement" || item.transaction_id?.startsWith("DISB-")) {
           type = "disbursement";
           description = item.nature_of_disbursement || "Disbursement";
           category = item.nature_of_disbursement || "Disbursement";
           amount = item.amount || "0.00";
           date = item.transaction_date || item.created_at;
-        } else if (item.transaction_id?.startsWith("BUDG-")) {
+        } else if (item.doc_type === "budget_entry" || item.transaction_id?.startsWith("BUDG-")) {
           type = "budget_entry";
           description = item.expenditure_program || "Budget Entry";
           category = item.allocation_category || "Budget";
           amount = item.amount || "0.00";
           date = item.transaction_date || item.created_at;
-        } else if (item.transaction_id?.startsWith("DFUR-")) {
+        } else if (item.doc_type === "dfur" || item.transaction_id?.startsWith("DFUR-")) {
           type = "dfur";
           description = item.project || "Development Fund Utilization";
           category = item.name_of_collection || "DFUR";
@@ -237,13 +282,7 @@ export default function ActivityLogPage() {
         };
       });
       
-      // Sort by date (newest first)
-      transformedData.sort((a, b) => {
-        const dateA = new Date(a.date).getTime();
-        const dateB = new Date(b.date).getTime();
-        return dateB - dateA;
-      });
-      
+      // already newest first; the server pages in that order
       setActivityLogs(transformedData);
     } catch (err) {
       console.error("Error fetching activity logs:", err);
@@ -298,6 +337,39 @@ export default function ActivityLogPage() {
                 ? "Loading transactions..."
                 : `Showing ${activityLogs.length} transactions`}
             </CardDescription>
+            <div className="flex flex-wrap items-center gap-3 pt-2">
+              <Select value={typeFilter} onValueChange={changeFilter(setTypeFilter)}>
+                <SelectTrigger className="w-44" data-testid="select-type-filter">
+                  <SelectValue placeholder="Type" />
+                </SelectTrigger>
+                <SelectContent>
+                  <SelectItem value="all">All types</SelectItem>
+                  <SelectItem value="collection">Collection</SelectItem>
+                  <SelectItem value="disbursement">Disbursement</SelectItem>
+                  <SelectItem value="budget_entry">Budget entry</SelectItem>
+                  <SelectItem value="dfur">DFUR</SelectItem>
+                </SelectContent>
+              </Select>
+              <Select value={statusFilter} onValueChange={changeFilter(setStatusFilter)}>
+                <SelectTrigger className="w-40" data-testid="select-status-filter">
+                  <SelectValue placeholder="Status" />
+                </SelectTrigger>
+                <SelectContent>
+                  <SelectItem value="all">All statuses</SelectItem>
+                  <SelectItem value="pending">Pending</SelectItem>
+                  <SelectItem value="approved">Approved</SelectItem>
+                  <SelectItem value="flagged">Flagged</SelectItem>
+                </SelectContent>
+              </Select>
+              <Input
+                type="number"
+                placeholder="Year"
+                className="w-28"
+                value={yearFilter}
+                onChange={(e) => changeFilter(setYearFilter)(e.target.value)}
+                data-testid="input-year-filter"
+              />
+            </div>
           </CardHeader>
           <CardContent>
             {loading ? (
@@ -372,6 +444,28 @@ export default function ActivityLogPage() {
                     ))}
                   </TableBody>
                 </Table>
+                <div className="flex items-center justify-end gap-2 pt-4">
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    disabled={!prevCursor}
+                    onClick={() => setCursor(prevCursor)}
+                    data-testid="button-prev-page"
+                  >
+                    <ChevronLeft className="h-4 w-4" />
+                    Previous
+                  </Button>
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    disabled={!nextCursor}
+                    onClick={() => setCursor(nextCursor)}
+                    data-testid="button-next-page"
+                  >
+                    Next
+                    <ChevronRight className="h-4 w-4" />
+                  </Button>
+                </div>
               </div>
             )}
           </CardContent>
@@ -61,6 +61,7 @@ type DfurProject = {
   review_comment?: string;
 
   remarks?: string;
+  row_version: number;
 };
 
 type ApiResponse = {
@@ -156,11 +157,18 @@ export default function ApproverDFUR() {
 
   // Approve project mutation
   const approveProject = useMutation({
-    mutationFn: async ({ id }: { id: number }) => {
+    mutationFn: async ({
+      id,
+      row_version,
+    }: {
+      id: number;
+      row_version: number;
+    }) => {
       const payload = {
         dfur_id: id,
         review_status: "approved",
         approval_type: "dfur",
+        row_version,
       };
 
       const response = await fetch(`${API_BASE_URL}/put-approval`, {
@@ -173,6 +181,14 @@ export default function ApproverDFUR() {
 
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
+        if (response.status === 409 && errorData.current) {
+          // Reload the dialog with the saved copy and its new row_version.
+          setSelectedProject(errorData.current);
+          queryClient.invalidateQueries({ queryKey: ["dfur-projects"] });
+          throw new Error(
+            "This project was changed by someone else since it was loaded. Check its latest details and submit again.",
+          );
+        }
         throw new Error(
           errorData.message || "Failed to approve project. Please try again.",
         );
@@ -206,9 +222,11 @@ export default function ApproverDFUR() {
     mutationFn: async ({
       id,
       comment,
+      row_version,
     }: {
       id: number;
       comment: string;
+      row_version: number;
     }) => {
       // Get user ID from localStorage or auth context
       const reviewedBy = localStorage.getItem("user_id") || "1";
@@ -218,6 +236,7 @@ export default function ApproverDFUR() {
         reviewed_by: parseInt(reviewedBy),
         comment: comment,
         flag_type: "dfur",
+        row_version,
       };
 
       const response = await fetch(`${API_BASE_URL}/put-flag-comment`, {
@@ -230,6 +249,14 @@ export default function ApproverDFUR() {
 
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
+        if (response.status === 409 && errorData.current) {
+          // Reload the dialog with the saved copy and its new row_version.
+          setSelectedProject(errorData.current);
+          queryClient.invalidateQueries({ queryKey: ["dfur-projects"] });
+          throw new Error(
+            "This project was changed by someone else since it was loaded. Check its latest details and submit again.",
+          );
+        }
         throw new Error(
           errorData.message || "Failed to flag project. Please try again.",
         );
@@ -262,7 +289,10 @@ export default function ApproverDFUR() {
     if (!selectedProject || !reviewAction) return;
 
     if (reviewAction === "approved") {
-      approveProject.mutate({ id: selectedProject.id });
+      approveProject.mutate({
+        id: selectedProject.id,
+        row_version: selectedProject.row_version,
+      });
     } else if (reviewAction === "flagged") {
       if (!reviewComment.trim()) {
         toast({
@@ -275,6 +305,7 @@ export default function ApproverDFUR() {
       flagProject.mutate({
         id: selectedProject.id,
         comment: reviewComment.trim(),
+        row_version: selectedProject.row_version,
       });
     }
   };
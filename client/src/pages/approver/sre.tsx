@@ -58,6 +58,7 @@ type Collection = {
   review_status: ReviewStatus;
   review_comment: string | null;
   is_flagged: number;
+  row_version: number;
 };
 
 type Disbursement = {
@@ -73,6 +74,7 @@ type Disbursement = {
   review_status: ReviewStatus;
   review_comment: string | null;
   is_flagged: number;
+  row_version: number;
 };
 
 export default function ApproverSRE() {
@@ -123,9 +125,11 @@ export default function ApproverSRE() {
     mutationFn: async ({
       id,
       type,
+      row_version,
     }: {
       id: number;
       type: "collection" | "disbursement";
+      row_version: number;
     }) => {
       const payload =
         type === "collection"
@@ -133,11 +137,13 @@ export default function ApproverSRE() {
               collection_id: id,
               review_status: "approved",
               approval_type: "collection",
+              row_version,
             }
           : {
               disbursement_id: id,
               review_status: "approved",
               approval_type: "disbursement",
+              row_version,
             };
 
       const response = await fetch(`${API_BASE_URL}/put-approval`, {
@@ -150,6 +156,17 @@ export default function ApproverSRE() {
 
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
+        if (response.status === 409 && errorData.current) {
+          // Reload the dialog with the saved copy and its new row_version.
+          setSelectedTransaction({ ...errorData.current, type });
+          queryClient.invalidateQueries({
+            queryKey:
+              type === "collection" ? ["collections"] : ["disbursements"],
+          });
+          throw new Error(
+            "This transaction was changed by someone else since it was loaded. Check its latest details and submit again.",
+          );
+        }
         throw new Error(
           errorData.message || "Failed to approve transaction. Please try again.",
         );
@@ -188,10 +205,12 @@ export default function ApproverSRE() {
       id,
       type,
       comment,
+      row_version,
     }: {
       id: number;
       type: "collection" | "disbursement";
       comment: string;
+      row_version: number;
     }) => {
       const reviewedBy = user?.id?.toString() || "1";
 
@@ -202,12 +221,14 @@ export default function ApproverSRE() {
               reviewed_by: parseInt(reviewedBy),
               comment: comment,
               flag_type: "collection",
+              row_version,
             }
           : {
               disbursement_id: id,
               reviewed_by: parseInt(reviewedBy),
               comment: comment,
               flag_type: "disbursement",
+              row_version,
             };
 
       const response = await fetch(`${API_BASE_URL}/put-flag-comment`, {
@@ -220,6 +241,17 @@ export default function ApproverSRE() {
 
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
+        if (response.status === 409 && errorData.current) {
+          // Reload the dialog with the saved copy and its new row_version.
+          setSelectedTransaction({ ...errorData.current, type });
+          queryClient.invalidateQueries({
+            queryKey:
+              type === "collection" ? ["collections"] : ["disbursements"],
+          });
+          throw new Error(
+            "This transaction was changed by someone else since it was loaded. Check its latest details and submit again.",
+          );
+        }
         throw new Error(
           errorData.message || "Failed to flag transaction. Please try again.",
         );
@@ -281,12 +313,14 @@ export default function ApproverSRE() {
       approveMutation.mutate({
         id: selectedTransaction.id,
         type: selectedTransaction.type,
+        row_version: selectedTransaction.row_version,
       });
     } else {
       flagMutation.mutate({
         id: selectedTransaction.id,
         type: selectedTransaction.type,
         comment: reviewComment.trim(),
+        row_version: selectedTransaction.row_version,
       });
     }
   };
@@ -61,6 +61,7 @@ type DfurProject = {
   review_comment?: string;
 
   remarks?: string;
+  row_version: number;
 };
 
 type ApiResponse = {
@@ -155,9 +156,11 @@ export default function CheckerDFUR() {
     mutationFn: async ({
       id,
       comment,
+      row_version,
     }: {
       id: number;
       comment: string;
+      row_version: number;
     }) => {
       // Get user ID from localStorage or auth context
       const reviewedBy = localStorage.getItem("user_id") || "1";
@@ -167,6 +170,7 @@ export default function CheckerDFUR() {
         reviewed_by: parseInt(reviewedBy),
         comment: comment,
         flag_type: "dfur",
+        row_version,
       };
 
       const response = await fetch(`${API_BASE_URL}/put-flag-comment`, {
@@ -179,6 +183,14 @@ export default function CheckerDFUR() {
 
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
+        if (response.status === 409 && errorData.current) {
+          // Reload the dialog with the saved copy and its new row_version.
+          setSelectedProject(errorData.current);
+          queryClient.invalidateQueries({ queryKey: ["dfur-projects"] });
+          throw new Error(
+            "This project was changed by someone else since it was loaded. Check its latest details and submit again.",
+          );
+        }
         throw new Error(
           errorData.message || "Failed to flag project. Please try again.",
         );
@@ -217,7 +229,11 @@ export default function CheckerDFUR() {
       });
       return;
     }
-    reviewProject.mutate({ id: selectedProject.id, comment: flagComment.trim() });
+    reviewProject.mutate({
+      id: selectedProject.id,
+      comment: flagComment.trim(),
+      row_version: selectedProject.row_version,
+    });
   };
 
   const formatCurrency = (value: string | number) => {
@@ -60,6 +60,7 @@ type Collection = {
 
   review_status: ReviewStatus;
   review_comment?: string;
+  row_version: number;
 };
 
 type Disbursement = {
@@ -76,6 +77,7 @@ type Disbursement = {
 
   review_status: ReviewStatus;
   review_comment?: string;
+  row_version: number;
 };
 
 
@@ -125,10 +127,12 @@ export default function CheckerSRE() {
       id,
       type,
       comment,
+      row_version,
     }: {
       id: string;
       type: "collection" | "disbursement";
       comment: string;
+      row_version: number;
     }) => {
       // Get user ID from localStorage or auth context
       // For now, using a placeholder - replace with actual user ID from your auth
@@ -142,12 +146,14 @@ export default function CheckerSRE() {
               reviewed_by: parseInt(reviewedBy),
               comment: comment,
               flag_type: "collection",
+              row_version,
             }
           : {
               disbursement_id: parseInt(id),
               reviewed_by: parseInt(reviewedBy),
               comment: comment,
               flag_type: "disbursement",
+              row_version,
             };
 
       const response = await fetch(`${API_BASE_URL}/put-flag-comment`, {
@@ -160,6 +166,21 @@ export default function CheckerSRE() {
 
       if (!response.ok) {
         const errorData = await response.json().catch(() => ({}));
+        if (response.status === 409 && errorData.current) {
+          // Reload the dialog with the saved copy and its new row_version.
+          setSelectedTransaction({
+            ...errorData.current,
+            id: String(errorData.current.id),
+            type,
+          });
+          queryClient.invalidateQueries({
+            queryKey:
+              type === "collection" ? ["collections"] : ["disbursements"],
+          });
+          throw new Error(
+            "This transaction was changed by someone else since it was loaded. Check its latest details and submit again.",
+          );
+        }
         throw new Error(
           errorData.message || "Failed to flag transaction. Please try again.",
         );
@@ -221,6 +242,7 @@ export default function CheckerSRE() {
       id: selectedTransaction.id,
       type: selectedTransaction.type,
       comment: reviewComment.trim(),
+      row_version: selectedTransaction.row_version,
     });
   };
 
@@ -59,6 +59,7 @@ type BackendBudgetEntry = {
   remarks?: string;
   allocation_id: number;
   created_by: number;
+  row_version: number;
 };
 
 type BackendInsertBudgetEntry = {
@@ -89,7 +90,11 @@ async function apiFetch(endpoint: string, options: RequestInit = {}) {
 
   if (!response.ok) {
     const error = await response.json();
-    throw new Error(error.message || error.error || "API request failed");
+    // keep the status and the 409 `current` row for the caller
+    throw Object.assign(
+      new Error(error.message || error.error || "API request failed"),
+      { status: response.status, current: error.current },
+    );
   }
 
   return response.json();
@@ -110,6 +115,7 @@ function backendToFrontend(backendEntry: BackendBudgetEntry): BudgetEntry {
     expenditureProgram: backendEntry.expenditure_program,
     programDescription: backendEntry.program_description,
     remarks: backendEntry.remarks,
+    rowVersion: backendEntry.row_version,
   };
 }
 
@@ -118,8 +124,9 @@ function frontendToBackend(
   frontendEntry: InsertBudgetEntry,
   createdBy: number,
   allocationId: number = 1,
-  entryId?: string
-): BackendInsertBudgetEntry & { id?: string } {
+  entryId?: string,
+  rowVersion?: number
+): BackendInsertBudgetEntry & { id?: string; row_version?: number } {
   const backendData: BackendInsertBudgetEntry = {
     created_by: createdBy,
     transaction_id: frontendEntry.transactionId,
@@ -137,7 +144,7 @@ function frontendToBackend(
   };
 
   if (entryId) {
-    return { ...backendData, id: entryId };
+    return { ...backendData, id: entryId, row_version: rowVersion };
   }
 
   return backendData;
@@ -212,12 +219,20 @@ export default function ABO() {
   const updateMutation = useMutation({
     mutationFn: async ({
       id,
+      rowVersion,
       data,
     }: {
       id: string;
+      rowVersion: number;
       data: InsertBudgetEntry;
     }) => {
-      const backendData = frontendToBackend(data, currentUserId, allocationId, id);
+      const backendData = frontendToBackend(
+        data,
+        currentUserId,
+        allocationId,
+        id,
+        rowVersion,
+      );
       return apiFetch("/put-budget-entries", {
         method: "PUT",
         body: JSON.stringify(backendData),
@@ -232,7 +247,19 @@ export default function ABO() {
       setDialogOpen(false);
       setSelectedEntry(undefined);
     },
-    onError: (error: Error) => {
+    onError: (error: Error & { status?: number; current?: BackendBudgetEntry }) => {
+      if (error.status === 409 && error.current) {
+        // Reload the dialog with the saved copy and its new row_version.
+        setSelectedEntry(backendToFrontend(error.current));
+        queryClient.invalidateQueries({ queryKey: ["budget-entries"] });
+        toast({
+          variant: "destructive",
+          title: "Budget Entry Changed",
+          description:
+            "This entry was changed by someone else. The form now shows the latest version; review it and save again.",
+        });
+        return;
+      }
       toast({
         variant: "destructive",
         title: "Error Updating Budget Entry",
@@ -298,7 +325,11 @@ export default function ABO() {
     if (mode === "create") {
       createMutation.mutate(data);
     } else if (mode === "edit" && selectedEntry) {
-      updateMutation.mutate({ id: selectedEntry.id, data });
+      updateMutation.mutate({
+        id: selectedEntry.id,
+        rowVersion: selectedEntry.rowVersion,
+        data,
+      });
     }
   };
 
@@ -76,6 +76,7 @@ export type DfurProject = {
   no_extensions: number;
   remarks?: string;
   is_active: number;
+  row_version: number;
 };
 
 export type InsertDfurProject = {
@@ -318,7 +319,9 @@ const dfurTotals = {
   });
 
   const updateProject = useMutation({
-    mutationFn: async (data: InsertDfurProject & { id: string }) => {
+    mutationFn: async (
+      data: InsertDfurProject & { id: string; row_version: number },
+    ) => {
       const result = await apiCall(api.dfurProject.update, {
         method: "PUT",
         body: JSON.stringify({
@@ -326,6 +329,14 @@ const dfurTotals = {
           is_active: 1,
         }),
       });
+      if (result.status === 409 && result.current) {
+        // Reloads the form with the saved copy and its new row_version.
+        setEditingProject(result.current);
+        queryClient.invalidateQueries({ queryKey: ["dfur-projects"] });
+        throw new Error(
+          "This project was changed by someone else. The form now shows the latest version; review it and save again.",
+        );
+      }
       if (result.error) throw new Error(result.error);
       return result.data;
     },
@@ -380,7 +391,11 @@ const dfurTotals = {
 
   const handleSubmit = (data: InsertDfurProject) => {
     if (editingProject) {
-      updateProject.mutate({ ...data, id: editingProject.id });
+      updateProject.mutate({
+        ...data,
+        id: editingProject.id,
+        row_version: editingProject.row_version,
+      });
     } else {
       createProject.mutate(data);
     }
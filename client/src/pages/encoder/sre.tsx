@@ -48,6 +48,7 @@ type BackendCollection = {
   payor: string;
   or_number: string;
   remarks?: string;
+  row_version: number;
 };
 
 type BackendDisbursement = {
@@ -63,6 +64,7 @@ type BackendDisbursement = {
   payee: string;
   or_number: string
   remarks?: string;
+  row_version: number;
 };
 
 // Frontend types
@@ -79,6 +81,7 @@ export type Collection = {
   purpose?: string;
   fundSource: string;
   remarks?: string;
+  rowVersion: number;
 };
 
 export type Disbursement = {
@@ -94,6 +97,7 @@ export type Disbursement = {
   programDescription?: string;
   fundSource: string;
   remarks?: string;
+  rowVersion: number;
 };
 
 type ViewType = 'collection' | 'disbursement';
@@ -113,6 +117,7 @@ function backendCollectionToFrontend(backend: BackendCollection): Collection {
     purpose: backend.purpose,
     fundSource: backend.fund_source,
     remarks: backend.remarks,
+    rowVersion: backend.row_version,
   };
 }
 
@@ -130,6 +135,7 @@ function backendDisbursementToFrontend(backend: BackendDisbursement): Disburseme
     programDescription: backend.program_description,
     fundSource: backend.fund_source,
     remarks: backend.remarks,
+    rowVersion: backend.row_version,
   };
 }
 
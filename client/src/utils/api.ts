@@ -47,7 +47,7 @@ export const api = {
 export async function apiCall<T>(
   url: string,
   options: RequestInit = {}
-): Promise<{ data?: T; error?: string }> {
+): Promise<{ data?: T; error?: string; status?: number; current?: any }> {
   try {
     const response = await fetch(url, {
       ...options,
@@ -60,7 +60,13 @@ export async function apiCall<T>(
     const data = await response.json();
 
     if (!response.ok) {
-      return { error: data.error || data.message || "An error occurred" };
+      // 409 means the row changed since it was loaded; `current` is the
+      // server's copy (with its new row_version) for the caller to reload.
+      return {
+        error: data.error || data.message || "An error occurred",
+        status: response.status,
+        current: data.current,
+      };
     }
 
     return { data };
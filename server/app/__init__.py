@@ -2,17 +2,28 @@ from flask import Flask
 from flask_cors import CORS
 from app.config import Config
 from app.extensions import jwt   #
+from app.database.unit_of_work import init_unit_of_work
+from app.utils.metrics import init_metrics
+from app.utils.json_provider import FastJSONProvider
 from dotenv import load_dotenv 
 
 def create_app():
     load_dotenv()
     app = Flask(__name__)
     app.config.from_object(Config)
+    # orjson-backed jsonify; same output as the default provider
+    app.json = FastJSONProvider(app)
 
-    CORS(app)
+    # let the browser read the pagination, export and revalidation headers
+    CORS(app, expose_headers=["X-Next-Cursor", "X-Prev-Cursor", "X-Total-Count", "Content-Disposition", "ETag", "Last-Modified"])
 
     # Initialize extensions
     jwt.init_app(app)
+    # request timing; registered first so its after_request runs last and
+    # the measured latency includes the unit of work commit
+    init_metrics(app)
+    # one connection + one commit per request
+    init_unit_of_work(app)
     # Register blueprints
     #TEST
     from app.routes.db_test_routes import db_test_bp
@@ -30,6 +41,14 @@ def create_app():
     from app.routes.approver_routes import approver_bp
     #VIEWER
     from app.routes.viewer_routes import viewer_bp
+    #IMPORT
+    from app.routes.import_routes import import_bp
+    #EXPORT
+    from app.routes.export_routes import export_bp
+    #EVENTS
+    from app.routes.events_routes import events_bp
+    #REPORTS
+    from app.routes.reports_routes import reports_bp
     #====================================================================================
     #TEST
     app.register_blueprint(db_test_bp, url_prefix="/api")
@@ -47,4 +66,16 @@ def create_app():
     app.register_blueprint(approver_bp, url_prefix="/api")
     #VIEWER
     app.register_blueprint(viewer_bp, url_prefix="/api")
+    #IMPORT
+    app.register_blueprint(import_bp, url_prefix="/api")
+    #EXPORT
+    app.register_blueprint(export_bp, url_prefix="/api")
+    #EVENTS
+    app.register_blueprint(events_bp, url_prefix="/api")
+    #REPORTS
+    app.register_blueprint(reports_bp, url_prefix="/api")
+
+    # flask CLI maintenance commands
+    from app.commands import register_commands
+    register_commands(app)
     return app
\ No newline at end of file
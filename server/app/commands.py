@@ -0,0 +1,175 @@
+import os
+import click
+from flask.cli import AppGroup
+from app.config import Config
+from app.database.connection import get_db_connection
+from app.database.migrations import upgrade, migration_status
+from app.database.query_registry import REGISTERED_QUERIES, explain_query
+from app.model.changes_db import purge_tombstones_db
+from app.model.encoder.import_jobs_db import insert_import_job_db
+from app.services.importer import IMPORT_TABLES, FILE_FORMATS, run_import
+from app.database.unit_of_work import transaction
+from app.services.ledger_tables import LEDGER_TABLES
+from app.services.ledger_summary import SUMMARY_TABLES, rebuild_summary, verify_summary
+from app.services.sre import PeriodAlreadyClosed, build_statement, close_period, reopen_period, period_label
+
+ledger_cli = AppGroup("ledger-summary", help="Maintain the ledger_summary / ledger_monthly rollup tables.")
+
+def _tables(table):
+    if table and table not in LEDGER_TABLES:
+        raise click.BadParameter(f"unknown table {table}", param_hint="--table")
+    return [table] if table else list(LEDGER_TABLES)
+
+@ledger_cli.command("rebuild")
+@click.option("--table", help="Only rebuild this table (default: all).")
+def rebuild_command(table):
+    """Recompute ledger_summary and ledger_monthly from the base tables."""
+    for summary_table in SUMMARY_TABLES:
+        for name in _tables(table):
+            # DELETE + INSERT ... SELECT in one transaction so readers never see it empty
+            with transaction():
+                buckets = rebuild_summary(name, summary_table)
+            click.echo(f"{summary_table} {name}: {buckets} buckets")
+
+@ledger_cli.command("verify")
+@click.option("--table", help="Only verify this table (default: all).")
+def verify_command(table):
+    """Compare the rollup tables with the base tables and report drift."""
+    drifted = False
+    for summary_table in SUMMARY_TABLES:
+        for name in _tables(table):
+            with transaction():
+                drift = verify_summary(name, summary_table)
+            if not drift:
+                click.echo(f"{summary_table} {name}: ok")
+                continue
+            drifted = True
+            click.echo(f"{summary_table} {name}: {len(drift)} bucket(s) drifted")
+            for item in drift:
+                click.echo(f"  {item['bucket']} expected={item['expected']} stored={item['stored']}")
+    if drifted:
+        raise SystemExit(1)
+
+db_cli = AppGroup("db", help="Schema migrations and query plan checks.")
+
+@db_cli.command("upgrade")
+@click.option("--to", "target", type=int, help="Stop after this migration version.")
+def upgrade_command(target):
+    """Apply pending migrations from server/migrations."""
+    applied = upgrade(target)
+    click.echo(f"{len(applied)} migration(s) applied")
+
+@db_cli.command("status")
+def status_command():
+    """List migrations and whether they are applied."""
+    for item in migration_status():
+        state = f"applied {item['applied_at']}" if item["applied_at"] else "pending"
+        if item["modified"]:
+            state += " (file changed since it was applied)"
+        click.echo(f"{item['version']:04d}_{item['name']}: {state}")
+
+@db_cli.command("explain")
+@click.option("--min-rows", type=int, default=None, help="Ignore plan steps estimated below this many rows.")
+@click.option("--verbose", is_flag=True, help="Print every plan, not just failures.")
+def explain_command(min_rows, verbose):
+    """EXPLAIN every registered query; fail on full scans or filesorts."""
+    min_rows = Config.EXPLAIN_MIN_ROWS if min_rows is None else min_rows
+    failed = False
+    conn = get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        for name, (query, params) in sorted(REGISTERED_QUERIES.items()):
+            plan, problems = explain_query(cursor, query, params, min_rows)
+            click.echo(f"{name}: {'FAIL' if problems else 'ok'}")
+            for problem in problems:
+                click.echo(f"  {problem}")
+            if verbose or problems:
+                for row in plan:
+                    click.echo(
+                        f"    {row.get('table')} type={row.get('type')} key={row.get('key')}"
+                        f" rows={row.get('rows')} extra={row.get('Extra')}"
+                    )
+            failed = failed or bool(problems)
+    finally:
+        cursor.close()
+        conn.close()
+    if failed:
+        raise SystemExit(1)
+
+@db_cli.command("purge-tombstones")
+@click.option("--days", type=int, default=None, help="Keep this many days (default: CHANGES_TOMBSTONE_DAYS).")
+def purge_tombstones_command(days):
+    """Delete row_tombstones older than the /api/changes cursor lifetime."""
+    days = Config.CHANGES_TOMBSTONE_DAYS if days is None else days
+    click.echo(f"{purge_tombstones_db(days)} tombstone(s) purged")
+
+sre_cli = AppGroup("sre", help="Close and reopen Statement of Receipts and Expenditures months.")
+
+@sre_cli.command("close")
+@click.option("--year", required=True, type=int)
+@click.option("--month", required=True, type=click.IntRange(1, 12))
+def sre_close_command(year, month):
+    """Snapshot a finished month's statement."""
+    try:
+        close_period(year, month)
+    except (PeriodAlreadyClosed, ValueError) as e:
+        raise click.ClickException(str(e))
+    statement = build_statement(year, month)
+    click.echo(
+        f"{statement['period']['label']}: receipts {statement['receipts']['total']}"
+        f" expenditures {statement['expenditures']['total']}"
+    )
+
+@sre_cli.command("reopen")
+@click.option("--year", required=True, type=int)
+@click.option("--month", required=True, type=click.IntRange(1, 12))
+def sre_reopen_command(year, month):
+    """Drop a month's snapshot so it is computed from the ledgers again."""
+    if not reopen_period(year, month):
+        raise click.ClickException(f"{period_label(year, month)} is not closed")
+    click.echo(f"{period_label(year, month)} reopened")
+
+import_cli = AppGroup("ledger-import", help="Import ledger rows from CSV/XLSX files.")
+
+@import_cli.command("run")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--table", required=True, type=click.Choice(list(IMPORT_TABLES)))
+@click.option("--created-by", required=True, type=int)
+@click.option("--mapping", help='JSON object of heading -> field, e.g. {"OR No.": "or_number"}.')
+def import_run_command(path, table, created_by, mapping):
+    """Import a file in the foreground (for large historic ledgers)."""
+    file_format = path.rsplit(".", 1)[-1].lower()
+    if file_format not in FILE_FORMATS:
+        raise click.BadParameter("file must be .csv or .xlsx", param_hint="path")
+    job_id = insert_import_job_db({
+        "table_name": table,
+        "file_name": os.path.basename(path),
+        "file_path": os.path.abspath(path),
+        "file_format": file_format,
+        "column_mapping": mapping,
+        "created_by": created_by,
+    })
+    _report_import(run_import(job_id))
+
+@import_cli.command("resume")
+@click.argument("job_id", type=int)
+def import_resume_command(job_id):
+    """Resume a failed import after its last committed row."""
+    _report_import(run_import(job_id))
+
+def _report_import(job):
+    click.echo(
+        f"job {job['id']}: {job['status']} last_row={job['last_row']} "
+        f"inserted={job['inserted_rows']} failed={job['failed_rows']}"
+    )
+    if job["failed_rows"]:
+        click.echo(f"  error report: {job['error_report_path']}")
+    if job["status"] != "completed":
+        click.echo(f"  {job['message']}")
+        raise SystemExit(1)
+
+def register_commands(app):
+    app.cli.add_command(ledger_cli)
+    app.cli.add_command(db_cli)
+    app.cli.add_command(import_cli)
+    app.cli.add_command(sre_cli)
@@ -11,3 +11,86 @@ class Config:
     DB_USER = os.getenv("DB_USER")
     DB_PASSWORD = os.getenv("DB_PASSWORD")
     DB_NAME = os.getenv("DB_NAME")
+
+    # connection pool
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 3600))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+    # rows pulled per round trip by unbuffered (streaming) cursors
+    DB_FETCH_BATCH_SIZE = int(os.getenv("DB_FETCH_BATCH_SIZE", 500))
+
+    # keyset pagination on list routes
+    PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", 50))
+    PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", 500))
+
+    # serve totals from ledger_summary and /api/monthly-data from
+    # ledger_monthly. Writes maintain both either way; run
+    # `flask ledger-summary rebuild` once to seed them before turning this on
+    LEDGER_SUMMARY_ENABLED = os.getenv("LEDGER_SUMMARY_ENABLED", "false").lower() == "true"
+
+    # in-process fetch_all result cache, invalidated by writes to its tables
+    QUERY_CACHE_ENABLED = os.getenv("QUERY_CACHE_ENABLED", "false").lower() == "true"
+    QUERY_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", 1024))
+    QUERY_CACHE_MAX_BYTES = int(os.getenv("QUERY_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+    QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", 60))
+
+    # category breakdowns: groups returned before the rest become "Other"
+    CATEGORY_TOP_N = int(os.getenv("CATEGORY_TOP_N", 5))
+    CATEGORY_TOP_N_MAX = int(os.getenv("CATEGORY_TOP_N_MAX", 50))
+
+    # threads used to compute the dashboard sections concurrently
+    DASHBOARD_WORKERS = int(os.getenv("DASHBOARD_WORKERS", 4))
+
+    # most transaction ids one generate_id call may reserve
+    SEQUENCE_MAX_BLOCK = int(os.getenv("SEQUENCE_MAX_BLOCK", 1000))
+
+    # bulk inserts: rows per multi-row INSERT, rows per request
+    BULK_INSERT_CHUNK_SIZE = int(os.getenv("BULK_INSERT_CHUNK_SIZE", 500))
+    BULK_INSERT_MAX_ROWS = int(os.getenv("BULK_INSERT_MAX_ROWS", 5000))
+    # checker review queue: claim lease length, most rows per claim
+    REVIEW_CLAIM_SECONDS = int(os.getenv("REVIEW_CLAIM_SECONDS", 900))
+    REVIEW_QUEUE_MAX_CLAIM = int(os.getenv("REVIEW_QUEUE_MAX_CLAIM", 50))
+
+    # bulk approve / flag: rows one request may touch
+    BULK_REVIEW_MAX_ROWS = int(os.getenv("BULK_REVIEW_MAX_ROWS", 5000))
+
+    # CSV/XLSX imports: uploads and error reports, rows per committed batch,
+    # and how long a running job may go without a checkpoint before it is
+    # taken to be dead (crashed process) and may be claimed again
+    IMPORT_DIR = os.getenv("IMPORT_DIR", os.path.join(os.path.dirname(os.path.dirname(__file__)), "imports"))
+    IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 1000))
+    IMPORT_WORKERS = int(os.getenv("IMPORT_WORKERS", 1))
+    IMPORT_STALE_MINUTES = int(os.getenv("IMPORT_STALE_MINUTES", 15))
+
+    # delta sync (/api/changes): rows per table per batch, how long a change
+    # must be committed before a cursor moves past it, tombstone retention
+    CHANGES_PAGE_SIZE = int(os.getenv("CHANGES_PAGE_SIZE", 500))
+    CHANGES_PAGE_SIZE_MAX = int(os.getenv("CHANGES_PAGE_SIZE_MAX", 5000))
+    CHANGES_SETTLE_SECONDS = float(os.getenv("CHANGES_SETTLE_SECONDS", 1))
+    CHANGES_TOMBSTONE_DAYS = int(os.getenv("CHANGES_TOMBSTONE_DAYS", 30))
+
+    # server-sent events (/api/events): heartbeat interval, client reconnect
+    # delay, events buffered per client, events kept for Last-Event-ID replay
+    EVENTS_HEARTBEAT_SECONDS = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", 15))
+    EVENTS_RETRY_MS = int(os.getenv("EVENTS_RETRY_MS", 3000))
+    EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", 1000))
+    EVENTS_BACKLOG = int(os.getenv("EVENTS_BACKLOG", 1000))
+
+    # ETag / 304 handling on read routes; table_versions stamps are cached
+    # this many seconds per worker (bounds staleness across workers)
+    CONDITIONAL_GET_ENABLED = os.getenv("CONDITIONAL_GET_ENABLED", "true").lower() == "true"
+    TABLE_VERSION_TTL = float(os.getenv("TABLE_VERSION_TTL", 2))
+
+    # encode JSON responses with orjson when it is installed
+    JSON_FAST_ENCODER = os.getenv("JSON_FAST_ENCODER", "true").lower() == "true"
+
+    # `flask db explain` ignores plan steps estimated below this many rows
+    EXPLAIN_MIN_ROWS = int(os.getenv("EXPLAIN_MIN_ROWS", 1000))
+
+    # queries at or above this many ms go to the slow-query log (0 disables)
+    SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 500))
+    # slow-query log file; unset logs to stderr
+    SLOW_QUERY_LOG_FILE = os.getenv("SLOW_QUERY_LOG_FILE")
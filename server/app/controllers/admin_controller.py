@@ -1,5 +1,6 @@
 from flask import jsonify, request
 from app.utils.hash_password import hash_password
+from app.database.unit_of_work import transaction
 from app.model.admin.get_all_users_db import get_all_users
 from app.model.admin.insert_user_db import insert_user
 from app.model.admin.put_user_db import update_user, update_user_password, delete_user
@@ -7,18 +8,13 @@ from app.validator.validate_user import (
     validate_user,
     validate_put_user                      
 )
-from app.model.encoder.budget_entries_db import (
-    get_budget_entries_db,
+from app.model.admin.get_all_docs_db import (
+    get_docs_page_db,
+    count_docs_db,
+    DOC_TYPES,
+    DOC_STATUSES,
 )
-from app.model.encoder.collections_db import (
-    get_collection_db,
-)
-from app.model.encoder.disbursements_db import (
-    get_disbursement_db,
-)
-from app.model.encoder.dfur_db import(
-    get_all_dfur_db,
-) 
+from app.utils.pagination import get_page_args, paginated_response
 
 def get_all_users_controller():
     try:
@@ -73,13 +69,17 @@ def edit_user_controller():
             return jsonify({"error": message}), 400
 
         
-        success = update_user(user_id, user)
-        
          # update password ONLY if provided
+        hashed = None
         if "password" in user and user["password"]:
             hashed = hash_password(user["password"])
-            update_user_password(user_id, hashed)
-        
+
+        # profile and password change commit (or roll back) together
+        with transaction():
+            success = update_user(user_id, user)
+            if hashed and not update_user_password(user_id, hashed):
+                return jsonify({"error": "Failed to update password"}), 500
+
         if success:
             return jsonify({"message": "User edited successfully"}), 200
         else:
@@ -105,25 +105,40 @@ def delete_user_controller():
   
 
 #handle docs ========================
-def handle_docs():
-    try:
-        ...
-        docs = []
-        
-        docs.extend(get_budget_entries_db(2026))
-        docs.extend(get_disbursement_db())
-        docs.extend(get_collection_db())
-        docs.extend(get_all_dfur_db())
-        docs.sort(key=lambda x: x["created_at"], reverse=True)
-        return docs
-    except Exception as e:
-        print(e)
-        return None
+def get_docs_filters():
+    # ?type=collection,disbursement,budget_entry,dfur  ?year=2026  ?status=pending|approved|rejected|flagged
+    args = request.args
+    doc_types = [t.strip() for t in args.get("type", "").split(",") if t.strip()]
+    for doc_type in doc_types:
+        if doc_type not in DOC_TYPES:
+            raise ValueError(f"type must be one of: {', '.join(DOC_TYPES)}")
+
+    year = args.get("year")
+    if year:
+        if not year.isdigit():
+            raise ValueError("year must be a number")
+        year = int(year)
+    else:
+        year = None
+
+    status = args.get("status") or None
+    if status and status not in DOC_STATUSES:
+        raise ValueError(f"status must be one of: {', '.join(DOC_STATUSES)}")
+
+    return {"doc_types": doc_types, "year": year, "status": status}
 
 def get_all_docs_controller():
     try:
         ...
-        docs = handle_docs()
-        return jsonify(docs), 200
+        # the merged feed is always paged; newest documents first
+        try:
+            page = get_page_args(always=True)
+            filters = get_docs_filters()
+            result = get_docs_page_db(page, **filters)
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+
+        total = count_docs_db(**filters) if page["include_total"] else None
+        return paginated_response(result["rows"], result, total)
     except Exception as e:
-        return jsonify({"error": str(e)}), 404
\ No newline at end of file
+        return jsonify({"error": str(e)}), 404
@@ -1,4 +1,15 @@
 from flask import request, jsonify
+from app.config import Config
+from app.model.review_db import (
+    REVIEW_TABLES,
+    REVIEW_STATUSES,
+    select_review_ids_db,
+    bulk_review_status_db,
+    summarize_outcomes,
+)
+from app.validator.validate_review_selection import validate_review_selection
+from app.validator.validate_row_version import validate_row_version
+from app.utils.version_conflict import version_conflict_response
 from app.model.approver.insert_approval_db import (
     put_collection_approval_db,
     put_disbursement_approval_db,
@@ -12,29 +23,68 @@ def approver_controller():
         data = request.get_json()
         approval_type = data.get('approval_type')
         review_status = data.get('review_status')
-        
+        is_valid, message = validate_row_version(data)
+        if not is_valid:
+            return jsonify({'message': message}), 400
+        row_version = data['row_version']
+
         if approval_type == 'collection':
             collection_id = data.get('collection_id')
-            approval = put_collection_approval_db(collection_id, review_status)
+            approval = put_collection_approval_db(collection_id, review_status, row_version)
             if approval:
                 return jsonify({'message': 'Collection approval updated successfully'}), 200
             else:
-                return jsonify({'message': 'Failed to update collection approval'}), 400
+                return (
+                    version_conflict_response('collections', collection_id, row_version)
+                    or (jsonify({'message': 'Failed to update collection approval'}), 400)
+                )
         elif approval_type == 'disbursement':
             disbursement_id = data.get('disbursement_id')
-            approval = put_disbursement_approval_db(disbursement_id, review_status)
+            approval = put_disbursement_approval_db(disbursement_id, review_status, row_version)
             if approval:
                 return jsonify({'message': 'Disbursement approval updated successfully'}), 200
             else:
-                return jsonify({'message': 'Failed to update disbursement approval'}), 400
+                return (
+                    version_conflict_response('disbursements', disbursement_id, row_version)
+                    or (jsonify({'message': 'Failed to update disbursement approval'}), 400)
+                )
         elif approval_type == 'dfur':
             dfur_id = data.get('dfur_id')
-            approval = put_dfur_approval_db(dfur_id, review_status)
+            approval = put_dfur_approval_db(dfur_id, review_status, row_version)
             if approval:
                 return jsonify({'message': 'DFUR approval updated successfully'}), 200
             else:
-                return jsonify({'message': 'Failed to update DFUR approval'}), 400
+                return (
+                    version_conflict_response('dfur_projects', dfur_id, row_version)
+                    or (jsonify({'message': 'Failed to update DFUR approval'}), 400)
+                )
         else:
             return jsonify({'error': 'Invalid approval type'}), 400
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'error': str(e)}), 500
+
+def bulk_approver_controller():
+    try:
+        data = request.get_json(silent=True)
+        is_valid, message = validate_review_selection(data, Config.BULK_REVIEW_MAX_ROWS)
+        if not is_valid:
+            return jsonify({'message': message}), 400
+
+        table = REVIEW_TABLES.get(data.get('approval_type'))
+        if table is None:
+            return jsonify({'message': 'Invalid approval type'}), 400
+        review_status = data.get('review_status')
+        # the status the approver saw; rows that moved on are skipped
+        expected_status = data.get('expected_status', 'pending')
+        if review_status not in REVIEW_STATUSES or expected_status not in REVIEW_STATUSES:
+            return jsonify({'message': f"review_status must be one of: {', '.join(REVIEW_STATUSES)}"}), 400
+
+        try:
+            ids = select_review_ids_db(table, data, expected_status)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+        if not ids:
+            return jsonify(summarize_outcomes([])), 200
+        return jsonify(summarize_outcomes(bulk_review_status_db(table, ids, review_status, expected_status))), 200
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
@@ -1,10 +1,38 @@
 from flask import request, jsonify
+from app.config import Config
+from app.model.review_db import (
+    REVIEW_TABLES,
+    REVIEW_STATUSES,
+    select_review_ids_db,
+    bulk_flag_db,
+    summarize_outcomes,
+)
+from app.validator.validate_review_selection import validate_review_selection
+from app.validator.validate_row_version import validate_row_version
+from app.utils.version_conflict import version_conflict_response
+from app.model.checker.review_queue_db import (
+    claim_review_items_db,
+    get_claimed_items_db,
+    update_claims_db,
+    claim_holder_db,
+)
 from app.model.checker.insert_comment_db import (
     insert_collection_comment_db,
     insert_disbursement_comment_db,
     insert_dfur_comment_db,
 )
 
+def flag_failed_response(table, row_id, reviewed_by, row_version):
+    # a claimed or since-changed row is not an error on our side: tell the
+    # checker who has it, or what it looks like now
+    holder = claim_holder_db(table, row_id)
+    if holder is not None and str(holder) != str(reviewed_by):
+        return jsonify({'message': 'Item is claimed by another checker', 'claimed_by': holder}), 409
+    return (
+        version_conflict_response(table, row_id, row_version)
+        or (jsonify({'message': 'Failed to insert comment'}), 500)
+    )
+
 def insert_flag_comment_controller():
     ...
     try:
@@ -13,28 +41,126 @@ def insert_flag_comment_controller():
         reviewed_by = data['reviewed_by']
         comment = data['comment']
         flag_type = data['flag_type']
-        
+        is_valid, message = validate_row_version(data)
+        if not is_valid:
+            return jsonify({'message': message}), 400
+        row_version = data['row_version']
+
         if flag_type == 'collection':
             collection_id = data['collection_id']
-            if insert_collection_comment_db(collection_id, reviewed_by, comment):
+            if insert_collection_comment_db(collection_id, reviewed_by, comment, row_version):
                 return jsonify({'message': 'Comment inserted successfully'}), 200
             else:
-                return jsonify({'message': 'Failed to insert comment'}), 500
+                return flag_failed_response('collections', collection_id, reviewed_by, row_version)
         elif flag_type == 'disbursement':
             disbursement_id = data['disbursement_id']
-            if insert_disbursement_comment_db(disbursement_id, reviewed_by, comment):
+            if insert_disbursement_comment_db(disbursement_id, reviewed_by, comment, row_version):
                 return jsonify({'message': 'Comment inserted successfully'}), 200
             else:
-                return jsonify({'message': 'Failed to insert comment'}), 500
+                return flag_failed_response('disbursements', disbursement_id, reviewed_by, row_version)
         elif flag_type == 'dfur':
             dfur_id = data['dfur_id']
-            if insert_dfur_comment_db(dfur_id, reviewed_by, comment):
+            if insert_dfur_comment_db(dfur_id, reviewed_by, comment, row_version):
                 return jsonify({'message': 'Comment inserted successfully'}), 200
             else:
-                return jsonify({'message': 'Failed to insert comment'}), 500
+                return flag_failed_response('dfur_projects', dfur_id, reviewed_by, row_version)
         else:
             return jsonify({'message': 'Invalid flag type'}), 400
     
     except Exception as e:
         return jsonify({'message': str(e)}), 500
     
+
+def bulk_flag_comment_controller():
+    try:
+        data = request.get_json(silent=True)
+        is_valid, message = validate_review_selection(data, Config.BULK_REVIEW_MAX_ROWS)
+        if not is_valid:
+            return jsonify({'message': message}), 400
+
+        table = REVIEW_TABLES.get(data.get('flag_type'))
+        if table is None:
+            return jsonify({'message': 'Invalid flag type'}), 400
+        reviewed_by = data.get('reviewed_by')
+        comment = data.get('comment')
+        if not reviewed_by or not comment or not str(comment).strip():
+            return jsonify({'message': 'reviewed_by and comment are required'}), 400
+        if isinstance(reviewed_by, bool) or not str(reviewed_by).isdigit():
+            return jsonify({'message': 'reviewed_by must be a user id'}), 400
+        expected_status = data.get('expected_status', 'pending')
+        if expected_status not in REVIEW_STATUSES:
+            return jsonify({'message': f"expected_status must be one of: {', '.join(REVIEW_STATUSES)}"}), 400
+
+        try:
+            # a filter only picks rows that are not flagged yet
+            ids = select_review_ids_db(table, data, expected_status, flagged=False)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+        if not ids:
+            return jsonify(summarize_outcomes([])), 200
+        return jsonify(summarize_outcomes(bulk_flag_db(table, ids, reviewed_by, comment, expected_status))), 200
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+# REVIEW QUEUE ==========================================
+def _checker_id(data):
+    checker_id = (data or {}).get('checker_id')
+    if isinstance(checker_id, bool) or not str(checker_id or "").isdigit():
+        raise ValueError('checker_id must be a user id')
+    return int(checker_id)
+
+def claim_review_queue_controller():
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            checker_id = _checker_id(data)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
+        limit = data.get('limit', 10)
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+            return jsonify({'message': 'limit must be a positive integer'}), 400
+        limit = min(limit, Config.REVIEW_QUEUE_MAX_CLAIM)
+        item_types = data.get('types') or list(REVIEW_TABLES)
+        unknown = [t for t in item_types if t not in REVIEW_TABLES]
+        if unknown:
+            return jsonify({'message': f"Unknown types: {', '.join(map(str, unknown))}"}), 400
+
+        items = claim_review_items_db(checker_id, limit, item_types)
+        return jsonify({'items': items, 'lease_seconds': Config.REVIEW_CLAIM_SECONDS}), 200
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+def get_review_claims_controller():
+    try:
+        try:
+            checker_id = _checker_id(request.args)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+        return jsonify({'items': get_claimed_items_db(checker_id)}), 200
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
+
+def update_review_claims_controller(action):
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            checker_id = _checker_id(data)
+        except ValueError as e:
+            return jsonify({'message': str(e)}), 400
+
+        items = data.get('items')
+        if not isinstance(items, list) or not items:
+            return jsonify({'message': 'items must be a non-empty list of {"type", "id"}'}), 400
+        for item in items:
+            if not isinstance(item, dict) or item.get('type') not in REVIEW_TABLES \
+                    or isinstance(item.get('id'), bool) or not isinstance(item.get('id'), int):
+                return jsonify({'message': 'items must be a non-empty list of {"type", "id"}'}), 400
+
+        changed = update_claims_db(checker_id, items, action)
+        changed_keys = {(item['type'], item['id']) for item in changed}
+        # items not held (expired, or someone else's) are reported back
+        not_held = [item for item in items if (item['type'], item['id']) not in changed_keys]
+        return jsonify({action: changed, 'not_held': not_held}), 200
+    except Exception as e:
+        return jsonify({'message': str(e)}), 500
@@ -1,5 +1,8 @@
-from flask import jsonify
-from app.database.connection import get_db_connection
+from flask import jsonify, Response
+from app.database.connection import get_db_connection, get_pool_stats
+from app.utils.query_cache import get_query_cache
+from app.utils.metrics import render_metrics
+from app.services.events import get_event_bus
 
 def test_db_connection():
     try:
@@ -21,3 +24,48 @@ def test_db_connection():
             "status": "error",
             "message": str(e)
         }), 500
+
+def get_db_pool_stats_controller():
+    try:
+        return jsonify(get_pool_stats()), 200
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+def get_db_cache_stats_controller():
+    try:
+        cache = get_query_cache()
+        if cache is None:
+            return jsonify({"enabled": False}), 200
+        return jsonify({"enabled": True, **cache.stats()}), 200
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
+
+def get_metrics_controller():
+    # Prometheus text exposition format
+    try:
+        pool = get_pool_stats()
+        gauges = {
+            "db_pool_open_connections": ("Connections currently open by the pool.", pool["open"]),
+            "db_pool_in_use_connections": ("Connections checked out right now.", pool["in_use"]),
+            "db_pool_waits_total": ("Checkouts that had to wait for a connection.", pool["waits"]),
+            "db_pool_timeouts_total": ("Checkouts that gave up waiting.", pool["timeouts"]),
+        }
+        cache = get_query_cache()
+        if cache is not None:
+            cache_stats = cache.stats()
+            gauges["db_query_cache_hits_total"] = ("fetch_all results served from the cache.", cache_stats["hits"])
+            gauges["db_query_cache_misses_total"] = ("fetch_all lookups that went to MySQL.", cache_stats["misses"])
+            gauges["db_query_cache_bytes"] = ("Approximate size of cached results.", cache_stats["bytes"])
+        gauges["events_subscribers"] = ("Open /api/events streams in this process.", get_event_bus().stats()["subscribers"])
+        return Response(render_metrics(gauges), mimetype="text/plain; version=0.0.4")
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "message": str(e)
+        }), 500
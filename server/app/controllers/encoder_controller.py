@@ -1,20 +1,36 @@
 from flask import request, jsonify
+from app.utils.stream_response import get_stream_mode, stream_rows
+from app.utils.pagination import get_page_args, paginated_response
+from app.utils.rowset import get_row_shape, shape_rows
+from app.utils.version_conflict import version_conflict_response
+from app.validator.validate_row_version import validate_row_version
 from app.model.encoder.budget_entries_db import (
     insert_budget_entries_db,
+    insert_budget_entries_bulk_db,
     get_budget_entries_db,
+    get_budget_entries_page_db,
+    count_budget_entries_db,
     put_budget_entries_db,
     delete_budget_entries_db,
 )
 from app.model.encoder.collections_db import (
     insert_collection_db,
+    insert_collections_bulk_db,
     get_collection_db,
+    iter_collection_db,
+    get_collection_page_db,
+    count_collection_db,
     put_collection_db,
     delete_collection_db,
     get_data_base_date_collection_db
 )
 from app.model.encoder.disbursements_db import (
     insert_disbursement_db,
+    insert_disbursements_bulk_db,
     get_disbursement_db,
+    iter_disbursement_db,
+    get_disbursement_page_db,
+    count_disbursement_db,
     put_disbursement_db,
     delete_disbursement_db,
     get_data_base_date_disbursement_db
@@ -22,10 +38,20 @@ from app.model.encoder.disbursements_db import (
 from app.model.encoder.dfur_db import(
     insert_dfur_db,
     get_all_dfur_db,
+    iter_dfur_db,
+    get_dfur_page_db,
+    count_dfur_db,
     put_dfur_db,
     delete_dfur_db
 ) 
-from datetime import datetime
+from app.model.encoder.bulk_db import existing_transaction_ids_db
+from app.validator.validate_ledger_entry import (
+    validate_collection,
+    validate_disbursement,
+    validate_budget_entry,
+)
+from app.config import Config
+from app.services.transaction_ids import next_transaction_ids
 import random
 # CRUD ==================================================
 # BUDGET ENTRIES
@@ -58,10 +84,20 @@ def get_budget_entries_controller():
         if not year:
             return jsonify({"message": "No year provided"}), 400
 
+        try:
+            page = get_page_args()
+            shape = get_row_shape()
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        if page:
+            result = get_budget_entries_page_db(year, page)
+            total = count_budget_entries_db(year) if page["include_total"] else None
+            return paginated_response(shape_rows(result["rows"], shape), result, total)
+
         entries = get_budget_entries_db(year)
 
         if entries:
-            return jsonify(entries), 200
+            return jsonify(shape_rows(entries, shape)), 200
         else:
             return jsonify({"message": "No budget entries found for the given year"}), 404
     except Exception as e:
@@ -75,13 +111,19 @@ def update_budget_entries_controller():
 
         if not entry:
             return jsonify({"message": "No entries provided"}), 400
+        is_valid, message = validate_row_version(entry)
+        if not is_valid:
+            return jsonify({"message": message}), 400
 
         success = put_budget_entries_db(entry)
 
         if success:
             return jsonify({"message": "Budget entry updated successfully"}), 200
         else:
-            return jsonify({"message": "There is no budget entry try to check the id"}), 500
+            return (
+                version_conflict_response("budget_entries", entry["id"], entry["row_version"])
+                or (jsonify({"message": "There is no budget entry try to check the id"}), 500)
+            )
     except Exception as e:
         return jsonify({"message": str(e)}), 500
     
@@ -126,9 +168,23 @@ def get_disbursement_controller():
     ...
     try:
         ...
+        stream = get_stream_mode()
+        if stream:
+            return stream_rows(iter_disbursement_db(), stream)
+
+        try:
+            page = get_page_args()
+            shape = get_row_shape()
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        if page:
+            result = get_disbursement_page_db(page)
+            total = count_disbursement_db() if page["include_total"] else None
+            return paginated_response(shape_rows(result["rows"], shape), result, total)
+
         disbursement = get_disbursement_db()
         if disbursement:
-            return jsonify(disbursement), 200
+            return jsonify(shape_rows(disbursement, shape)), 200
         else:
             return jsonify({"message": "Failed to get disbursement"}), 500
     except Exception as e:
@@ -141,13 +197,19 @@ def put_disbursement_controller():
         entry = request.get_json()
         if not entry:
             return jsonify({"message": "No entries provided"}), 400
+        is_valid, message = validate_row_version(entry)
+        if not is_valid:
+            return jsonify({"message": message}), 400
 
         success = put_disbursement_db(entry)
 
         if success:
             return jsonify({"message": "disbursement entries updated successfully"}), 200
         else:
-            return jsonify({"message": "There is no disbursement to update"}), 500
+            return (
+                version_conflict_response("disbursements", entry["id"], entry["row_version"])
+                or (jsonify({"message": "There is no disbursement to update"}), 500)
+            )
     except Exception as e:
         return jsonify({"message": str(e)}), 500
 
@@ -189,9 +251,23 @@ def get_collection_controller():
     ...
     try:
         ...
+        stream = get_stream_mode()
+        if stream:
+            return stream_rows(iter_collection_db(), stream)
+
+        try:
+            page = get_page_args()
+            shape = get_row_shape()
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        if page:
+            result = get_collection_page_db(page)
+            total = count_collection_db() if page["include_total"] else None
+            return paginated_response(shape_rows(result["rows"], shape), result, total)
+
         collection = get_collection_db()
         if collection:
-            return jsonify(collection), 200
+            return jsonify(shape_rows(collection, shape)), 200
         else:
             return jsonify({"message": "Failed to get collection"}), 500
     except Exception as e:
@@ -204,13 +280,19 @@ def put_collection_controller():
         entry = request.get_json()
         if not entry:
             return jsonify({"message": "No entries provided"}), 400
+        is_valid, message = validate_row_version(entry)
+        if not is_valid:
+            return jsonify({"message": message}), 400
 
         success = put_collection_db(entry)
 
         if success:
             return jsonify({"message": "Collection entries updated successfully"}), 200
         else:
-            return jsonify({"message": "There is no collection to update"}), 500
+            return (
+                version_conflict_response("collections", entry["id"], entry["row_version"])
+                or (jsonify({"message": "There is no collection to update"}), 500)
+            )
     except Exception as e:
         return jsonify({"message": str(e)}), 500
 
@@ -275,6 +357,9 @@ def insert_dfur_controller():
 def put_dfur_controller():
     try:
         data = request.get_json()
+        is_valid, message = validate_row_version(data)
+        if not is_valid:
+            return jsonify({"message": message}), 400
         result = put_dfur_db(data)
         if data['status'] == 'Planned':
             data['status'] = 'planned'
@@ -290,15 +375,37 @@ def put_dfur_controller():
         if result:
             return jsonify({"message": "Successfully updated data"}), 200
         else:
-            return jsonify({"message": "Failed to update data"}), 500
+            return (
+                version_conflict_response("dfur_projects", data["id"], data["row_version"])
+                or (jsonify({"message": "Failed to update data"}), 500)
+            )
     except Exception as e:
         return jsonify({"message": str(e)}), 500
 
 def get_dfur_controller():
     try:
+        stream = get_stream_mode()
+        if stream:
+            return stream_rows(
+                iter_dfur_db(),
+                stream,
+                envelope={"meta": {"message": "Successfully retrieved data"}, "key": "data"}
+            )
+
+        try:
+            page = get_page_args()
+            shape = get_row_shape()
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        if page:
+            result = get_dfur_page_db(page)
+            total = count_dfur_db() if page["include_total"] else None
+            body = {"message": "Successfully retrieved data", "data": shape_rows(result["rows"], shape)}
+            return paginated_response(body, result, total)
+
         result = get_all_dfur_db()
         if result:
-            return jsonify({"message": "Successfully retrieved data", "data": result}), 200
+            return jsonify({"message": "Successfully retrieved data", "data": shape_rows(result, shape)}), 200
         else:
             return jsonify({"message": "Invalid data name"}), 400
     except Exception as e:
@@ -317,20 +424,83 @@ def delete_dfur_controller():
         return jsonify({"message": str(e)}), 500
     
 
-def generate_transaction_id_controller(prefix, data_type):
-    counter = 1
-    if data_type == 'collection':
-        counter = len(get_collection_db())
-    elif data_type == 'budget_entries':
-        counter = len(get_budget_entries_db(datetime.now().year))
-    elif data_type == 'disbursement':
-        counter = len(get_disbursement_db())
-    elif data_type == 'dfur':
-        counter = len(get_all_dfur_db())
-    counter += 1
-    
-    year = datetime.now().year
-    return f"{prefix}-{year}-{counter:03d}"
+def generate_transaction_id_controller(prefix):
+    try:
+        # ?count=N reserves a block of N ids for bulk encoding
+        count = request.args.get("count", 1, type=int)
+        if count < 1 or count > Config.SEQUENCE_MAX_BLOCK:
+            return jsonify({"message": f"count must be between 1 and {Config.SEQUENCE_MAX_BLOCK}"}), 400
+
+        transaction_ids = next_transaction_ids(prefix, count)
+
+        data = {}
+        data['transaction_id'] = transaction_ids[0]
+        if count > 1:
+            data['transaction_ids'] = transaction_ids
+        data['div_number'] = generate_11_digit_number_controller()
+        return jsonify(data), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
 
 def generate_11_digit_number_controller():
-    return random.randint(10_000_000_000, 99_999_999_999)
\ No newline at end of file
+    return random.randint(10_000_000_000, 99_999_999_999)
+
+# BULK INSERT ==================================================
+BULK_INSERTS = {
+    "collections": (validate_collection, "COLL", insert_collections_bulk_db),
+    "disbursements": (validate_disbursement, "DISB", insert_disbursements_bulk_db),
+    "budget_entries": (validate_budget_entry, "BUDG", insert_budget_entries_bulk_db),
+}
+
+def bulk_insert_controller(table):
+    # body: JSON array of entries. Every row is validated first; if any row
+    # fails nothing is inserted and each failing row is reported by index.
+    try:
+        validate, prefix, insert_bulk = BULK_INSERTS[table]
+        entries = request.get_json()
+        if not isinstance(entries, list) or not entries:
+            return jsonify({"message": "Expected a non-empty array of entries"}), 400
+        if len(entries) > Config.BULK_INSERT_MAX_ROWS:
+            return jsonify({"message": f"At most {Config.BULK_INSERT_MAX_ROWS} entries per request"}), 400
+
+        errors = {}
+        seen = {}
+        for index, entry in enumerate(entries):
+            is_valid, message = validate(entry)
+            if not is_valid:
+                errors[index] = message
+                continue
+            transaction_id = entry.get("transaction_id")
+            if transaction_id is not None:
+                if transaction_id in seen:
+                    errors[index] = f"Duplicate transaction_id in request (row {seen[transaction_id]})"
+                seen.setdefault(transaction_id, index)
+
+        taken = existing_transaction_ids_db(table, list(seen))
+        for transaction_id in taken:
+            errors.setdefault(seen[transaction_id], "transaction_id already exists")
+
+        if errors:
+            results = [
+                {"index": index, "error": errors[index]} if index in errors else {"index": index, "ok": True}
+                for index in range(len(entries))
+            ]
+            return jsonify({"message": f"{len(errors)} invalid entries, nothing inserted", "results": results}), 400
+
+        # rows without a transaction_id get one block of sequence numbers
+        missing = [entry for entry in entries if entry.get("transaction_id") is None]
+        if missing:
+            for entry, transaction_id in zip(missing, next_transaction_ids(prefix, len(missing))):
+                entry["transaction_id"] = transaction_id
+
+        ids = insert_bulk(entries)
+        results = [
+            {"index": index, "id": ids.get(entry["transaction_id"]), "transaction_id": entry["transaction_id"]}
+            for index, entry in enumerate(entries)
+        ]
+        return jsonify({"message": f"{len(entries)} entries inserted", "results": results}), 200
+    except Exception as e:
+        if getattr(e, "errno", None) == 1062:
+            # a transaction_id was taken between the check and the insert
+            return jsonify({"message": str(e)}), 409
+        return jsonify({"message": str(e)}), 500
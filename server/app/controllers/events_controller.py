@@ -0,0 +1,41 @@
+from flask import request, jsonify, Response
+from app.services.events import (
+    EVENT_TABLES,
+    ROLE_EVENTS,
+    Subscription,
+    get_event_bus,
+    stream_events,
+)
+
+def _list_arg(name):
+    return [v.strip() for v in request.args.get(name, "").split(",") if v.strip()]
+
+def events_controller():
+    # ?role=checker (required) &tables=collections,disbursements &types=flagged
+    try:
+        role = request.args.get("role")
+        if role not in ROLE_EVENTS:
+            return jsonify({"message": f"role must be one of: {', '.join(ROLE_EVENTS)}"}), 400
+
+        tables = _list_arg("tables")
+        unknown = [t for t in tables if t not in EVENT_TABLES]
+        if unknown:
+            return jsonify({"message": f"Unknown tables: {', '.join(unknown)}"}), 400
+
+        # ?types= narrows the role's events, never widens them
+        event_types = ROLE_EVENTS[role]
+        types = _list_arg("types")
+        if types:
+            event_types = event_types & set(types)
+
+        # EventSource resends the last id it saw when it reconnects
+        last_event_id = request.headers.get("Last-Event-ID", type=int)
+
+        subscription = get_event_bus().subscribe(Subscription(event_types, tables), last_event_id)
+        response = Response(stream_events(subscription), mimetype="text/event-stream")
+        response.headers["Cache-Control"] = "no-cache"
+        # nginx would otherwise buffer the stream
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
@@ -0,0 +1,42 @@
+from datetime import date
+from flask import request, jsonify
+from app.model.encoder.export_db import EXPORT_TABLES, iter_export_db
+from app.utils.stream_response import EXPORT_FORMATS, stream_export, wants_gzip
+
+def _date_arg(name):
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+
+def export_controller(table):
+    # ?format=csv|ndjson|xlsx &start_date= &end_date= &columns=a,b,c &gzip=1
+    try:
+        if table not in EXPORT_TABLES:
+            return jsonify({"message": f"table must be one of: {', '.join(EXPORT_TABLES)}"}), 400
+
+        file_format = request.args.get("format", "csv").lower()
+        if file_format not in EXPORT_FORMATS:
+            return jsonify({"message": f"format must be one of: {', '.join(EXPORT_FORMATS)}"}), 400
+
+        allowed = EXPORT_TABLES[table]["columns"]
+        columns = [c.strip() for c in request.args.get("columns", "").split(",") if c.strip()]
+        unknown = [c for c in columns if c not in allowed]
+        if unknown:
+            return jsonify({"message": f"Unknown columns: {', '.join(unknown)}", "columns": list(allowed)}), 400
+        columns = columns or list(allowed)
+
+        try:
+            start_date = _date_arg("start_date")
+            end_date = _date_arg("end_date")
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+
+        filename = "_".join(part for part in (table, start_date, end_date) if part) + f".{file_format}"
+        rows = iter_export_db(table, columns, start_date, end_date)
+        return stream_export(columns, rows, file_format, filename, gzip=wants_gzip())
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
@@ -1,13 +1,31 @@
+from datetime import datetime
 from flask import request, jsonify
 from app.services.total_calculation import result_total_data
+from app.services.dashboard_summary import dashboard_summary
+from app.services.monthly_calculation import MONTHLY_DIMENSIONS, monthly_rows, monthly_series
+from app.services.ledger_tables import LEDGER_TABLES
+from app.model.review_db import REVIEW_STATUSES
+from app.services.changes import collect_changes, CursorExpired
+from app.model.changes_db import CHANGE_TABLES
+from app.config import Config
+
+def get_total_filters():
+    # optional ?year=2026 or ?start_date=2026-01-01&end_date=2026-01-31
+    return {
+        "year": request.args.get("year", type=int),
+        "start_date": request.args.get("start_date"),
+        "end_date": request.args.get("end_date"),
+    }
 
 #CALCULATIONS===========================================+
 def get_total_data_budget_allocation_controller():
     try:
         ...
         data = {}
-        year = 2026
-        total_data = result_total_data("budget_entries", year)
+        filters = get_total_filters()
+        if filters["year"] is None:
+            filters["year"] = datetime.now().year
+        total_data = result_total_data("budget_entries", **filters)
         # return only the data needed
         data['total_data'] = total_data["total_data"]
         data['total_amount'] = total_data["total_amount"]
@@ -18,7 +36,7 @@ def get_total_data_budget_allocation_controller():
 def get_total_data_collection_controller():
     try:
         ...
-        total_data = result_total_data("collections")
+        total_data = result_total_data("collections", **get_total_filters())
         return jsonify(total_data), 200
     except Exception as e:
         return jsonify({"message": str(e)}), 500
@@ -26,7 +44,7 @@ def get_total_data_collection_controller():
 def get_total_data_disbursement_controller():
     ...
     try:
-        total_data = result_total_data("disbursements")
+        total_data = result_total_data("disbursements", **get_total_filters())
         return jsonify(total_data), 200
     except Exception as e:
         return jsonify({"message": str(e)}), 500
@@ -34,7 +52,63 @@ def get_total_data_disbursement_controller():
 def get_total_data_dfur_controller():
     try:
         ...
-        total_data = result_total_data("dfur_projects")
+        total_data = result_total_data("dfur_projects", **get_total_filters())
         return jsonify(total_data), 200
     except Exception as e:
-        return jsonify({"message": str(e)}), 500
\ No newline at end of file
+        return jsonify({"message": str(e)}), 500
+
+def get_dashboard_summary_controller():
+    try:
+        ...
+        # all four dashboard totals in one request, computed in parallel
+        year = request.args.get("year", type=int)
+        budget_year = year if year is not None else datetime.now().year
+        return jsonify(dashboard_summary(year, budget_year)), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
+
+def get_monthly_data_controller():
+    try:
+        args = request.args
+        year = args.get("year", datetime.now().year, type=int)
+        data_name = args.get("table")
+        dimension = args.get("dimension")
+        review_status = args.get("status")
+        if data_name is not None and data_name not in LEDGER_TABLES:
+            return jsonify({"message": f"table must be one of: {', '.join(LEDGER_TABLES)}"}), 400
+        if dimension is not None and dimension not in MONTHLY_DIMENSIONS:
+            return jsonify({"message": f"dimension must be one of: {', '.join(MONTHLY_DIMENSIONS)}"}), 400
+        if review_status is not None and review_status not in REVIEW_STATUSES:
+            return jsonify({"message": f"status must be one of: {', '.join(REVIEW_STATUSES)}"}), 400
+
+        if data_name is None:
+            if dimension is not None:
+                return jsonify({"message": "dimension needs a table"}), 400
+            return jsonify(monthly_series(year, review_status)), 200
+        rows = monthly_rows(data_name, year, dimension, review_status)
+        return jsonify({"year": year, "table": data_name, "dimension": dimension, "rows": rows}), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
+
+#SYNC===================================================
+def get_changes_controller():
+    try:
+        args = request.args
+        tables = [t for t in args.get("tables", "").split(",") if t] or list(CHANGE_TABLES)
+        unknown = [t for t in tables if t not in CHANGE_TABLES]
+        if unknown:
+            return jsonify({"message": f"Unknown tables: {', '.join(unknown)}"}), 400
+
+        limit = args.get("limit", Config.CHANGES_PAGE_SIZE, type=int)
+        if limit < 1:
+            return jsonify({"message": "limit must be at least 1"}), 400
+        limit = min(limit, Config.CHANGES_PAGE_SIZE_MAX)
+
+        try:
+            return jsonify(collect_changes(tables, args.get("since"), limit)), 200
+        except CursorExpired as e:
+            return jsonify({"message": str(e)}), 410
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
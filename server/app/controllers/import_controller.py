@@ -0,0 +1,90 @@
+import json
+import os
+import uuid
+from flask import request, jsonify, send_file
+from werkzeug.utils import secure_filename
+from app.config import Config
+from app.database.unit_of_work import current_unit_of_work
+from app.model.encoder.import_jobs_db import insert_import_job_db, get_import_job_db
+from app.services.importer import IMPORT_TABLES, FILE_FORMATS, start_import
+
+def import_file_controller(table):
+    # multipart form: file, created_by, optional mapping ({"Heading": "field"})
+    try:
+        if table not in IMPORT_TABLES:
+            return jsonify({"message": f"table must be one of: {', '.join(IMPORT_TABLES)}"}), 400
+
+        upload = request.files.get("file")
+        if upload is None or not upload.filename:
+            return jsonify({"message": "No file provided"}), 400
+        file_format = upload.filename.rsplit(".", 1)[-1].lower()
+        if file_format not in FILE_FORMATS:
+            return jsonify({"message": "File must be .csv or .xlsx"}), 400
+
+        created_by = request.form.get("created_by", "")
+        if not created_by.isdigit():
+            return jsonify({"message": "created_by is required"}), 400
+
+        mapping = request.form.get("mapping")
+        if mapping:
+            try:
+                if not isinstance(json.loads(mapping), dict):
+                    raise ValueError(mapping)
+            except ValueError:
+                return jsonify({"message": "mapping must be a JSON object"}), 400
+
+        # streamed to disk by werkzeug; the import reads it back row by row
+        os.makedirs(Config.IMPORT_DIR, exist_ok=True)
+        file_name = secure_filename(upload.filename) or f"upload.{file_format}"
+        file_path = os.path.join(Config.IMPORT_DIR, f"{uuid.uuid4().hex}_{file_name}")
+        upload.save(file_path)
+
+        job_id = insert_import_job_db({
+            "table_name": table,
+            "file_name": file_name,
+            "file_path": file_path,
+            "file_format": file_format,
+            "column_mapping": mapping,
+            "created_by": int(created_by),
+        })
+        # the job row must be committed before the worker thread reads it
+        current_unit_of_work().commit()
+        start_import(job_id)
+        return jsonify({"job_id": job_id, "status": "pending"}), 202
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
+
+def get_import_job_controller(job_id):
+    try:
+        job = get_import_job_db(job_id)
+        if not job:
+            return jsonify({"message": "Import job not found"}), 404
+        job.pop("file_path", None)
+        job.pop("error_report_path", None)
+        return jsonify(job), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
+
+def resume_import_job_controller(job_id):
+    try:
+        job = get_import_job_db(job_id)
+        if not job:
+            return jsonify({"message": "Import job not found"}), 404
+        if job["status"] != "failed" and not job["stale"]:
+            return jsonify({"message": f"Only failed or stale running jobs can be resumed (job is {job['status']})"}), 409
+        start_import(job_id)
+        return jsonify({"job_id": job_id, "status": "pending", "resume_after_row": job["last_row"]}), 202
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
+
+def get_import_errors_controller(job_id):
+    try:
+        job = get_import_job_db(job_id)
+        if not job:
+            return jsonify({"message": "Import job not found"}), 404
+        path = job["error_report_path"]
+        if not path or not os.path.exists(path):
+            return jsonify({"message": "No error report for this job yet"}), 404
+        return send_file(path, mimetype="text/csv", as_attachment=True, download_name=f"import_{job_id}_errors.csv")
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
@@ -0,0 +1,119 @@
+from datetime import date, datetime
+from flask import request, jsonify
+from app.config import Config
+from app.database.unit_of_work import current_unit_of_work
+from app.model.review_db import REVIEW_STATUSES
+from app.services.category_breakdown import BREAKDOWN_SOURCES, GROUP_BY, REVIEWED_SOURCES, category_breakdown
+from app.services.sre import (
+    COMPARISONS,
+    PeriodAlreadyClosed,
+    build_statement,
+    close_period,
+    financial_summary,
+)
+
+def _period_args(args):
+    # ?year=2026 [&month=3 | &quarter=1]; raises ValueError on bad input
+    year = args.get("year", datetime.now().year, type=int)
+    month = args.get("month", type=int)
+    quarter = args.get("quarter", type=int)
+    if month is not None and quarter is not None:
+        raise ValueError("Pass either month or quarter, not both")
+    if month is not None and not 1 <= month <= 12:
+        raise ValueError("month must be between 1 and 12")
+    if quarter is not None and not 1 <= quarter <= 4:
+        raise ValueError("quarter must be between 1 and 4")
+    return year, month, quarter
+
+def get_sre_controller():
+    try:
+        try:
+            year, month, quarter = _period_args(request.args)
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        compare = request.args.get("compare")
+        if compare is not None and compare not in COMPARISONS:
+            return jsonify({"message": f"compare must be one of: {', '.join(COMPARISONS)}"}), 400
+        return jsonify(build_statement(year, month, quarter, compare)), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
+
+def close_sre_period_controller():
+    try:
+        data = request.get_json(silent=True) or {}
+        year = data.get("year")
+        month = data.get("month")
+        closed_by = data.get("closed_by")
+        if isinstance(year, bool) or not isinstance(year, int):
+            return jsonify({"message": "year is required"}), 400
+        if isinstance(month, bool) or not isinstance(month, int) or not 1 <= month <= 12:
+            return jsonify({"message": "month must be between 1 and 12"}), 400
+        if closed_by is not None and (isinstance(closed_by, bool) or not str(closed_by).isdigit()):
+            return jsonify({"message": "closed_by must be a user id"}), 400
+
+        try:
+            close_period(year, month, closed_by)
+        except PeriodAlreadyClosed as e:
+            return jsonify({"message": str(e)}), 409
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        # the statement must see (and cache) the committed snapshot
+        current_unit_of_work().commit()
+        statement = build_statement(year, month)
+        return jsonify({"message": f"{statement['period']['label']} closed", "statement": statement}), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
+
+def get_financial_summary_controller():
+    try:
+        year = request.args.get("year", datetime.now().year, type=int)
+        return jsonify(financial_summary(year)), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
+
+# CATEGORY BREAKDOWNS ====================================
+def _breakdown_args(args, sources):
+    # raises ValueError on bad input
+    source = args.get("source", sources[0])
+    if source not in sources:
+        raise ValueError(f"source must be one of: {', '.join(sources)}")
+    by = args.get("by", "category")
+    if by not in GROUP_BY:
+        raise ValueError(f"by must be one of: {', '.join(GROUP_BY)}")
+    review_status = args.get("status")
+    if review_status is not None and review_status not in REVIEW_STATUSES:
+        raise ValueError(f"status must be one of: {', '.join(REVIEW_STATUSES)}")
+    if review_status is not None and source not in REVIEWED_SOURCES:
+        raise ValueError(f"{source} have no review status")
+    for field in ("start_date", "end_date"):
+        if args.get(field):
+            try:
+                date.fromisoformat(args[field])
+            except ValueError:
+                raise ValueError(f"{field} must be a date (YYYY-MM-DD)")
+    limit = args.get("limit", Config.CATEGORY_TOP_N, type=int)
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    year = args.get("year", type=int)
+    if year is None and source == "budget_entries":
+        # budget entries belong to an allocation year
+        year = datetime.now().year
+    return source, {
+        "by": by,
+        "year": year,
+        "start_date": args.get("start_date"),
+        "end_date": args.get("end_date"),
+        "review_status": review_status,
+        "limit": min(limit, Config.CATEGORY_TOP_N_MAX),
+    }
+
+def category_breakdown_controller(breakdown):
+    try:
+        try:
+            source, filters = _breakdown_args(request.args, BREAKDOWN_SOURCES[breakdown])
+        except ValueError as e:
+            return jsonify({"message": str(e)}), 400
+        return jsonify(category_breakdown(source, **filters)), 200
+    except Exception as e:
+        return jsonify({"message": str(e)}), 500
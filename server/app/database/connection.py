@@ -1,11 +1,51 @@
 # REMOVE flask_mysqldb completely
-import mysql.connector
+import threading
 from app.config import Config
+from app.database.pool import ConnectionPool
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def _gevent_patched():
+    # True inside a gunicorn gevent worker (sockets are monkey patched)
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched("socket")
+
+def _connect_args():
+    args = {
+        "host": Config.DB_HOST,
+        "user": Config.DB_USER,
+        "password": Config.DB_PASSWORD,
+        "database": Config.DB_NAME,
+    }
+    if _gevent_patched():
+        # the C extension does its socket I/O outside Python, so a query
+        # would block every greenlet in the worker; the pure Python protocol
+        # goes through the patched socket module and yields instead
+        args["use_pure"] = True
+    return args
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    connect_args=_connect_args(),
+                    pool_size=Config.DB_POOL_SIZE,
+                    max_overflow=Config.DB_POOL_MAX_OVERFLOW,
+                    timeout=Config.DB_POOL_TIMEOUT,
+                    recycle=Config.DB_POOL_RECYCLE,
+                    pre_ping=Config.DB_POOL_PRE_PING,
+                )
+    return _pool
 
 def get_db_connection():
-    return mysql.connector.connect(
-        host=Config.DB_HOST,
-        user=Config.DB_USER,
-        password=Config.DB_PASSWORD,
-        database=Config.DB_NAME
-    )
+    # conn.close() returns the connection to the pool
+    return get_pool().acquire()
+
+def get_pool_stats():
+    return get_pool().stats()
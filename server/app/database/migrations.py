@@ -0,0 +1,113 @@
+import hashlib
+import os
+import re
+from app.database.connection import get_db_connection
+
+# Versioned schema migrations: server/migrations/NNNN_description.sql,
+# applied in version order and recorded in schema_migrations. DDL commits
+# implicitly in MySQL, so a migration is a list of statements run one by
+# one; "already exists" errors are tolerated so a migration can be re-run
+# against a database where part of it was applied by hand.
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "migrations")
+MIGRATION_FILE = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+# 1050 table exists, 1060 duplicate column, 1061 duplicate key name
+TOLERATED_ERRORS = (1050, 1060, 1061)
+
+SCHEMA_MIGRATIONS_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT NOT NULL PRIMARY KEY,
+        name VARCHAR(200) NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB
+"""
+
+def split_statements(sql):
+    # migrations are plain DDL/DML: no procedures, no ';' inside literals
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    return [stmt.strip() for stmt in "\n".join(lines).split(";") if stmt.strip()]
+
+def discover_migrations(directory=MIGRATIONS_DIR):
+    migrations = []
+    for filename in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE.match(filename)
+        if not match:
+            continue
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            sql = f.read()
+        migrations.append({
+            "version": int(match.group(1)),
+            "name": match.group(2),
+            "checksum": hashlib.sha256(sql.encode("utf-8")).hexdigest(),
+            "statements": split_statements(sql),
+        })
+    return migrations
+
+def applied_migrations(conn):
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(SCHEMA_MIGRATIONS_DDL)
+        cursor.execute("SELECT version, name, checksum, applied_at FROM schema_migrations")
+        return {row["version"]: row for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+def migration_status(directory=MIGRATIONS_DIR):
+    conn = get_db_connection()
+    try:
+        applied = applied_migrations(conn)
+    finally:
+        conn.close()
+
+    status = []
+    for migration in discover_migrations(directory):
+        row = applied.get(migration["version"])
+        status.append({
+            "version": migration["version"],
+            "name": migration["name"],
+            "applied_at": row["applied_at"] if row else None,
+            # an applied file edited afterwards is never re-run; flag it
+            "modified": bool(row) and row["checksum"] != migration["checksum"],
+        })
+    return status
+
+def apply_migration(conn, migration):
+    cursor = conn.cursor()
+    try:
+        for statement in migration["statements"]:
+            try:
+                cursor.execute(statement)
+            except Exception as e:
+                if getattr(e, "errno", None) not in TOLERATED_ERRORS:
+                    raise
+                print(f"  skipped ({e.errno}): {e.msg}")
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s)",
+            (migration["version"], migration["name"], migration["checksum"]),
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+def upgrade(target=None, directory=MIGRATIONS_DIR):
+    # apply pending migrations up to `target` (default: all); returns them
+    conn = get_db_connection()
+    try:
+        applied = applied_migrations(conn)
+        done = []
+        for migration in discover_migrations(directory):
+            if migration["version"] in applied:
+                continue
+            if target is not None and migration["version"] > target:
+                break
+            print(f"applying {migration['version']:04d}_{migration['name']}")
+            apply_migration(conn, migration)
+            done.append(migration)
+        return done
+    finally:
+        conn.close()
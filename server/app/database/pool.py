@@ -0,0 +1,190 @@
+import threading
+import time
+from collections import deque
+
+import mysql.connector
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection could be checked out before the wait timeout."""
+
+
+class PooledConnection:
+    # thin proxy so existing `conn.close()` calls hand the connection back
+    # to the pool instead of tearing down the socket
+    def __init__(self, pool, raw, created_at):
+        self._pool = pool
+        self._raw = raw
+        self._created_at = created_at
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def close(self):
+        if self._released:
+            return
+        self._released = True
+        self._pool.release(self)
+
+    def invalidate(self):
+        # drop the underlying socket instead of returning it to the pool
+        if self._released:
+            return
+        self._released = True
+        self._pool.release(self, discard=True)
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        connect_args,
+        pool_size=5,
+        max_overflow=10,
+        timeout=30,
+        recycle=3600,
+        pre_ping=True,
+    ):
+        self.connect_args = connect_args
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+
+        self._idle = deque()  # (raw connection, created_at)
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._open = 0  # idle + checked out
+        self._in_use = 0
+
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self._timeouts = 0
+        self._recycled = 0
+        self._ping_failures = 0
+
+    # checkout ============================================
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        started = time.monotonic()
+
+        with self._lock:
+            while True:
+                if self._idle:
+                    raw, created_at = self._idle.pop()
+                    self._in_use += 1
+                    break
+                if self._open < self.pool_size + self.max_overflow:
+                    # reserve the slot now, connect outside the lock
+                    raw, created_at = None, None
+                    self._open += 1
+                    self._in_use += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"Database connection pool exhausted: "
+                        f"{self._in_use} connections in use "
+                        f"(pool_size={self.pool_size}, max_overflow={self.max_overflow}), "
+                        f"waited {self.timeout}s"
+                    )
+                if not waited:
+                    waited = True
+                    self._waits += 1
+                self._available.wait(remaining)
+
+            if waited:
+                self._wait_time += time.monotonic() - started
+            self._checkouts += 1
+
+        try:
+            if raw is None:
+                raw, created_at = self._connect()
+            else:
+                raw, created_at = self._validate(raw, created_at)
+        except Exception:
+            with self._lock:
+                self._open -= 1
+                self._in_use -= 1
+                self._available.notify()
+            raise
+
+        return PooledConnection(self, raw, created_at)
+
+    def release(self, conn, discard=False):
+        raw = conn._raw
+
+        if not discard:
+            try:
+                # an abandoned unbuffered result would poison the next user
+                if getattr(raw, "unread_result", False):
+                    discard = True
+                elif getattr(raw, "in_transaction", True):
+                    # never hand over an open transaction to the next user
+                    raw.rollback()
+            except Exception:
+                discard = True
+
+        with self._lock:
+            self._in_use -= 1
+            if discard or self._open > self.pool_size:
+                self._open -= 1
+                self._close_quietly(raw)
+            else:
+                self._idle.append((raw, conn._created_at))
+            self._available.notify()
+
+    # helpers =============================================
+    def _connect(self):
+        return mysql.connector.connect(**self.connect_args), time.monotonic()
+
+    def _validate(self, raw, created_at):
+        if self.recycle and time.monotonic() - created_at > self.recycle:
+            self._recycled += 1
+            self._close_quietly(raw)
+            return self._connect()
+
+        if self.pre_ping:
+            try:
+                raw.ping(reconnect=False)
+            except Exception:
+                self._ping_failures += 1
+                self._close_quietly(raw)
+                return self._connect()
+
+        return raw, created_at
+
+    @staticmethod
+    def _close_quietly(raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    def dispose(self):
+        with self._lock:
+            while self._idle:
+                raw, _ = self._idle.pop()
+                self._open -= 1
+                self._close_quietly(raw)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "open": self._open,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "wait_time_ms": round(self._wait_time * 1000, 3),
+                "timeouts": self._timeouts,
+                "recycled": self._recycled,
+                "ping_failures": self._ping_failures,
+            }
@@ -0,0 +1,42 @@
+from datetime import datetime
+
+# Named read queries with representative parameters. Models register the
+# SQL behind their list, range and totals paths so `flask db explain` can
+# check every plan against the live schema. Whole-table dumps (the legacy
+# unpaged lists and the streaming variants) scan by design and are not
+# registered.
+
+REGISTERED_QUERIES = {}
+
+# a keyset page positioned mid-table, so plans include the cursor seek
+SAMPLE_PAGE = {
+    "limit": 50,
+    "after": (datetime(2026, 1, 1), 1),
+    "direction": "next",
+    "include_total": False,
+}
+SAMPLE_YEAR = 2026
+SAMPLE_RANGE = ("2026-01-01", "2026-03-31")
+
+def register_query(name, query, params=()):
+    REGISTERED_QUERIES[name] = (query, tuple(params))
+
+# plans flagged by explain_query: full table scans and filesorts
+def plan_problems(plan_rows, min_rows):
+    problems = []
+    for row in plan_rows:
+        rows = row.get("rows")
+        # derived/union result rows have no estimate; small tables are fine
+        if rows is None or int(rows) < min_rows:
+            continue
+        extra = row.get("Extra") or ""
+        if row.get("type") == "ALL":
+            problems.append(f"full scan of {row.get('table')} (~{rows} rows)")
+        if "Using filesort" in extra:
+            problems.append(f"filesort on {row.get('table')} (~{rows} rows)")
+    return problems
+
+def explain_query(cursor, query, params, min_rows):
+    cursor.execute("EXPLAIN " + query.strip().rstrip(";"), params)
+    plan = cursor.fetchall()
+    return plan, plan_problems(plan, min_rows)
@@ -0,0 +1,37 @@
+# Per-table version stamps. Every commit that wrote to a table bumps its
+# table_versions row on the same connection, just before COMMIT, so the
+# stamp and the data change become visible together in every worker.
+# app.middleware.conditional_get turns the stamps into ETags.
+
+import mysql.connector
+
+# never stamped: the stamps themselves
+UNVERSIONED_TABLES = {"table_versions"}
+
+# ER_NO_SUCH_TABLE: migration 0004 not applied yet; writes must still commit
+MISSING_TABLE_ERRNO = 1146
+
+def bump_table_versions(conn, tables):
+    # sorted so concurrent commits lock the rows in the same order
+    tables = sorted(t for t in tables if t not in UNVERSIONED_TABLES)
+    if not tables:
+        return
+    values = ", ".join(["(%s, 1, UTC_TIMESTAMP(6))"] * len(tables))
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            f"""
+            INSERT INTO table_versions (table_name, version, updated_at)
+            VALUES {values}
+            ON DUPLICATE KEY UPDATE
+                version = version + 1,
+                updated_at = VALUES(updated_at)
+            """,
+            tuple(tables),
+        )
+    except mysql.connector.Error as e:
+        if e.errno != MISSING_TABLE_ERRNO:
+            raise
+        print("table_versions missing; run `flask db upgrade`")
+    finally:
+        cursor.close()
@@ -0,0 +1,175 @@
+import threading
+from contextlib import contextmanager
+from flask import g, has_request_context
+from app.database.connection import get_db_connection
+from app.database.table_versions import bump_table_versions
+
+# unit of work for code running outside a request (scripts, worker threads)
+_local = threading.local()
+
+# called with the set of written tables after every commit that wrote
+_commit_listeners = []
+
+def add_commit_listener(listener):
+    _commit_listeners.append(listener)
+
+def after_commit(callback):
+    # run callback once the current transaction commits; dropped on
+    # rollback (including a rolled back savepoint). Immediate with no unit
+    # of work, where every statement commits on its own.
+    uow = current_unit_of_work()
+    if uow is None:
+        callback()
+    else:
+        uow.after_commit_callbacks.append(callback)
+
+def notify_committed(tables):
+    if not tables:
+        return
+    for listener in _commit_listeners:
+        listener(tables)
+
+
+class UnitOfWork:
+    # one connection and one database transaction shared by every model
+    # call made while the unit of work is active
+    def __init__(self):
+        self.conn = None
+        self.failed = False
+        self.dirty = False
+        self.savepoints = 0
+        self.written_tables = set()
+        self.after_commit_callbacks = []
+        # query cache clock when the current transaction started
+        self.snapshot_stamp = None
+
+    def connection(self):
+        if self.conn is None:
+            self.conn = get_db_connection()
+        return self.conn
+
+    def mark_failed(self):
+        self.failed = True
+
+    def commit(self):
+        written = self.written_tables
+        callbacks = self.after_commit_callbacks
+        if self.conn is not None and self.dirty:
+            bump_table_versions(self.conn, written)
+            self.conn.commit()
+        self._reset()
+        notify_committed(written)
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                # the data is committed; a failed side effect must not undo it
+                print(f"After-commit callback failed: {e}")
+
+    def rollback(self):
+        if self.conn is not None:
+            self.conn.rollback()
+        self._reset()
+
+    def _reset(self):
+        self.failed = False
+        self.dirty = False
+        self.written_tables = set()
+        self.after_commit_callbacks = []
+        self.snapshot_stamp = None
+
+    def finish(self, error=None):
+        # commit unless something went wrong, then hand the connection back
+        try:
+            if self.conn is None:
+                return
+            if error is not None or self.failed:
+                self.rollback()
+            else:
+                self.commit()
+        finally:
+            self.release()
+
+    def release(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def current_unit_of_work():
+    uow = getattr(_local, "unit_of_work", None)
+    if uow is not None:
+        return uow
+    if has_request_context():
+        if "unit_of_work" not in g:
+            g.unit_of_work = UnitOfWork()
+        return g.unit_of_work
+    return None
+
+
+@contextmanager
+def transaction():
+    # multi-statement block: commits on success, rolls back on error or when
+    # a model function inside it swallowed a failed statement. Nested inside a
+    # request (or another transaction) it becomes a savepoint.
+    uow = current_unit_of_work()
+
+    if uow is None:
+        uow = UnitOfWork()
+        _local.unit_of_work = uow
+        try:
+            yield uow.connection()
+        except Exception as e:
+            _local.unit_of_work = None
+            uow.finish(e)
+            raise
+        else:
+            _local.unit_of_work = None
+            uow.finish()
+        return
+
+    conn = uow.connection()
+    uow.savepoints += 1
+    name = f"sp_{uow.savepoints}"
+    failed_before = uow.failed
+    callbacks_before = len(uow.after_commit_callbacks)
+    uow.failed = False
+
+    cursor = conn.cursor()
+    cursor.execute(f"SAVEPOINT {name}")
+    try:
+        yield conn
+    except Exception:
+        cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+        del uow.after_commit_callbacks[callbacks_before:]
+        uow.failed = failed_before
+        raise
+    else:
+        if uow.failed:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+            del uow.after_commit_callbacks[callbacks_before:]
+            uow.failed = failed_before
+        else:
+            cursor.execute(f"RELEASE SAVEPOINT {name}")
+            uow.failed = failed_before
+    finally:
+        cursor.close()
+        uow.savepoints -= 1
+
+
+def init_unit_of_work(app):
+    @app.after_request
+    def commit_unit_of_work(response):
+        uow = g.pop("unit_of_work", None)
+        if uow is not None:
+            # server errors roll the whole request back
+            error = Exception(response.status) if response.status_code >= 500 else None
+            uow.finish(error)
+        return response
+
+    @app.teardown_request
+    def release_unit_of_work(error=None):
+        # work done after the response was built (e.g. streamed bodies)
+        uow = g.pop("unit_of_work", None)
+        if uow is not None:
+            uow.finish(error)
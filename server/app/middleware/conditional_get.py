@@ -0,0 +1,115 @@
+import hashlib
+import threading
+import time
+from datetime import date, timezone
+from functools import wraps
+from flask import current_app, make_response, request
+from app.config import Config
+from app.database.unit_of_work import add_commit_listener
+from app.utils.execute_query import fetch_all
+
+# Conditional GET for read endpoints. The ETag is derived from the request
+# URL and the table_versions stamps of the tables the endpoint reads, so a
+# client revalidating unchanged data gets 304 Not Modified before the view
+# (and its queries) runs. Stamps are cached in-process for
+# TABLE_VERSION_TTL seconds; a commit in this process drops them at once,
+# a commit in another worker shows up once they expire.
+#
+# Endpoints whose answer also depends on the clock (a year that defaults to
+# the current one, "this month" figures) pass period=, a function returning
+# the resolved period, so the ETag changes when the period rolls over even
+# though no table did.
+
+_versions = {}
+_versions_lock = threading.Lock()
+
+def _forget_versions(tables):
+    with _versions_lock:
+        for table in tables:
+            _versions.pop(table, None)
+
+add_commit_listener(_forget_versions)
+
+def get_table_versions(tables):
+    # {table: (version, updated_at)}; tables never written are (0, None)
+    now = time.monotonic()
+    with _versions_lock:
+        found = {t: _versions[t][:2] for t in tables if t in _versions and _versions[t][2] > now}
+    missing = [t for t in tables if t not in found]
+    if missing:
+        placeholders = ", ".join(["%s"] * len(missing))
+        rows = fetch_all(
+            f"SELECT table_name, version, updated_at FROM table_versions WHERE table_name IN ({placeholders})",
+            tuple(missing),
+            name="table_versions.read",
+        )
+        stamps = {row["table_name"]: (row["version"], row["updated_at"]) for row in rows}
+        expires = now + Config.TABLE_VERSION_TTL
+        with _versions_lock:
+            for table in missing:
+                found[table] = stamps.get(table, (0, None))
+                _versions[table] = found[table] + (expires,)
+    return found
+
+def default_year():
+    # period= for endpoints whose ?year defaults to the current year
+    return "" if request.args.get("year") else str(date.today().year)
+
+def current_month():
+    # period= for endpoints reporting on the current month
+    return date.today().strftime("%Y-%m")
+
+def build_etag(tables, versions, period=""):
+    # the query string is part of the key: ?year=, ?cursor=, ?shape= ...
+    key = request.full_path + "|" + ",".join(f"{t}:{versions[t][0]}" for t in tables)
+    if period:
+        key += "|" + period
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+def last_modified(versions):
+    stamps = [updated_at for _, updated_at in versions.values() if updated_at is not None]
+    if not stamps:
+        return None
+    # stamped with UTC_TIMESTAMP(6); HTTP dates have whole seconds
+    return max(stamps).replace(microsecond=0, tzinfo=timezone.utc)
+
+def is_not_modified(etag, modified):
+    # If-None-Match wins over If-Modified-Since when both are sent
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and modified is not None:
+        return modified <= request.if_modified_since
+    return False
+
+def conditional_get(*tables, period=None):
+    # @conditional_get("collections") on a GET route reading those tables
+    tables = tuple(sorted(tables))
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if request.method != "GET" or not Config.CONDITIONAL_GET_ENABLED:
+                return fn(*args, **kwargs)
+            try:
+                versions = get_table_versions(tables)
+            except Exception as e:
+                # no table_versions yet: serve the request unconditionally
+                print(f"Conditional GET skipped: {e}")
+                return fn(*args, **kwargs)
+
+            etag = build_etag(tables, versions, period() if period else "")
+            modified = last_modified(versions)
+            if is_not_modified(etag, modified):
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(fn(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            if modified is not None:
+                response.last_modified = modified
+            # browsers keep the body but always revalidate it
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+        return wrapper
+    return decorator
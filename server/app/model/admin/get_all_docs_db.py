@@ -0,0 +1,226 @@
+from datetime import datetime
+from app.utils.execute_query import fetch_all
+from app.utils.pagination import keyset_condition, build_page_result
+from app.database.query_registry import register_query, SAMPLE_YEAR
+
+# Merged activity feed over the four ledger tables. Every branch projects
+# the same document shape; columns a table does not have are NULL. Rows are
+# keyset-paginated on (created_at, doc_key) where doc_key is
+# "<doc_type>:<zero padded id>", unique across the whole feed.
+
+DOC_COLUMNS = (
+    "doc_type",
+    "doc_key",
+    "id",
+    "transaction_id",
+    "transaction_date",
+    "created_at",
+    "amount",
+    "nature_of_collection",
+    "nature_of_disbursement",
+    "expenditure_program",
+    "allocation_category",
+    "project",
+    "name_of_collection",
+    "total_cost_approved",
+    "total_cost_incurred",
+    "payee",
+    "payor",
+    "review_status",
+    "is_flagged",
+    "review_comment",
+)
+
+DOC_SOURCES = {
+    "collection": {
+        "from": "collections",
+        "id": "id",
+        "created_at": "created_at",
+        "date": "transaction_date",
+        "year": None,
+        "reviewed": True,
+        "columns": {
+            "transaction_id": "transaction_id",
+            "transaction_date": "transaction_date",
+            "amount": "amount",
+            "nature_of_collection": "nature_of_collection",
+            "payor": "payor",
+            "review_status": "review_status",
+            "is_flagged": "is_flagged",
+            "review_comment": "review_comment",
+        },
+    },
+    "disbursement": {
+        "from": "disbursements",
+        "id": "id",
+        "created_at": "created_at",
+        "date": "transaction_date",
+        "year": None,
+        "reviewed": True,
+        "columns": {
+            "transaction_id": "transaction_id",
+            "transaction_date": "transaction_date",
+            "amount": "amount",
+            "nature_of_disbursement": "nature_of_disbursement",
+            "payee": "payee",
+            "review_status": "review_status",
+            "is_flagged": "is_flagged",
+            "review_comment": "review_comment",
+        },
+    },
+    "budget_entry": {
+        "from": "budget_entries be JOIN budget_allocations ba ON be.allocation_id = ba.id",
+        "id": "be.id",
+        "created_at": "be.created_at",
+        "date": "be.transaction_date",
+        # budget entries belong to the fiscal year of their allocation
+        "year": "ba.year",
+        # budget entries are not reviewed, so a status filter excludes them
+        "reviewed": False,
+        "columns": {
+            "transaction_id": "be.transaction_id",
+            "transaction_date": "be.transaction_date",
+            "amount": "be.amount",
+            "expenditure_program": "be.expenditure_program",
+            "allocation_category": "ba.category",
+            "payee": "be.payee",
+        },
+    },
+    "dfur": {
+        "from": "dfur_projects",
+        "id": "id",
+        "created_at": "created_at",
+        "date": "transaction_date",
+        "year": None,
+        "reviewed": True,
+        "columns": {
+            "transaction_id": "transaction_id",
+            "transaction_date": "transaction_date",
+            "project": "project",
+            "name_of_collection": "name_of_collection",
+            "total_cost_approved": "total_cost_approved",
+            "total_cost_incurred": "total_cost_incurred",
+            "review_status": "review_status",
+            "is_flagged": "is_flagged",
+            "review_comment": "review_comment",
+        },
+    },
+}
+
+DOC_TYPES = tuple(DOC_SOURCES)
+DOC_STATUSES = ("pending", "approved", "rejected", "flagged")
+
+def _select_list(doc_type, source):
+    columns = dict(
+        source["columns"],
+        doc_type=f"'{doc_type}'",
+        doc_key=f"CONCAT('{doc_type}:', LPAD({source['id']}, 12, '0'))",
+        id=source["id"],
+        created_at=source["created_at"],
+    )
+    return ", ".join(f"{columns.get(name, 'NULL')} AS {name}" for name in DOC_COLUMNS)
+
+def _branch_filters(source, year=None, status=None):
+    conditions = []
+    params = []
+    if year is not None and source["year"]:
+        conditions.append(f"{source['year']} = %s")
+        params.append(year)
+    elif year is not None:
+        # range on the date column instead of YEAR(...) so an index can be used
+        conditions.append(f"{source['date']} >= %s AND {source['date']} < %s")
+        params.extend([f"{int(year)}-01-01", f"{int(year) + 1}-01-01"])
+    if status == "flagged":
+        conditions.append("is_flagged = 1")
+    elif status:
+        conditions.append("review_status = %s")
+        params.append(status)
+    return conditions, params
+
+def _branch_keyset(doc_type, source, page):
+    # the feed's (created_at, doc_key) bound rewritten for one branch; all of
+    # a branch's doc_keys share its prefix, so the tie on created_at reduces
+    # to "all", "none" or an id comparison and the condition stays sargable
+    if not page["after"]:
+        return None, []
+    created_at, doc_key = page["after"]
+    cursor_type, _, cursor_id = str(doc_key).partition(":")
+    if cursor_type not in DOC_SOURCES or not cursor_id.isdigit():
+        raise ValueError("Invalid cursor")
+    forward = page["direction"] == "next"
+
+    if cursor_type == doc_type:
+        branch_page = dict(page, after=(created_at, int(cursor_id)))
+        return keyset_condition(branch_page, source["created_at"], source["id"])
+
+    # does this branch's prefix sort on the requested side of the cursor's?
+    include_ties = (doc_type < cursor_type) if forward else (doc_type > cursor_type)
+    op = ("<" if forward else ">") + ("=" if include_ties else "")
+    return f"{source['created_at']} {op} %s", [created_at]
+
+def _selected_types(doc_types, status):
+    types = [t for t in DOC_TYPES if not doc_types or t in doc_types]
+    if status:
+        types = [t for t in types if DOC_SOURCES[t]["reviewed"]]
+    return types
+
+def build_docs_page_query(page, doc_types=None, year=None, status=None):
+    # (None, ()) when the filters leave no table to read
+    order = "DESC" if page["direction"] == "next" else "ASC"
+    limit = page["limit"] + 1
+
+    branches = []
+    params = []
+    for doc_type in _selected_types(doc_types, status):
+        source = DOC_SOURCES[doc_type]
+        conditions, branch_params = _branch_filters(source, year, status)
+        condition, condition_params = _branch_keyset(doc_type, source, page)
+        if condition:
+            conditions.append(condition)
+            branch_params.extend(condition_params)
+
+        # each branch is cut to the page size first, so the merge never
+        # handles more than (page size + 1) rows per table
+        branch = f"SELECT {_select_list(doc_type, source)} FROM {source['from']}"
+        if conditions:
+            branch += " WHERE " + " AND ".join(conditions)
+        branch += f" ORDER BY {source['created_at']} {order}, {source['id']} {order} LIMIT %s"
+        branch_params.append(limit)
+
+        branches.append(f"({branch})")
+        params.extend(branch_params)
+
+    if not branches:
+        return None, ()
+
+    query = (
+        " UNION ALL ".join(branches)
+        + f" ORDER BY created_at {order}, doc_key {order} LIMIT %s"
+    )
+    params.append(limit)
+    return query, tuple(params)
+
+def get_docs_page_db(page, doc_types=None, year=None, status=None):
+    query, params = build_docs_page_query(page, doc_types, year, status)
+    rows = fetch_all(query, params) if query else []
+    return build_page_result(rows, page, "created_at", "doc_key")
+
+def count_docs_db(doc_types=None, year=None, status=None):
+    total = 0
+    for doc_type in _selected_types(doc_types, status):
+        source = DOC_SOURCES[doc_type]
+        conditions, params = _branch_filters(source, year, status)
+        query = f"SELECT COUNT(*) AS total FROM {source['from']}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        total += fetch_all(query, tuple(params))[0]["total"]
+    return total
+
+_SAMPLE_FEED_PAGE = {
+    "limit": 50,
+    "after": (datetime(2026, 1, 1), "collection:000000000001"),
+    "direction": "next",
+    "include_total": False,
+}
+register_query("docs.page", *build_docs_page_query(_SAMPLE_FEED_PAGE))
+register_query("docs.page_filtered", *build_docs_page_query(_SAMPLE_FEED_PAGE, year=SAMPLE_YEAR, status="pending"))
@@ -1,46 +1,62 @@
 from app.database.connection import get_db_connection
 from app.utils.execute_query import execute_query   
+from app.database.unit_of_work import transaction
+from app.services.ledger_summary import track_ledger
+from app.services.events import publish_after_commit, review_event_type
+from app.model.row_version_db import BUMP_ROW_VERSION, VERSION_MATCH
 
-def put_collection_approval_db(collection_id, review_status):
+def put_collection_approval_db(collection_id, review_status, row_version):
     ...
     try:
         ...
-        query = """
+        query = f"""
             UPDATE collections
-            SET review_status = %s
-            WHERE id = %s
+            SET review_status = %s, {BUMP_ROW_VERSION}
+            WHERE id = %s AND {VERSION_MATCH}
         """
-        return execute_query(query, (review_status, collection_id))
+        with transaction(), track_ledger("collections", "id", [collection_id]):
+            affected = execute_query(query, (review_status, collection_id, row_version))
+            if affected:
+                publish_after_commit(review_event_type(review_status), "collections", [collection_id], review_status=review_status)
+        return affected
     except Exception as e:
         print(e)
         return False
 
 
-def put_disbursement_approval_db(disbursement_id, review_status):
+def put_disbursement_approval_db(disbursement_id, review_status, row_version):
     ...
     try:
         ...
-        query = """
+        query = f"""
             UPDATE disbursements
-            SET review_status = %s
-            WHERE id = %s
+            SET review_status = %s, {BUMP_ROW_VERSION}
+            WHERE id = %s AND {VERSION_MATCH}
         """
-        return execute_query(query, (review_status, disbursement_id))
+        with transaction(), track_ledger("disbursements", "id", [disbursement_id]):
+            affected = execute_query(query, (review_status, disbursement_id, row_version))
+            if affected:
+                publish_after_commit(review_event_type(review_status), "disbursements", [disbursement_id], review_status=review_status)
+        return affected
     except Exception as e:
         print(e)
         return False
     
     
-def put_dfur_approval_db(dfur_id, review_status):
+def put_dfur_approval_db(dfur_id, review_status, row_version):
     ...
     try:
         ...
-        query = """
+        query = f"""
             UPDATE dfur_projects
-            SET review_status = %s
-            WHERE id = %s
+            SET review_status = %s, {BUMP_ROW_VERSION}
+            WHERE id = %s AND {VERSION_MATCH}
         """
-        return execute_query(query, (review_status, dfur_id))
+        with transaction(), track_ledger("dfur_projects", "id", [dfur_id]):
+            affected = execute_query(query, (review_status, dfur_id, row_version))
+            if affected:
+                publish_after_commit(review_event_type(review_status), "dfur_projects", [dfur_id], review_status=review_status)
+        return affected
     except Exception as e:
         print(e)
     
\ No newline at end of file
@@ -0,0 +1,103 @@
+from app.config import Config
+from app.utils.execute_query import execute_query, fetch_all, fetch_rowset
+from app.database.query_registry import register_query
+
+# Delta sync (/api/changes). Inserted and updated rows are found through
+# updated_at (maintained by MySQL, see migration 0005) with one
+# (updated_at, id) keyset cursor per table; deletes through row_tombstones,
+# written in the same transaction as the DELETE.
+
+# table -> select list; users never expose password
+CHANGE_TABLES = {
+    "collections": "*",
+    "disbursements": "*",
+    "budget_entries": "*",
+    "dfur_projects": "*",
+    "users": "id, username, full_name, position, role, is_active, created_at, updated_at",
+}
+
+# after the cursor, up to the cutoff, oldest change first
+CHANGED_ROWS_QUERY = """
+    SELECT {columns} FROM {table}
+    WHERE (updated_at > %s OR (updated_at = %s AND id > %s))
+      AND updated_at <= %s
+    ORDER BY updated_at, id
+    LIMIT %s
+"""
+
+TOMBSTONES_QUERY = """
+    SELECT id, table_name, row_id, transaction_id, deleted_at FROM row_tombstones
+    WHERE (deleted_at > %s OR (deleted_at = %s AND id > %s))
+      AND deleted_at <= %s
+    ORDER BY deleted_at, id
+    LIMIT %s
+"""
+
+def changed_rows_query(table):
+    return CHANGED_ROWS_QUERY.format(columns=CHANGE_TABLES[table], table=table)
+
+# NOW(6) - settle alone can pass a long transaction that stamped rows
+# before the cutoff but has not committed; they would appear behind a cursor
+# already handed out. So the cutoff also stays below the start of the oldest
+# open InnoDB transaction (trx_started has second precision, hence the extra
+# microsecond). Needs the PROCESS privilege to see other sessions.
+CHANGES_CUTOFF_QUERY = """
+    SELECT LEAST(
+        NOW(6) - INTERVAL %s MICROSECOND,
+        COALESCE(
+            (SELECT MIN(trx_started) - INTERVAL 1 MICROSECOND
+             FROM information_schema.INNODB_TRX
+             WHERE trx_mysql_thread_id <> CONNECTION_ID()),
+            NOW(6)
+        )
+    ) AS cutoff
+"""
+
+def changes_cutoff_db():
+    # newest timestamp a sync may hand out. Rows stamped later may still
+    # belong to transactions that have not committed yet; a cursor past
+    # them would skip those rows once they do.
+    rows = fetch_all(
+        CHANGES_CUTOFF_QUERY,
+        (int(Config.CHANGES_SETTLE_SECONDS * 1_000_000),),
+    )
+    return rows[0]["cutoff"]
+
+def get_changed_rows_db(table, after, cutoff, limit):
+    # RowSet of up to `limit` rows changed after the (updated_at, id) cursor
+    updated_at, row_id = after
+    return fetch_rowset(
+        changed_rows_query(table),
+        (updated_at, updated_at, row_id, cutoff, limit),
+        name=f"{table}.changes",
+    )
+
+def get_tombstones_db(after, cutoff, limit):
+    deleted_at, tombstone_id = after
+    return fetch_all(TOMBSTONES_QUERY, (deleted_at, deleted_at, tombstone_id, cutoff, limit))
+
+def record_tombstones_db(table, ids):
+    # call inside the deleting transaction, before the DELETE
+    placeholders = ", ".join(["%s"] * len(ids))
+    return execute_query(
+        f"""
+        INSERT INTO row_tombstones (table_name, row_id, transaction_id)
+        SELECT %s, id, transaction_id FROM {table} WHERE id IN ({placeholders})
+        """,
+        (table, *ids),
+    )
+
+def purge_tombstones_db(days):
+    # clients whose cursor is older than this must resync from scratch
+    return execute_query(
+        "DELETE FROM row_tombstones WHERE deleted_at < NOW(6) - INTERVAL %s DAY",
+        (days,),
+    )
+
+for _table in CHANGE_TABLES:
+    register_query(
+        f"{_table}.changes",
+        changed_rows_query(_table),
+        ("2026-01-01", "2026-01-01", 1, "2026-02-01", 500),
+    )
+register_query("row_tombstones.changes", TOMBSTONES_QUERY, ("2026-01-01", "2026-01-01", 1, "2026-02-01", 500))
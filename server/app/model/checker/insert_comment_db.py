@@ -1,66 +1,103 @@
 from app.database.connection import get_db_connection
 from app.utils.execute_query import execute_query
+from app.database.unit_of_work import transaction
+from app.services.ledger_summary import track_ledger
+from app.services.events import publish_after_commit
+from app.model.row_version_db import BUMP_ROW_VERSION, VERSION_MATCH
 
-def insert_collection_comment_db(collection_id, reviewed_by, comment):
+def insert_collection_comment_db(collection_id, reviewed_by, comment, row_version):
     try:
-        query = """
+        query = f"""
             UPDATE collections
             SET
                 is_flagged = 1,
                 review_comment = %s,
                 reviewed_by = %s,
-                reviewed_at = NOW()
-            WHERE id = %s
+                reviewed_at = NOW(),
+                claimed_by = NULL,
+                claim_expires_at = NULL,
+                {BUMP_ROW_VERSION}
+            WHERE id = %s AND {VERSION_MATCH}
+              AND (claimed_by IS NULL OR claimed_by = %s OR claim_expires_at < NOW(6))
         """
         params = (
             comment,
             reviewed_by,
-            collection_id
+            collection_id,
+            row_version,
+            # rows claimed by another checker are left alone
+            reviewed_by
         )
-        return execute_query(query, params)
+        with transaction(), track_ledger("collections", "id", [collection_id]):
+            affected = execute_query(query, params)
+            if affected:
+                publish_after_commit("flagged", "collections", [collection_id])
+        return affected
 
     except Exception as e:
         print("Insert comment error:", e)
         return False
     
-def insert_disbursement_comment_db(disbursement_id, reviewed_by, comment):
+def insert_disbursement_comment_db(disbursement_id, reviewed_by, comment, row_version):
     try:
-        query = """
+        query = f"""
             UPDATE disbursements SET
                 is_flagged = 1,
                 review_comment = %s,
                 reviewed_by = %s,
-                reviewed_at = NOW()
-            WHERE id = %s
+                reviewed_at = NOW(),
+                claimed_by = NULL,
+                claim_expires_at = NULL,
+                {BUMP_ROW_VERSION}
+            WHERE id = %s AND {VERSION_MATCH}
+              AND (claimed_by IS NULL OR claimed_by = %s OR claim_expires_at < NOW(6))
         """
         params = (
             comment,
             reviewed_by,
-            disbursement_id
+            disbursement_id,
+            row_version,
+            # rows claimed by another checker are left alone
+            reviewed_by
         )
-        return execute_query(query, params)
+        with transaction(), track_ledger("disbursements", "id", [disbursement_id]):
+            affected = execute_query(query, params)
+            if affected:
+                publish_after_commit("flagged", "disbursements", [disbursement_id])
+        return affected
 
     except Exception as e:
         print("Insert comment error:", e)
         return False
 
-def insert_dfur_comment_db(dfur_id, reviewed_by, comment):
+def insert_dfur_comment_db(dfur_id, reviewed_by, comment, row_version):
     try:
-        query = """
+        query = f"""
             UPDATE dfur_projects
             SET
                 is_flagged = 1,
                 review_comment = %s,
                 reviewed_by = %s,
-                reviewed_at = NOW()
-            WHERE id = %s
+                reviewed_at = NOW(),
+                claimed_by = NULL,
+                claim_expires_at = NULL,
+                {BUMP_ROW_VERSION}
+            WHERE id = %s AND {VERSION_MATCH}
+              AND (claimed_by IS NULL OR claimed_by = %s OR claim_expires_at < NOW(6))
         """
         params = (
             comment,
             reviewed_by,
-            dfur_id
+            dfur_id,
+            row_version,
+            # rows claimed by another checker are left alone
+            reviewed_by
         )
-        return execute_query(query, params)
+        with transaction(), track_ledger("dfur_projects", "id", [dfur_id]):
+            affected = execute_query(query, params)
+            if affected:
+                publish_after_commit("flagged", "dfur_projects", [dfur_id])
+        return affected
 
     except Exception as e:
         print("Insert comment error:", e)
@@ -0,0 +1,144 @@
+from app.config import Config
+from app.utils.execute_query import execute_query, fetch_all
+from app.database.unit_of_work import transaction
+from app.database.query_registry import register_query
+from app.model.review_db import REVIEW_TABLES
+from app.model.row_version_db import BUMP_ROW_VERSION
+
+# Review queue for checkers: pending, unflagged rows nobody has checked yet,
+# oldest first across collections, disbursements and DFUR projects. Claiming
+# locks candidates with FOR UPDATE SKIP LOCKED, so concurrent checkers never
+# wait on or receive the same rows, then stamps claimed_by and a lease
+# (claim_expires_at). An expired lease puts the row back in the queue.
+
+# rows available to claim: unclaimed or lease run out. Walks
+# idx_<table>_review_queue (review_status, is_flagged, reviewed_at,
+# created_at, id; migration 0010), so reviewed rows fall outside the range
+# and are neither scanned nor locked.
+QUEUE_CANDIDATES_QUERY = """
+    SELECT id, created_at FROM {table}
+    WHERE review_status = 'pending' AND is_flagged = 0 AND reviewed_at IS NULL
+      AND (claimed_by IS NULL OR claim_expires_at < NOW(6))
+    ORDER BY created_at, id
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+"""
+
+# rows a checker may write a review for: not held by someone else
+CLAIM_FREE_CONDITION = "(claimed_by IS NULL OR claimed_by = %s OR claim_expires_at < NOW(6))"
+
+def _in_list(ids):
+    return ", ".join(["%s"] * len(ids))
+
+def claim_review_items_db(checker_id, limit, item_types=None):
+    # claim up to `limit` rows; returns [{"type", "id", "row"}] oldest first
+    item_types = item_types or list(REVIEW_TABLES)
+    with transaction():
+        candidates = []
+        for item_type in item_types:
+            table = REVIEW_TABLES[item_type]
+            rows = fetch_all(
+                QUEUE_CANDIDATES_QUERY.format(table=table),
+                (limit,),
+                name=f"{table}.review_queue",
+            )
+            candidates.extend((row["created_at"], item_type, row["id"]) for row in rows)
+        # the rows not picked stay locked only until this transaction ends
+        candidates.sort(key=lambda c: (c[0], REVIEW_TABLES[c[1]], c[2]))
+        picked = {}
+        for _, item_type, row_id in candidates[:limit]:
+            picked.setdefault(item_type, []).append(row_id)
+
+        for item_type, ids in picked.items():
+            execute_query(
+                f"""
+                UPDATE {REVIEW_TABLES[item_type]}
+                SET claimed_by = %s, claim_expires_at = NOW(6) + INTERVAL %s SECOND
+                WHERE id IN ({_in_list(ids)})
+                """,
+                (checker_id, Config.REVIEW_CLAIM_SECONDS, *ids),
+                name=f"{REVIEW_TABLES[item_type]}.review_claim",
+            )
+        items = _fetch_items(picked)
+    order = {(item_type, row_id): n for n, (_, item_type, row_id) in enumerate(candidates)}
+    return sorted(items, key=lambda item: order[(item["type"], item["id"])])
+
+def _fetch_items(ids_by_type):
+    items = []
+    for item_type, ids in ids_by_type.items():
+        if not ids:
+            continue
+        rows = fetch_all(
+            f"SELECT * FROM {REVIEW_TABLES[item_type]} WHERE id IN ({_in_list(ids)})",
+            tuple(ids),
+        )
+        items.extend({"type": item_type, "id": row["id"], "row": row} for row in rows)
+    return items
+
+def get_claimed_items_db(checker_id):
+    # the checker's unexpired claims, oldest first
+    items = []
+    for item_type, table in REVIEW_TABLES.items():
+        rows = fetch_all(
+            f"""
+            SELECT * FROM {table}
+            WHERE claimed_by = %s AND claim_expires_at >= NOW(6)
+            ORDER BY created_at, id
+            """,
+            (checker_id,),
+            name=f"{table}.review_claims",
+        )
+        items.extend({"type": item_type, "id": row["id"], "row": row} for row in rows)
+    return sorted(items, key=lambda item: (item["row"]["created_at"], item["type"], item["id"]))
+
+def update_claims_db(checker_id, items, action):
+    # renew / release / complete the checker's own claims; returns the
+    # [{"type", "id"}] actually changed (others are not held by them)
+    assignments = {
+        "renew": ("claim_expires_at = NOW(6) + INTERVAL %s SECOND", (Config.REVIEW_CLAIM_SECONDS,)),
+        "release": ("claimed_by = NULL, claim_expires_at = NULL", ()),
+        # checked without a flag: leaves the queue for good. Only this one
+        # bumps row_version; claims are not edits of the row.
+        "complete": (
+            f"claimed_by = NULL, claim_expires_at = NULL, reviewed_by = %s, reviewed_at = NOW(), {BUMP_ROW_VERSION}",
+            (checker_id,),
+        ),
+    }
+    assignment, assignment_params = assignments[action]
+
+    by_type = {}
+    for item in items:
+        by_type.setdefault(item["type"], []).append(item["id"])
+
+    changed = []
+    with transaction():
+        for item_type, ids in by_type.items():
+            table = REVIEW_TABLES[item_type]
+            held = fetch_all(
+                f"""
+                SELECT id FROM {table}
+                WHERE id IN ({_in_list(ids)}) AND claimed_by = %s AND claim_expires_at >= NOW(6)
+                FOR UPDATE
+                """,
+                (*ids, checker_id),
+            )
+            held_ids = [row["id"] for row in held]
+            if held_ids:
+                execute_query(
+                    f"UPDATE {table} SET {assignment} WHERE id IN ({_in_list(held_ids)})",
+                    (*assignment_params, *held_ids),
+                    name=f"{table}.review_{action}",
+                )
+            changed.extend({"type": item_type, "id": row_id} for row_id in held_ids)
+    return changed
+
+def claim_holder_db(table, row_id):
+    # checker currently holding the row, if the lease is still running
+    rows = fetch_all(
+        f"SELECT claimed_by FROM {table} WHERE id = %s AND claim_expires_at >= NOW(6)",
+        (row_id,),
+    )
+    return rows[0]["claimed_by"] if rows else None
+
+for _table in REVIEW_TABLES.values():
+    register_query(f"{_table}.review_queue", QUEUE_CANDIDATES_QUERY.format(table=_table), (10,))
@@ -1,80 +1,163 @@
-from app.utils.execute_query import execute_query, fetch_all
+from app.utils.execute_query import execute_query, fetch_all, fetch_rowset
+from app.utils.pagination import fetch_keyset_page, build_keyset_query
+from app.database.query_registry import register_query, SAMPLE_PAGE, SAMPLE_YEAR
+from app.database.unit_of_work import transaction
+from app.model.changes_db import record_tombstones_db
+from app.model.row_version_db import BUMP_ROW_VERSION, VERSION_MATCH
+from app.services.ledger_summary import track_ledger
+from app.services.events import publish_after_commit
+from app.model.encoder.bulk_db import insert_rows_db
+
+BUDGET_ENTRIES_BY_YEAR_QUERY = """
+    SELECT
+        be.id,
+        be.transaction_id,
+        be.transaction_date,
+        ba.category AS allocation_category,
+        be.subcategory,
+        be.expenditure_program,
+        be.payee,
+        be.dv_number,
+        be.amount,
+        be.row_version,
+        ba.year,
+        ba.created_at
+    FROM budget_entries be
+    JOIN budget_allocations ba
+        ON be.allocation_id = ba.id
+    WHERE ba.year = %s
+    ORDER BY be.transaction_date DESC
+"""
+
+BUDGET_ENTRIES_PAGE_SELECT = """
+    SELECT
+        be.id,
+        be.transaction_id,
+        be.transaction_date,
+        ba.category AS allocation_category,
+        be.subcategory,
+        be.expenditure_program,
+        be.payee,
+        be.dv_number,
+        be.amount,
+        be.row_version,
+        ba.year,
+        ba.created_at,
+        be.created_at AS entry_created_at
+    FROM budget_entries be
+    JOIN budget_allocations ba
+        ON be.allocation_id = ba.id
+"""
+
+BUDGET_ENTRIES_COUNT_QUERY = """
+    SELECT COUNT(*) AS total
+    FROM budget_entries be
+    JOIN budget_allocations ba
+        ON be.allocation_id = ba.id
+    WHERE ba.year = %s
+"""
+
+register_query("budget_entries.by_year", BUDGET_ENTRIES_BY_YEAR_QUERY, (SAMPLE_YEAR,))
+register_query(
+    "budget_entries.page",
+    *build_keyset_query(
+        BUDGET_ENTRIES_PAGE_SELECT,
+        SAMPLE_PAGE,
+        where="ba.year = %s",
+        params=(SAMPLE_YEAR,),
+        created_col="be.created_at",
+        id_col="be.id",
+    ),
+)
+
+BUDGET_ENTRY_INSERT_QUERY = """
+    INSERT INTO budget_entries (
+        transaction_id,
+        transaction_date,
+        category,
+        subcategory,
+        amount,
+        fund_source,
+        payee,
+        dv_number,
+        expenditure_program,
+        program_description,
+        remarks,
+        allocation_id,
+        created_by
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+def budget_entry_insert_params(entries, created_by):
+    return (
+        entries["transaction_id"],
+        entries["transaction_date"],
+        entries["category"],
+        entries.get("subcategory"),
+        entries["amount"],
+        entries.get("fund_source"),
+        entries.get("payee"),
+        entries.get("dv_number"),
+        entries.get("expenditure_program"),
+        entries.get("program_description"),
+        entries.get("remarks"),
+        entries.get("allocation_id"),
+        created_by
+    )
 
 def insert_budget_entries_db(entries, created_by):
     try:
-        query = """
-            INSERT INTO budget_entries (
-                transaction_id,
-                transaction_date,
-                category,
-                subcategory,
-                amount,
-                fund_source,
-                payee,
-                dv_number,
-                expenditure_program,
-                program_description,
-                remarks,
-                allocation_id,
-                created_by
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        params = budget_entry_insert_params(entries, created_by)
 
-        params = (
-            entries["transaction_id"],
-            entries["transaction_date"],
-            entries["category"],
-            entries.get("subcategory"),
-            entries["amount"],
-            entries.get("fund_source"),
-            entries.get("payee"),
-            entries.get("dv_number"),
-            entries.get("expenditure_program"),
-            entries.get("program_description"),
-            entries.get("remarks"),
-            entries.get("allocation_id"),
-            created_by
-        )
-
-        return execute_query(query, params) == 1
+        with transaction(), track_ledger("budget_entries", "transaction_id", [entries["transaction_id"]], inserting=True):
+            affected = execute_query(BUDGET_ENTRY_INSERT_QUERY, params)
+            if affected:
+                publish_after_commit("created", "budget_entries", transaction_ids=[entries["transaction_id"]])
+        return affected == 1
 
     except Exception as e:
         print(f"Error inserting budget entries: {e}")
         return False
 
+def insert_budget_entries_bulk_db(entries):
+    # all or nothing; returns {transaction_id: id}
+    return insert_rows_db(
+        "budget_entries",
+        BUDGET_ENTRY_INSERT_QUERY,
+        [budget_entry_insert_params(e, e["created_by"]) for e in entries],
+        [e["transaction_id"] for e in entries],
+    )
+
 
 def get_budget_entries_db(year):
     try:
-        query = """
-            SELECT
-                be.id,
-                be.transaction_id,
-                be.transaction_date,
-                ba.category AS allocation_category,
-                be.subcategory,
-                be.expenditure_program,
-                be.payee,
-                be.dv_number,
-                be.amount,
-                ba.year,
-                ba.created_at
-            FROM budget_entries be
-            JOIN budget_allocations ba
-                ON be.allocation_id = ba.id
-            WHERE ba.year = %s
-            ORDER BY be.transaction_date DESC
-        """
-
-        return fetch_all(query, (year,))
+        return fetch_rowset(BUDGET_ENTRIES_BY_YEAR_QUERY, (year,))
     except Exception as e:
         print(f"Error fetching budget entries: {e}")
         return None
 
 
+def get_budget_entries_page_db(year, page):
+    # keyed on the entry's own created_at/id; `created_at` in the row stays
+    # the allocation's timestamp like get_budget_entries_db
+    return fetch_keyset_page(
+        BUDGET_ENTRIES_PAGE_SELECT,
+        page,
+        where="ba.year = %s",
+        params=(year,),
+        created_col="be.created_at",
+        id_col="be.id",
+        created_key="entry_created_at",
+    )
+
+def count_budget_entries_db(year):
+    return fetch_all(BUDGET_ENTRIES_COUNT_QUERY, (year,))[0]["total"]
+
+
 def put_budget_entries_db(entry):
     try:
-        query = """
+        query = f"""
             UPDATE budget_entries
             SET
                 transaction_id = %s,
@@ -87,24 +170,29 @@ def put_budget_entries_db(entry):
                 dv_number = %s,
                 expenditure_program = %s,
                 program_description = %s,
-                remarks = %s
-            WHERE id = %s
+                remarks = %s,
+                {BUMP_ROW_VERSION}
+            WHERE id = %s AND {VERSION_MATCH}
         """
 
-        affected = execute_query(query, (
-            entry["transaction_id"],
-            entry["transaction_date"],
-            entry["category"],
-            entry.get("subcategory"),
-            entry["amount"],
-            entry.get("fund_source"),
-            entry.get("payee"),
-            entry.get("dv_number"),
-            entry.get("expenditure_program"),
-            entry.get("program_description"),
-            entry.get("remarks"),
-            entry["id"]
-        ))
+        with transaction(), track_ledger("budget_entries", "id", [entry["id"]]):
+            affected = execute_query(query, (
+                entry["transaction_id"],
+                entry["transaction_date"],
+                entry["category"],
+                entry.get("subcategory"),
+                entry["amount"],
+                entry.get("fund_source"),
+                entry.get("payee"),
+                entry.get("dv_number"),
+                entry.get("expenditure_program"),
+                entry.get("program_description"),
+                entry.get("remarks"),
+                entry["id"],
+                entry["row_version"]
+            ))
+            if affected:
+                publish_after_commit("updated", "budget_entries", [entry["id"]])
 
         return affected == 1
     except Exception as e:
@@ -114,7 +202,11 @@ def put_budget_entries_db(entry):
 def delete_budget_entries_db(entry_id):
     try:
         query = "DELETE FROM budget_entries WHERE id = %s"
-        affected = execute_query(query, (entry_id,))
+        with transaction(), track_ledger("budget_entries", "id", [entry_id]):
+            record_tombstones_db("budget_entries", [entry_id])
+            affected = execute_query(query, (entry_id,))
+            if affected:
+                publish_after_commit("deleted", "budget_entries", [entry_id])
         return affected == 1
     except Exception as e:
         print(f"Error deleting budget entry: {e}")
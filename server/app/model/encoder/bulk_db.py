@@ -0,0 +1,47 @@
+from app.config import Config
+from app.utils.execute_query import execute_many, fetch_all
+from app.database.unit_of_work import transaction
+from app.services.ledger_summary import track_ledger
+from app.services.events import publish_after_commit
+
+def existing_transaction_ids_db(table, transaction_ids):
+    # which of these transaction ids are already taken
+    found = set()
+    chunk_size = Config.BULK_INSERT_CHUNK_SIZE
+    for start in range(0, len(transaction_ids), chunk_size):
+        chunk = transaction_ids[start:start + chunk_size]
+        placeholders = ", ".join(["%s"] * len(chunk))
+        rows = fetch_all(
+            f"SELECT transaction_id FROM {table} WHERE transaction_id IN ({placeholders})",
+            tuple(chunk),
+        )
+        found.update(row["transaction_id"] for row in rows)
+    return found
+
+def existing_allocation_ids_db(allocation_ids):
+    # which of these budget allocation ids exist
+    rows = fetch_all(
+        f"SELECT id FROM budget_allocations WHERE id IN ({', '.join(['%s'] * len(allocation_ids))})",
+        tuple(allocation_ids),
+    )
+    return {row["id"] for row in rows}
+
+def insert_rows_db(table, query, params_list, transaction_ids):
+    # insert every row in one transaction, BULK_INSERT_CHUNK_SIZE rows per
+    # multi-row INSERT, and return {transaction_id: id}
+    ids = {}
+    chunk_size = Config.BULK_INSERT_CHUNK_SIZE
+    with transaction(), track_ledger(table, "transaction_id", transaction_ids, inserting=True):
+        for start in range(0, len(params_list), chunk_size):
+            chunk_ids = transaction_ids[start:start + chunk_size]
+            execute_many(query, params_list[start:start + chunk_size], name=f"{table}.bulk_insert")
+            # transaction_id is unique, so it maps each row to its new id
+            placeholders = ", ".join(["%s"] * len(chunk_ids))
+            rows = fetch_all(
+                f"SELECT id, transaction_id FROM {table} WHERE transaction_id IN ({placeholders})",
+                tuple(chunk_ids),
+            )
+            ids.update((row["transaction_id"], row["id"]) for row in rows)
+        # one event for the whole batch
+        publish_after_commit("created", table, list(ids.values()), transaction_ids=list(ids))
+    return ids
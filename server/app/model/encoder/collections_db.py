@@ -1,59 +1,104 @@
 from app.utils.execute_query import execute_query
-from app.utils.execute_query import fetch_all
+from app.utils.execute_query import fetch_all, fetch_rowset, iter_rows
+from app.utils.pagination import fetch_keyset_page, build_keyset_query
+from app.database.query_registry import register_query, SAMPLE_PAGE, SAMPLE_RANGE
+from app.database.unit_of_work import transaction
+from app.model.changes_db import record_tombstones_db
+from app.model.row_version_db import BUMP_ROW_VERSION, VERSION_MATCH
+from app.services.ledger_summary import track_ledger
+from app.services.events import publish_after_commit
+from app.model.encoder.bulk_db import insert_rows_db
 
-from app.utils.execute_query import execute_query
+COLLECTION_LIST_QUERY = """
+    SELECT *
+    FROM collections
+    ORDER BY created_at DESC
+"""
+
+COLLECTION_PAGE_SELECT = "SELECT * FROM collections"
+
+COLLECTION_DATE_RANGE_QUERY = """
+    SELECT * FROM collections
+    WHERE transaction_date >= %s
+    AND transaction_date < DATE_ADD(%s, INTERVAL 1 DAY)
+"""
+
+register_query("collections.page", *build_keyset_query(COLLECTION_PAGE_SELECT, SAMPLE_PAGE))
+register_query("collections.date_range", COLLECTION_DATE_RANGE_QUERY, SAMPLE_RANGE)
+
+COLLECTION_INSERT_QUERY = """
+    INSERT INTO collections (
+        transaction_id,
+        transaction_date,
+        nature_of_collection,
+        description,
+        fund_source,
+        amount,
+        payor,
+        or_number,
+        remarks,
+        created_by
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+def collection_insert_params(collection):
+    return (
+        collection["transaction_id"],
+        collection["transaction_date"],
+        collection.get("nature_of_collection"),
+        collection.get("description"),
+        collection.get("fund_source"),
+        collection["amount"],
+        collection.get("payor"),
+        collection.get("or_number"),
+        collection.get("remarks"),
+        collection["created_by"]
+    )
 
 def insert_collection_db(collection):
     try:
-        query = """
-            INSERT INTO collections (
-                transaction_id,
-                transaction_date,
-                nature_of_collection,
-                description,
-                fund_source,
-                amount,
-                payor,
-                or_number,
-                remarks,
-                created_by
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
+        params = collection_insert_params(collection)
 
-        params = (
-            collection["transaction_id"],
-            collection["transaction_date"],
-            collection.get("nature_of_collection"),
-            collection.get("description"),
-            collection.get("fund_source"),
-            collection["amount"],
-            collection.get("payor"),
-            collection.get("or_number"),
-            collection.get("remarks"),
-            collection["created_by"]
-        )
-
-        return execute_query(query, params) == 1
+        with transaction(), track_ledger("collections", "transaction_id", [collection["transaction_id"]], inserting=True):
+            affected = execute_query(COLLECTION_INSERT_QUERY, params)
+            if affected:
+                publish_after_commit("created", "collections", transaction_ids=[collection["transaction_id"]])
+        return affected == 1
     except Exception as e:
         print(f"Error inserting collection: {e}")
         return False
 
+def insert_collections_bulk_db(collections):
+    # all or nothing; returns {transaction_id: id}
+    return insert_rows_db(
+        "collections",
+        COLLECTION_INSERT_QUERY,
+        [collection_insert_params(c) for c in collections],
+        [c["transaction_id"] for c in collections],
+    )
+
 def get_collection_db():
     try:
-        query = """
-            SELECT *
-            FROM collections
-            ORDER BY created_at DESC
-        """
-        return fetch_all(query)
+        return fetch_rowset(COLLECTION_LIST_QUERY)
     except Exception as e:
         print(e)
         return None
 
+def iter_collection_db():
+    # streamed variant of get_collection_db for large responses
+    return iter_rows(COLLECTION_LIST_QUERY)
+
+def get_collection_page_db(page):
+    # one keyset page, newest first (see app.utils.pagination)
+    return fetch_keyset_page(COLLECTION_PAGE_SELECT, page)
+
+def count_collection_db():
+    return fetch_all("SELECT COUNT(*) AS total FROM collections")[0]["total"]
+
 def put_collection_db(collection):
     try:
-        query = """
+        query = f"""
             UPDATE collections
             SET
                 transaction_id = %s,
@@ -64,22 +109,27 @@ def put_collection_db(collection):
                 amount = %s,
                 payor = %s,
                 or_number = %s,
-                remarks = %s
-            WHERE id = %s
+                remarks = %s,
+                {BUMP_ROW_VERSION}
+            WHERE id = %s AND {VERSION_MATCH}
         """
 
-        affected = execute_query(query, (
-            collection["transaction_id"],
-            collection["transaction_date"],
-            collection.get("nature_of_collection"),
-            collection.get("description"),
-            collection.get("fund_source"),
-            collection["amount"],
-            collection.get("payor"),
-            collection.get("or_number"),
-            collection.get("remarks"),
-            collection["id"]  # collection primary key
-        ))
+        with transaction(), track_ledger("collections", "id", [collection["id"]]):
+            affected = execute_query(query, (
+                collection["transaction_id"],
+                collection["transaction_date"],
+                collection.get("nature_of_collection"),
+                collection.get("description"),
+                collection.get("fund_source"),
+                collection["amount"],
+                collection.get("payor"),
+                collection.get("or_number"),
+                collection.get("remarks"),
+                collection["id"],  # collection primary key
+                collection["row_version"]
+            ))
+            if affected:
+                publish_after_commit("updated", "collections", [collection["id"]])
 
         return affected == 1
 
@@ -89,16 +139,16 @@ def put_collection_db(collection):
 
 def delete_collection_db(collection_id):
     query = "DELETE FROM collections WHERE id = %s"
-    return execute_query(query, (collection_id,)) == 1
+    with transaction(), track_ledger("collections", "id", [collection_id]):
+        record_tombstones_db("collections", [collection_id])
+        affected = execute_query(query, (collection_id,))
+        if affected:
+            publish_after_commit("deleted", "collections", [collection_id])
+    return affected == 1
 
 def get_data_base_date_collection_db(start_date, end_date):
     try:
-        query = """
-            SELECT * FROM collections
-            WHERE transaction_date >= %s
-            AND transaction_date < DATE_ADD(%s, INTERVAL 1 DAY)
-        """
-        return fetch_all(query, (start_date, end_date))
+        return fetch_all(COLLECTION_DATE_RANGE_QUERY, (start_date, end_date))
     except Exception as e:
         print("Error getting collections:", e)
         return []
\ No newline at end of file
@@ -1,5 +1,20 @@
 from app.database.connection import get_db_connection
-from app.utils.execute_query import execute_query, fetch_all
+from app.utils.execute_query import execute_query, fetch_all, fetch_rowset, iter_rows
+from app.utils.pagination import fetch_keyset_page, build_keyset_query
+from app.database.query_registry import register_query, SAMPLE_PAGE
+from app.database.unit_of_work import transaction
+from app.model.changes_db import record_tombstones_db
+from app.model.row_version_db import BUMP_ROW_VERSION, VERSION_MATCH
+from app.services.ledger_summary import track_ledger
+from app.services.events import publish_after_commit
+
+DFUR_LIST_QUERY = """ 
+    SELECT * FROM dfur_projects;
+"""
+
+DFUR_PAGE_SELECT = "SELECT * FROM dfur_projects"
+
+register_query("dfur_projects.page", *build_keyset_query(DFUR_PAGE_SELECT, SAMPLE_PAGE))
 
 def insert_dfur_db(data):
     try:
@@ -33,7 +48,11 @@ def insert_dfur_db(data):
             data['no_extensions'],
             data['remarks']
         )
-        return execute_query(query, params)
+        with transaction(), track_ledger("dfur_projects", "transaction_id", [data['transaction_id']], inserting=True):
+            affected = execute_query(query, params)
+            if affected:
+                publish_after_commit("created", "dfur_projects", transaction_ids=[data['transaction_id']])
+        return affected
     except Exception as e:
         print("Insert DFRU error:", e)
         return False
@@ -42,18 +61,26 @@ def insert_dfur_db(data):
 def get_all_dfur_db():
     try:
         ...
-        query = """ 
-            SELECT * FROM dfur_projects;
-        """
-        return fetch_all(query)
+        return fetch_rowset(DFUR_LIST_QUERY)
     except Exception as e:
         print("Get all DFRU error:", e)
         return None
+
+def iter_dfur_db():
+    # streamed variant of get_all_dfur_db for large responses
+    return iter_rows(DFUR_LIST_QUERY)
+
+def get_dfur_page_db(page):
+    # one keyset page, newest first (see app.utils.pagination)
+    return fetch_keyset_page(DFUR_PAGE_SELECT, page)
+
+def count_dfur_db():
+    return fetch_all("SELECT COUNT(*) AS total FROM dfur_projects")[0]["total"]
     
 def put_dfur_db(data):
    try:
        ...
-       query = """
+       query = f"""
            UPDATE dfur_projects SET
                transaction_id = %s,
                transaction_date = %s,
@@ -67,8 +94,9 @@ def put_dfur_db(data):
                status = %s,
                no_extensions = %s,
                remarks = %s,
-               is_active = %s
-           WHERE id = %s;
+               is_active = %s,
+               {BUMP_ROW_VERSION}
+           WHERE id = %s AND {VERSION_MATCH};
        """
        params = (
            data['transaction_id'],
@@ -84,9 +112,14 @@ def put_dfur_db(data):
            data['no_extensions'],
            data['remarks'],
            data['is_active'],
-           data['id']
+           data['id'],
+           data['row_version']
        )
-       return execute_query(query, params)
+       with transaction(), track_ledger("dfur_projects", "id", [data['id']]):
+           affected = execute_query(query, params)
+           if affected:
+               publish_after_commit("updated", "dfur_projects", [data['id']])
+       return affected
    except Exception as e:
        print("Update DFRU error:", e)
        return False
@@ -98,7 +131,12 @@ def delete_dfur_db(id):
            WHERE id = %s;
        """
        params = (id,)
-       return execute_query(query, params)
+       with transaction(), track_ledger("dfur_projects", "id", [id]):
+           record_tombstones_db("dfur_projects", [id])
+           affected = execute_query(query, params)
+           if affected:
+               publish_after_commit("deleted", "dfur_projects", [id])
+       return affected
    except Exception as e:
        print("Delete DFRU error:", e)
        return False
\ No newline at end of file
@@ -1,63 +1,108 @@
 from app.utils.execute_query import execute_query
-from app.utils.execute_query import fetch_all
+from app.utils.execute_query import fetch_all, fetch_rowset, iter_rows
+from app.utils.pagination import fetch_keyset_page, build_keyset_query
+from app.database.query_registry import register_query, SAMPLE_PAGE, SAMPLE_RANGE
+from app.database.unit_of_work import transaction
+from app.model.changes_db import record_tombstones_db
+from app.model.row_version_db import BUMP_ROW_VERSION, VERSION_MATCH
+from app.services.ledger_summary import track_ledger
+from app.services.events import publish_after_commit
+from app.model.encoder.bulk_db import insert_rows_db
 
-from app.utils.execute_query import execute_query
+DISBURSEMENT_LIST_QUERY = """
+    SELECT *
+    FROM disbursements
+    ORDER BY created_at DESC
+"""
+
+DISBURSEMENT_PAGE_SELECT = "SELECT * FROM disbursements"
+
+DISBURSEMENT_DATE_RANGE_QUERY = """
+    SELECT * FROM disbursements
+    WHERE transaction_date >= %s
+    AND transaction_date < DATE_ADD(%s, INTERVAL 1 DAY)
+"""
+
+register_query("disbursements.page", *build_keyset_query(DISBURSEMENT_PAGE_SELECT, SAMPLE_PAGE))
+register_query("disbursements.date_range", DISBURSEMENT_DATE_RANGE_QUERY, SAMPLE_RANGE)
+
+DISBURSEMENT_INSERT_QUERY = """
+    INSERT INTO disbursements (
+        transaction_id,
+        transaction_date,
+        nature_of_disbursement,
+        description,
+        fund_source,
+        amount,
+        payee,
+        or_number,
+        remarks,
+        created_by,
+        allocation_id
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+def disbursement_insert_params(disbursement):
+    return (
+       disbursement["transaction_id"],
+       disbursement["transaction_date"],
+       disbursement.get("nature_of_disbursement"),
+       disbursement.get("description"),
+       disbursement.get("fund_source"),
+       disbursement["amount"],
+       disbursement.get("payee"),
+       disbursement.get("or_number"),
+       disbursement.get("remarks"),
+       disbursement["created_by"],
+       disbursement["allocation_id"]
+    )
 
 def insert_disbursement_db(disbursement):
     ...
     try:
         ...
-        query = """
-            INSERT INTO disbursements (
-                transaction_id,
-                transaction_date,
-                nature_of_disbursement,
-                description,
-                fund_source,
-                amount,
-                payee,
-                or_number,
-                remarks,
-                created_by,
-                allocation_id  
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-
-        params = (
-           disbursement["transaction_id"],
-           disbursement["transaction_date"],
-           disbursement.get("nature_of_disbursement"),
-           disbursement.get("description"),
-           disbursement.get("fund_source"),
-           disbursement["amount"],
-           disbursement.get("payee"),
-           disbursement.get("or_number"),
-           disbursement.get("remarks"),
-           disbursement["created_by"],
-           disbursement["allocation_id"]
-        )
+        params = disbursement_insert_params(disbursement)
 
-        return execute_query(query, params) == 1
+        with transaction(), track_ledger("disbursements", "transaction_id", [disbursement["transaction_id"]], inserting=True):
+            affected = execute_query(DISBURSEMENT_INSERT_QUERY, params)
+            if affected:
+                publish_after_commit("created", "disbursements", transaction_ids=[disbursement["transaction_id"]])
+        return affected == 1
     except Exception as e:
         print(e)
         return False
 
+def insert_disbursements_bulk_db(disbursements):
+    # all or nothing; returns {transaction_id: id}
+    return insert_rows_db(
+        "disbursements",
+        DISBURSEMENT_INSERT_QUERY,
+        [disbursement_insert_params(d) for d in disbursements],
+        [d["transaction_id"] for d in disbursements],
+    )
+
 def get_disbursement_db():
     try:
-        query = """
-            SELECT *
-            FROM disbursements
-            ORDER BY created_at DESC
-        """
-        return fetch_all(query)
+        return fetch_rowset(DISBURSEMENT_LIST_QUERY)
     except Exception as e:
         print(e)
         return None
 
+def iter_disbursement_db():
+    # streamed variant of get_disbursement_db for large responses
+    return iter_rows(DISBURSEMENT_LIST_QUERY)
+
+def get_disbursement_page_db(page):
+    # one keyset page, newest first (see app.utils.pagination)
+    return fetch_keyset_page(DISBURSEMENT_PAGE_SELECT, page)
+
+def count_disbursement_db():
+    return fetch_all("SELECT COUNT(*) AS total FROM disbursements")[0]["total"]
+
 def put_disbursement_db(disbursement):
     try:
-        query = """
+        query = f"""
             UPDATE disbursements
             SET
                 transaction_id = %s,
@@ -68,8 +113,9 @@ def put_disbursement_db(disbursement):
                 amount = %s,
                 payee = %s,
                 or_number = %s,
-                remarks = %s
-            WHERE id = %s
+                remarks = %s,
+                {BUMP_ROW_VERSION}
+            WHERE id = %s AND {VERSION_MATCH}
         """
         params = (
             disbursement["transaction_id"],
@@ -81,10 +127,15 @@ def put_disbursement_db(disbursement):
             disbursement.get("payee"),
             disbursement.get("or_number"),
             disbursement.get("remarks"),
-            disbursement["id"]  # disbursement primary key
+            disbursement["id"],  # disbursement primary key
+            disbursement["row_version"]
         )
         
-        return execute_query(query, params) == 1
+        with transaction(), track_ledger("disbursements", "id", [disbursement["id"]]):
+            affected = execute_query(query, params)
+            if affected:
+                publish_after_commit("updated", "disbursements", [disbursement["id"]])
+        return affected == 1
 
 
     except Exception as e:
@@ -93,16 +144,16 @@ def put_disbursement_db(disbursement):
 
 def delete_disbursement_db(disbursement_id):
     query = "DELETE FROM disbursements WHERE id = %s"
-    return execute_query(query, (disbursement_id,)) == 1
+    with transaction(), track_ledger("disbursements", "id", [disbursement_id]):
+        record_tombstones_db("disbursements", [disbursement_id])
+        affected = execute_query(query, (disbursement_id,))
+        if affected:
+            publish_after_commit("deleted", "disbursements", [disbursement_id])
+    return affected == 1
 
 def get_data_base_date_disbursement_db(start_date, end_date):
     try:
-        query = """
-            SELECT * FROM disbursements
-            WHERE transaction_date >= %s
-            AND transaction_date < DATE_ADD(%s, INTERVAL 1 DAY)
-        """
-        return fetch_all(query, (start_date, end_date))
+        return fetch_all(DISBURSEMENT_DATE_RANGE_QUERY, (start_date, end_date))
     except Exception as e:
         print("Error getting disbursements:", e)
         return []
\ No newline at end of file
@@ -0,0 +1,118 @@
+from app.utils.execute_query import iter_rows
+
+# Exportable ledgers: the columns a caller may pick (name -> SQL expression)
+# in their default order, and the date column the range applies to.
+# Nothing outside these whitelists ever reaches the SQL text.
+EXPORT_TABLES = {
+    "collections": {
+        "from": "collections",
+        "date": "transaction_date",
+        "id": "id",
+        "columns": {
+            "id": "id",
+            "transaction_id": "transaction_id",
+            "transaction_date": "transaction_date",
+            "nature_of_collection": "nature_of_collection",
+            "description": "description",
+            "fund_source": "fund_source",
+            "amount": "amount",
+            "payor": "payor",
+            "or_number": "or_number",
+            "remarks": "remarks",
+            "review_status": "review_status",
+            "is_flagged": "is_flagged",
+            "review_comment": "review_comment",
+            "created_by": "created_by",
+            "created_at": "created_at",
+        },
+    },
+    "disbursements": {
+        "from": "disbursements",
+        "date": "transaction_date",
+        "id": "id",
+        "columns": {
+            "id": "id",
+            "transaction_id": "transaction_id",
+            "transaction_date": "transaction_date",
+            "nature_of_disbursement": "nature_of_disbursement",
+            "description": "description",
+            "fund_source": "fund_source",
+            "amount": "amount",
+            "payee": "payee",
+            "or_number": "or_number",
+            "remarks": "remarks",
+            "allocation_id": "allocation_id",
+            "review_status": "review_status",
+            "is_flagged": "is_flagged",
+            "review_comment": "review_comment",
+            "created_by": "created_by",
+            "created_at": "created_at",
+        },
+    },
+    "budget_entries": {
+        "from": "budget_entries be JOIN budget_allocations ba ON be.allocation_id = ba.id",
+        "date": "be.transaction_date",
+        "id": "be.id",
+        "columns": {
+            "id": "be.id",
+            "transaction_id": "be.transaction_id",
+            "transaction_date": "be.transaction_date",
+            "allocation_category": "ba.category",
+            "year": "ba.year",
+            "category": "be.category",
+            "subcategory": "be.subcategory",
+            "amount": "be.amount",
+            "fund_source": "be.fund_source",
+            "payee": "be.payee",
+            "dv_number": "be.dv_number",
+            "expenditure_program": "be.expenditure_program",
+            "program_description": "be.program_description",
+            "remarks": "be.remarks",
+            "created_by": "be.created_by",
+            "created_at": "be.created_at",
+        },
+    },
+    "dfur_projects": {
+        "from": "dfur_projects",
+        "date": "transaction_date",
+        "id": "id",
+        "columns": {
+            "id": "id",
+            "transaction_id": "transaction_id",
+            "transaction_date": "transaction_date",
+            "name_of_collection": "name_of_collection",
+            "project": "project",
+            "location": "location",
+            "total_cost_approved": "total_cost_approved",
+            "total_cost_incurred": "total_cost_incurred",
+            "date_started": "date_started",
+            "target_completion_date": "target_completion_date",
+            "status": "status",
+            "no_extensions": "no_extensions",
+            "remarks": "remarks",
+            "review_status": "review_status",
+            "is_flagged": "is_flagged",
+            "created_at": "created_at",
+        },
+    },
+}
+
+def iter_export_db(table, columns, start_date=None, end_date=None):
+    # tuples in `columns` order, oldest first, from an unbuffered cursor
+    spec = EXPORT_TABLES[table]
+    select = ", ".join(f"{spec['columns'][name]} AS {name}" for name in columns)
+
+    conditions = []
+    params = []
+    if start_date:
+        conditions.append(f"{spec['date']} >= %s")
+        params.append(start_date)
+    if end_date:
+        conditions.append(f"{spec['date']} < DATE_ADD(%s, INTERVAL 1 DAY)")
+        params.append(end_date)
+
+    query = f"SELECT {select} FROM {spec['from']}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += f" ORDER BY {spec['date']}, {spec['id']}"
+    return iter_rows(query, tuple(params), dictionary=False, name=f"{table}.export")
@@ -0,0 +1,81 @@
+from app.config import Config
+from app.utils.execute_query import execute_query, fetch_all
+from app.database.unit_of_work import transaction
+
+# A running job's updated_at is its lease: every checkpoint renews it, and a
+# job left `running` longer than IMPORT_STALE_MINUTES belonged to a worker
+# that died, so claim_import_job_db may hand it to another one.
+STALE_RUNNING = "(status = 'running' AND updated_at < NOW() - INTERVAL %s MINUTE)"
+
+# columns update_import_job_db may set
+IMPORT_JOB_FIELDS = (
+    "status",
+    "last_row",
+    "inserted_rows",
+    "failed_rows",
+    "error_report_path",
+    "message",
+)
+
+def insert_import_job_db(job):
+    query = """
+        INSERT INTO import_jobs (
+            table_name,
+            file_name,
+            file_path,
+            file_format,
+            column_mapping,
+            created_by
+        )
+        VALUES (%s, %s, %s, %s, %s, %s)
+    """
+    params = (
+        job["table_name"],
+        job["file_name"],
+        job["file_path"],
+        job["file_format"],
+        job.get("column_mapping"),
+        job["created_by"],
+    )
+    with transaction():
+        execute_query(query, params)
+        return fetch_all("SELECT LAST_INSERT_ID() AS id")[0]["id"]
+
+def get_import_job_db(job_id):
+    # stale: 1 when the job is running but its lease ran out
+    rows = fetch_all(
+        f"SELECT *, {STALE_RUNNING} AS stale FROM import_jobs WHERE id = %s",
+        (Config.IMPORT_STALE_MINUTES, job_id),
+    )
+    return rows[0] if rows else None
+
+def update_import_job_db(job_id, **fields):
+    columns = [name for name in fields if name in IMPORT_JOB_FIELDS]
+    if not columns:
+        return 0
+    assignments = ", ".join(f"{name} = %s" for name in columns)
+    params = tuple(fields[name] for name in columns) + (job_id,)
+    return execute_query(
+        f"UPDATE import_jobs SET {assignments}, updated_at = CURRENT_TIMESTAMP WHERE id = %s",
+        params,
+    )
+
+def checkpoint_import_job_db(job_id, previous_row, last_row, inserted_rows, failed_rows):
+    # advance the checkpoint and renew the lease; 0 when the checkpoint moved
+    # since this worker read it (a stale job another worker took over)
+    query = """
+        UPDATE import_jobs
+        SET last_row = %s, inserted_rows = %s, failed_rows = %s,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = %s AND status = 'running' AND last_row = %s
+    """
+    return execute_query(query, (last_row, inserted_rows, failed_rows, job_id, previous_row))
+
+def claim_import_job_db(job_id):
+    # pending/failed/stale running -> running; 0 when a live worker runs it
+    query = f"""
+        UPDATE import_jobs
+        SET status = 'running', message = NULL, updated_at = CURRENT_TIMESTAMP
+        WHERE id = %s AND (status IN ('pending', 'failed') OR {STALE_RUNNING})
+    """
+    return execute_query(query, (job_id, Config.IMPORT_STALE_MINUTES))
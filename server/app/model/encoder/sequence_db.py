@@ -0,0 +1,38 @@
+from app.utils.execute_query import execute_query, fetch_all
+from app.database.unit_of_work import transaction
+
+# ledger table behind each transaction id prefix (used to seed a new counter)
+PREFIX_TABLES = {
+    "COLL": "collections",
+    "DISB": "disbursements",
+    "BUDG": "budget_entries",
+    "DFUR": "dfur_projects",
+}
+
+def reserve_sequence_db(prefix, year, count=1):
+    # atomically reserve `count` consecutive numbers for prefix/year and
+    # return the first one. The counter row is incremented in place with
+    # LAST_INSERT_ID(expr), so concurrent callers never get the same number.
+    increment = """
+        UPDATE transaction_sequences
+        SET last_value = LAST_INSERT_ID(last_value + %s)
+        WHERE prefix = %s AND year = %s
+    """
+    with transaction():
+        if execute_query(increment, (count, prefix, year)) == 0:
+            # first id of the year: start after the highest number already
+            # used so existing rows never collide (runs once per prefix/year)
+            seed = f"""
+                INSERT INTO transaction_sequences (prefix, year, last_value)
+                SELECT %s, %s, LAST_INSERT_ID(
+                    COALESCE(MAX(CAST(SUBSTRING_INDEX(transaction_id, '-', -1) AS UNSIGNED)), 0) + %s
+                )
+                FROM {PREFIX_TABLES[prefix]}
+                WHERE transaction_id LIKE %s
+                ON DUPLICATE KEY UPDATE last_value = LAST_INSERT_ID(last_value + %s)
+            """
+            execute_query(seed, (prefix, year, count, f"{prefix}-{year}-%", count))
+
+        last_value = fetch_all("SELECT LAST_INSERT_ID() AS last_value")[0]["last_value"]
+
+    return int(last_value) - count + 1
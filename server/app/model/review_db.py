@@ -0,0 +1,145 @@
+from app.config import Config
+from app.utils.execute_query import execute_query, fetch_all
+from app.database.unit_of_work import transaction
+from app.services.ledger_summary import track_ledger
+from app.services.events import publish_after_commit, review_event_type
+from app.model.row_version_db import BUMP_ROW_VERSION
+
+# Set-based review updates (bulk approve / bulk flag). The selected rows are
+# locked and checked first, so the outcome reported for every id matches
+# what the single UPDATE ... WHERE id IN (...) changed: rows whose status
+# moved on since the reviewer loaded them are skipped, not overwritten.
+
+# approval_type / flag_type -> table
+REVIEW_TABLES = {
+    "collection": "collections",
+    "disbursement": "disbursements",
+    "dfur": "dfur_projects",
+}
+REVIEW_STATUSES = ("pending", "approved", "rejected")
+
+def review_ids_by_filter_db(table, review_status, start_date=None, end_date=None, flagged=None):
+    # ids in a transaction_date range that are still in `review_status`
+    conditions = ["review_status = %s"]
+    params = [review_status]
+    if start_date:
+        conditions.append("transaction_date >= %s")
+        params.append(start_date)
+    if end_date:
+        conditions.append("transaction_date < DATE_ADD(%s, INTERVAL 1 DAY)")
+        params.append(end_date)
+    if flagged is not None:
+        conditions.append("is_flagged = %s")
+        params.append(1 if flagged else 0)
+    params.append(Config.BULK_REVIEW_MAX_ROWS + 1)
+    rows = fetch_all(
+        f"SELECT id FROM {table} WHERE {' AND '.join(conditions)} ORDER BY id LIMIT %s",
+        tuple(params),
+        name=f"{table}.review_filter",
+    )
+    return [row["id"] for row in rows]
+
+def select_review_ids_db(table, data, expected_status, flagged=None):
+    # ids named in a validated selection (see validate_review_selection)
+    if data.get("ids") is not None:
+        return list(dict.fromkeys(data["ids"]))
+    ids = review_ids_by_filter_db(table, expected_status, flagged=flagged, **data["filter"])
+    if len(ids) > Config.BULK_REVIEW_MAX_ROWS:
+        raise ValueError(f"Filter matches more than {Config.BULK_REVIEW_MAX_ROWS} rows; narrow the date range")
+    return ids
+
+def _lock_review_rows(table, ids):
+    placeholders = ", ".join(["%s"] * len(ids))
+    rows = fetch_all(
+        f"""
+        SELECT id, review_status, is_flagged, row_version,
+               IF(claim_expires_at >= NOW(6), claimed_by, NULL) AS claimed_by
+        FROM {table} WHERE id IN ({placeholders}) FOR UPDATE
+        """,
+        tuple(ids),
+        name=f"{table}.review_lock",
+    )
+    return {row["id"]: row for row in rows}
+
+def _outcomes(ids, current, eligible, reason):
+    results = []
+    for row_id in ids:
+        row = current.get(row_id)
+        if row is None:
+            results.append({"id": row_id, "outcome": "not_found"})
+        elif row_id in eligible:
+            results.append({"id": row_id, "outcome": "updated"})
+        else:
+            results.append({
+                "id": row_id,
+                "outcome": "skipped",
+                "reason": reason(row),
+                "review_status": row["review_status"],
+                "is_flagged": bool(row["is_flagged"]),
+                "claimed_by": row["claimed_by"],
+                "row_version": row["row_version"],
+            })
+    return results
+
+def summarize_outcomes(results):
+    summary = {"updated": 0, "skipped": 0, "not_found": 0}
+    for result in results:
+        summary[result["outcome"]] += 1
+    return {**summary, "results": results}
+
+def bulk_review_status_db(table, ids, review_status, expected_status="pending"):
+    # review_status on every row still in expected_status; one UPDATE
+    with transaction():
+        current = _lock_review_rows(table, ids)
+        eligible = [i for i in ids if i in current and current[i]["review_status"] == expected_status]
+        if eligible:
+            placeholders = ", ".join(["%s"] * len(eligible))
+            with track_ledger(table, "id", eligible):
+                execute_query(
+                    f"""
+                    UPDATE {table}
+                    SET review_status = %s, {BUMP_ROW_VERSION}
+                    WHERE id IN ({placeholders}) AND review_status = %s
+                    """,
+                    (review_status, *eligible, expected_status),
+                    name=f"{table}.bulk_review",
+                )
+            publish_after_commit(review_event_type(review_status), table, eligible, review_status=review_status)
+    return _outcomes(ids, current, set(eligible), lambda row: "status_changed")
+
+def bulk_flag_db(table, ids, reviewed_by, comment, expected_status="pending"):
+    # flag every unflagged row still in expected_status; one UPDATE
+    with transaction():
+        current = _lock_review_rows(table, ids)
+        eligible = [
+            i for i in ids
+            if i in current and not current[i]["is_flagged"] and current[i]["review_status"] == expected_status
+            # not claimed by another checker (see review_queue_db)
+            and current[i]["claimed_by"] in (None, int(reviewed_by))
+        ]
+        if eligible:
+            placeholders = ", ".join(["%s"] * len(eligible))
+            with track_ledger(table, "id", eligible):
+                execute_query(
+                    f"""
+                    UPDATE {table}
+                    SET
+                        is_flagged = 1,
+                        review_comment = %s,
+                        reviewed_by = %s,
+                        reviewed_at = NOW(),
+                        claimed_by = NULL,
+                        claim_expires_at = NULL,
+                        {BUMP_ROW_VERSION}
+                    WHERE id IN ({placeholders}) AND is_flagged = 0 AND review_status = %s
+                    """,
+                    (comment, reviewed_by, *eligible, expected_status),
+                    name=f"{table}.bulk_flag",
+                )
+            publish_after_commit("flagged", table, eligible)
+    return _outcomes(
+        ids, current, set(eligible),
+        lambda row: "already_flagged" if row["is_flagged"]
+        else "status_changed" if row["review_status"] != expected_status
+        else "claimed",
+    )
@@ -0,0 +1,18 @@
+from app.utils.execute_query import fetch_all
+
+# Optimistic concurrency for ledger rows (migration 0007). Writers add
+# BUMP_ROW_VERSION to the SET list and VERSION_MATCH to the WHERE clause, so
+# an update only lands on the version the client loaded and every write that
+# lands changes the row (affected rows is 1 even when no field changed).
+
+VERSIONED_TABLES = ("collections", "disbursements", "budget_entries", "dfur_projects")
+
+BUMP_ROW_VERSION = "row_version = row_version + 1"
+VERSION_MATCH = "row_version = %s"
+
+def get_current_row_db(table, row_id):
+    # the row as it is now, sent back with a 409
+    if table not in VERSIONED_TABLES:
+        raise ValueError(f"Unknown table: {table}")
+    rows = fetch_all(f"SELECT * FROM {table} WHERE id = %s", (row_id,))
+    return rows[0] if rows else None
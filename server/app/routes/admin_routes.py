@@ -1,4 +1,5 @@
 from flask import Blueprint
+from app.middleware.conditional_get import conditional_get
 from app.controllers.admin_controller import (
     get_all_users_controller,
     add_user_controller,
@@ -10,6 +11,7 @@ from app.controllers.admin_controller import (
 admin_bp = Blueprint("admin_bp", __name__)
 
 @admin_bp.route("get-all-users", methods=["GET"])
+@conditional_get("users")
 def get_all_users():
     return get_all_users_controller()
 
@@ -34,5 +36,9 @@ def delete_user():
     return delete_user_controller()
 
 @admin_bp.route('get-all-docs', methods=['GET'])
+@conditional_get("budget_allocations", "budget_entries", "collections", "dfur_projects", "disbursements")
 def get_all_docs():
+    # newest first, paged: ?limit=50&cursor=<X-Next-Cursor>
+    # filters: ?type=collection,disbursement,budget_entry,dfur ?year=2026
+    #          ?status=pending|approved|rejected|flagged
     return get_all_docs_controller()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from flask import Blueprint
-from app.controllers.approver_controller import approver_controller
+from app.controllers.approver_controller import approver_controller, bulk_approver_controller
 
 approver_bp = Blueprint('approver_bp', __name__)
 
@@ -9,6 +9,22 @@ def post_approver():
     {
         "collection_id": 1,
         "review_status": "approved",
-        "approval_type": "collection"
+        "approval_type": "collection",
+        "row_version": 3
     }
-    return approver_controller()
\ No newline at end of file
+    # row_version: the value the row was loaded with; 409 + {"current": row} if it changed since
+    return approver_controller()
+
+@approver_bp.route('/put-approval/bulk', methods=['POST'])
+def post_approver_bulk():
+    # one UPDATE for the whole selection, inside one transaction
+    # {
+    #     "approval_type": "collection",
+    #     "review_status": "approved",
+    #     "ids": [1, 2, 3]
+    #       or "filter": {"start_date": "2026-01-01", "end_date": "2026-01-31"},
+    #     "expected_status": "pending"   (optional; rows in another status are skipped)
+    # }
+    # -> {"updated": 2, "skipped": 1, "not_found": 0,
+    #     "results": [{"id": 1, "outcome": "updated"}, ...]}
+    return bulk_approver_controller()
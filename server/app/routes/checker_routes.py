@@ -1,6 +1,10 @@
 from flask import Blueprint
 from app.controllers.checker_controller import (
     insert_flag_comment_controller,
+    bulk_flag_comment_controller,
+    claim_review_queue_controller,
+    get_review_claims_controller,
+    update_review_claims_controller,
 )
 
 checker_bp = Blueprint('checker_bp', __name__)
@@ -26,4 +30,52 @@ def insert_flag_comment():
     #     "comment": "The project has been flagged due to missing supporting documents. Kindly submit the required attachments to proceed with approval.",
     #     "flag_type": "dfur"
     # }
+    # every payload also carries "row_version": the value the row was loaded
+    # with; 409 + {"current": row} if it changed since
     return insert_flag_comment_controller()
+
+@checker_bp.route('/put-flag-comment/bulk', methods=['POST'])
+def insert_flag_comment_bulk():
+    ...
+    # {
+    #     "flag_type": "collection",
+    #     "reviewed_by": 3,
+    #     "comment": "Missing supporting documents.",
+    #     "ids": [1, 2, 3]
+    #       or "filter": {"start_date": "2026-01-01", "end_date": "2026-01-31"},
+    #     "expected_status": "pending"   (optional)
+    # }
+    # already flagged rows, and rows no longer in expected_status, are skipped
+    return bulk_flag_comment_controller()
+
+# REVIEW QUEUE ============================================
+# pending, unflagged, unchecked collections / disbursements / DFUR projects,
+# oldest first. Claimed rows are hidden from other checkers until the lease
+# (REVIEW_CLAIM_SECONDS) runs out; /put-flag-comment on a row claimed by
+# someone else returns 409.
+@checker_bp.route('/review-queue/claim', methods=['POST'])
+def claim_review_queue():
+    # {"checker_id": 3, "limit": 10, "types": ["collection", "disbursement", "dfur"]}
+    # -> {"items": [{"type": "collection", "id": 1, "row": {...}}, ...], "lease_seconds": 900}
+    return claim_review_queue_controller()
+
+@checker_bp.route('/review-queue', methods=['GET'])
+def get_review_claims():
+    # ?checker_id=3 -> the checker's unexpired claims
+    return get_review_claims_controller()
+
+@checker_bp.route('/review-queue/renew', methods=['POST'])
+def renew_review_claims():
+    # {"checker_id": 3, "items": [{"type": "collection", "id": 1}]}
+    return update_review_claims_controller('renew')
+
+@checker_bp.route('/review-queue/release', methods=['POST'])
+def release_review_claims():
+    # hand items back to the queue unreviewed; same body as /renew
+    return update_review_claims_controller('release')
+
+@checker_bp.route('/review-queue/complete', methods=['POST'])
+def complete_review_claims():
+    # checked, nothing to flag: stamps reviewed_by / reviewed_at and removes
+    # the items from the queue; same body as /renew
+    return update_review_claims_controller('complete')
@@ -1,6 +1,14 @@
 from flask import Blueprint
-from app.controllers.db_test_controller import test_db_connection
+from app.controllers.db_test_controller import (
+    test_db_connection,
+    get_db_pool_stats_controller,
+    get_db_cache_stats_controller,
+    get_metrics_controller
+)
 
 db_test_bp = Blueprint("db_test_bp", __name__)
 
 db_test_bp.route("/test-db", methods=["GET"])(test_db_connection)
+db_test_bp.route("/db-pool-stats", methods=["GET"])(get_db_pool_stats_controller)
+db_test_bp.route("/db-cache-stats", methods=["GET"])(get_db_cache_stats_controller)
+db_test_bp.route("/metrics", methods=["GET"])(get_metrics_controller)
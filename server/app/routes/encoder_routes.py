@@ -1,4 +1,5 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint
+from app.middleware.conditional_get import conditional_get
 from app.controllers.encoder_controller import (
     insert_budget_entries_controller,
     get_budget_entries_controller,
@@ -18,7 +19,7 @@ from app.controllers.encoder_controller import (
     put_dfur_controller,
     delete_dfur_controller,
     generate_transaction_id_controller,
-    generate_11_digit_number_controller
+    bulk_insert_controller
 )
 
 encoder_bp = Blueprint('encoder_bp', __name__)
@@ -44,17 +45,28 @@ def post_budget_entries():
     # }
     return insert_budget_entries_controller()
 
+@encoder_bp.route('/post-budget-entries/bulk', methods=['POST'])
+def post_budget_entries_bulk():
+    ...
+    # [ { same fields as /post-budget-entries }, ... ]
+    # transaction_id may be omitted; one is assigned from the BUDG sequence
+    return bulk_insert_controller('budget_entries')
+
 @encoder_bp.route('/get-budget-entries', methods=['POST'])
 def view_budget_entries():
     ...
     #  {
     # "year": 2026
     # }
+    # optional keyset paging: ?limit=50&cursor=<X-Next-Cursor>&include_total=1
+    # optional ?shape=columnar -> {"columns": [...], "rows": [[...], ...]}
     return get_budget_entries_controller()
 
 @encoder_bp.route('/put-budget-entries', methods=['PUT'])
 def put_budget_entries():
     ...
+    # { same fields as /post-budget-entries, plus "id" and "row_version" }
+    # row_version: the value the row was loaded with; 409 + {"current": row} if it changed since
     return update_budget_entries_controller()
 
 @encoder_bp.route('/delete-budget-entries', methods=['DELETE'])
@@ -81,9 +93,20 @@ def insert_collection():
     # }
     return insert_collection_controller()
 
+@encoder_bp.route('/insert-collection/bulk', methods=['POST'])
+def insert_collection_bulk():
+    ...
+    # [ { same fields as /insert-collection }, ... ]
+    # transaction_id may be omitted; one is assigned from the COLL sequence
+    return bulk_insert_controller('collections')
+
 @encoder_bp.route('/get-collection', methods=['GET'])
+@conditional_get("collections")
 def view_collection():
     ...
+    # optional keyset paging: ?limit=50&cursor=<X-Next-Cursor>&include_total=1
+    # optional ?shape=columnar -> {"columns": [...], "rows": [[...], ...]}
+    # optional streaming: ?stream=json | ?stream=ndjson
     return get_collection_controller()
 
 @encoder_bp.route('/put-collection', methods=['PUT'])
@@ -100,7 +123,9 @@ def put_collection():
     # "payor": "Juan Dela Cruz",
     # "or_number": "OR-2026-0001",
     # "remarks": "Paid in cash",
+    # "row_version": 3
     # }
+    # row_version: the value the row was loaded with; 409 + {"current": row} if it changed since
     return put_collection_controller()
 
 @encoder_bp.route('/delete-collection', methods=['DELETE'])
@@ -131,9 +156,20 @@ def insert_disbursement():
     # }
     return insert_disbursement_controller()
 
+@encoder_bp.route('/insert-disbursement/bulk', methods=['POST'])
+def insert_disbursement_bulk():
+    ...
+    # [ { same fields as /insert-disbursement }, ... ]
+    # transaction_id may be omitted; one is assigned from the DISB sequence
+    return bulk_insert_controller('disbursements')
+
 @encoder_bp.route('/get-disbursement', methods=['GET'])
+@conditional_get("disbursements")
 def view_disbursement():
     ...
+    # optional keyset paging: ?limit=50&cursor=<X-Next-Cursor>&include_total=1
+    # optional ?shape=columnar -> {"columns": [...], "rows": [[...], ...]}
+    # optional streaming: ?stream=json | ?stream=ndjson
     return get_disbursement_controller()
 
 @encoder_bp.route('/put-disbursement', methods=['PUT'])
@@ -150,7 +186,9 @@ def put_disbursement():
     # "payor": "Juan Dela Cruz",
     # "or_number": "OR-2026-0001",
     # "remarks": "Paid in cash",
+    # "row_version": 3
     # }
+    # row_version: the value the row was loaded with; 409 + {"current": row} if it changed since
     return put_disbursement_controller()
 
 @encoder_bp.route('/delete-disbursement', methods=['DELETE'])
@@ -191,8 +229,12 @@ def insert_dfur_project():
     return insert_dfur_controller()
 
 @encoder_bp.route('/get-dfur-project', methods=['GET'])
+@conditional_get("dfur_projects")
 def get_dfur_project():
     ...
+    # optional keyset paging: ?limit=50&cursor=<X-Next-Cursor>&include_total=1
+    # optional ?shape=columnar -> {"columns": [...], "rows": [[...], ...]}
+    # optional streaming: ?stream=json | ?stream=ndjson
     return get_dfur_controller()
 
 @encoder_bp.route('/update-dfur-project', methods=['PUT'])
@@ -212,8 +254,10 @@ def update_dfur_project():
     #     "stats": "palnned",
     #     "no_extensions": 0,
     #     "remarks": "Project progressing on schedule; materials delivered",
-    #     "is_active": 1
+    #     "is_active": 1,
+    #     "row_version": 3
     # }
+    # row_version: the value the row was loaded with; 409 + {"current": row} if it changed since
     return put_dfur_controller()
 
 @encoder_bp.route('/delete-dfur-project', methods=['DELETE'])
@@ -225,33 +269,22 @@ def delete_dfur_project():
     return delete_dfur_controller()
 
 # generator
+# ?count=N reserves N consecutive ids (response adds "transaction_ids")
 @encoder_bp.route('/budget-entries/generate_id', methods=['GET'])
 def get_budget_entries_generator():
-    data = {}
-    data['transaction_id'] = generate_transaction_id_controller('BUDG', 'budget_entries')
-    data['div_number'] = generate_11_digit_number_controller()
-    return jsonify(data), 200
+    return generate_transaction_id_controller('BUDG')
 
 @encoder_bp.route('/collection/generate_id', methods=['GET'])
 def get_collection_generator():
     ...
-    data = {}
-    data['transaction_id'] = generate_transaction_id_controller('COLL', 'collection')
-    data['div_number'] = generate_11_digit_number_controller()
-    return jsonify(data), 200
+    return generate_transaction_id_controller('COLL')
 
 @encoder_bp.route('/disbursement/generate_id', methods=['GET'])
 def get_disbursement_generator():
     ...
-    data = {}
-    data['transaction_id'] = generate_transaction_id_controller('DISB', 'disbursement')
-    data['div_number'] = generate_11_digit_number_controller()
-    return jsonify(data), 200
+    return generate_transaction_id_controller('DISB')
 
 @encoder_bp.route('/dfur/generate_id', methods=['GET'])
 def get_dfur_generator():
     ...
-    data = {}
-    data['transaction_id'] = generate_transaction_id_controller('DFUR', 'dfur')
-    data['div_number'] = generate_11_digit_number_controller()
-    return jsonify(data), 200
\ No newline at end of file
+    return generate_transaction_id_controller('DFUR')
\ No newline at end of file
@@ -0,0 +1,16 @@
+from flask import Blueprint
+from app.controllers.events_controller import events_controller
+
+events_bp = Blueprint("events_bp", __name__)
+
+@events_bp.route("/events", methods=["GET"])
+def events():
+    ...
+    # server-sent events: new EventSource("/api/events?role=checker")
+    # ?role=superadmin|admin|encoder|checker|reviewer|approver (required)
+    # ?tables=collections,disbursements,budget_entries,dfur_projects (default: all)
+    # ?types=created,updated,flagged,approved,deleted (narrows the role's set)
+    # event: flagged
+    # data: {"id": 12, "type": "flagged", "table": "collections", "ids": [5], "at": "..."}
+    # "resync" means events were missed: refetch, or catch up via /api/changes
+    return events_controller()
@@ -0,0 +1,14 @@
+from flask import Blueprint
+from app.controllers.export_controller import export_controller
+
+export_bp = Blueprint("export_bp", __name__)
+
+@export_bp.route("/export/<table>", methods=["GET"])
+def export(table):
+    ...
+    # table = collections | disbursements | budget_entries | dfur_projects
+    # ?format=csv (default) | ndjson | xlsx
+    # ?start_date=2022-01-01&end_date=2025-12-31 (on transaction_date, both optional)
+    # ?columns=transaction_id,transaction_date,amount (default: all exportable)
+    # ?gzip=1 or Accept-Encoding: gzip compresses csv/ndjson on the fly
+    return export_controller(table)
@@ -1,28 +1,63 @@
 from flask import Blueprint
+from app.middleware.conditional_get import conditional_get, default_year
 from app.controllers.general_controller import (
     get_total_data_budget_allocation_controller,
     get_total_data_collection_controller,
     get_total_data_disbursement_controller,
-    get_total_data_dfur_controller
+    get_total_data_dfur_controller,
+    get_dashboard_summary_controller,
+    get_monthly_data_controller,
+    get_changes_controller
 )
 
 general_bp = Blueprint("general_bp", __name__)
 
 # CALCULATION =============================================
 @general_bp.route('/get-total-data-budget-allocation', methods=['GET'])
+@conditional_get("budget_allocations", "budget_entries", "ledger_summary", period=default_year)
 def get_total_data_budget_allocation():
     return get_total_data_budget_allocation_controller()
 
 
 @general_bp.route('/get-total-data-collection', methods=['GET'])
+@conditional_get("collections", "ledger_summary")
 def get_total_data_collection():
     return get_total_data_collection_controller()
 
 
 @general_bp.route('/get-total-data-disbursement', methods=['GET'])
+@conditional_get("disbursements", "ledger_summary")
 def get_total_data_disbursement():
     return get_total_data_disbursement_controller()
 
 @general_bp.route('/get-total-data-dfur-project', methods=['GET'])
+@conditional_get("dfur_projects", "ledger_summary")
 def total_data_dfur_project():
     return get_total_data_dfur_controller()
+
+@general_bp.route('/dashboard-summary', methods=['GET'])
+@conditional_get("budget_allocations", "budget_entries", "collections", "dfur_projects", "disbursements", "ledger_summary", period=default_year)
+def dashboard_summary():
+    # ?year=2026 (optional; budget totals default to the current year)
+    return get_dashboard_summary_controller()
+
+@general_bp.route('/monthly-data', methods=['GET'])
+@conditional_get("budget_allocations", "budget_entries", "collections", "dfur_projects", "disbursements", "ledger_monthly", period=default_year)
+def monthly_data():
+    # ?year=2026 (default: current year)  ?status=approved (optional)
+    # -> [{"month": "Jan", "revenues": 400000.0, "expenses": 300000.0}, ...]
+    #    collections vs disbursements, all 12 months
+    # ?table=collections&dimension=category|fund_source|review_status (optional)
+    # -> {"year": 2026, "table": "collections", "dimension": "category",
+    #     "rows": [{"month": 1, "category": "Barangay Clearance", "count": 12, "total_amount": "1800.00"}, ...]}
+    return get_monthly_data_controller()
+
+# SYNC ====================================================
+@general_bp.route('/changes', methods=['GET'])
+def changes():
+    # ?since=<cursor from the previous batch> (omit for a first full sync)
+    # ?tables=collections,users (default: all)  ?limit=500 rows per table
+    # {"changes": {table: {"columns": [...], "rows": [[...]]}},
+    #  "deleted": {table: [id, ...]}, "cursor": "...", "has_more": false}
+    # apply changes, then deletes; repeat with the new cursor while has_more
+    return get_changes_controller()
@@ -0,0 +1,34 @@
+from flask import Blueprint
+from app.controllers.import_controller import (
+    import_file_controller,
+    get_import_job_controller,
+    resume_import_job_controller,
+    get_import_errors_controller
+)
+
+import_bp = Blueprint("import_bp", __name__)
+
+@import_bp.route("/import/<table>", methods=["POST"])
+def import_file(table):
+    ...
+    # multipart/form-data, table = collections | disbursements | budget_entries
+    #   file: .csv or .xlsx, first row = headings
+    #   created_by: 4
+    #   mapping (optional): {"OR No.": "or_number", "Received From": "payor"}
+    # returns 202 {"job_id"}; poll /import-jobs/<job_id>
+    return import_file_controller(table)
+
+@import_bp.route("/import-jobs/<int:job_id>", methods=["GET"])
+def get_import_job(job_id):
+    return get_import_job_controller(job_id)
+
+@import_bp.route("/import-jobs/<int:job_id>/resume", methods=["POST"])
+def resume_import_job(job_id):
+    # continues a failed job, or a running one whose worker stopped
+    # checkpointing (IMPORT_STALE_MINUTES), after its last committed row
+    return resume_import_job_controller(job_id)
+
+@import_bp.route("/import-jobs/<int:job_id>/errors", methods=["GET"])
+def get_import_errors(job_id):
+    # CSV: row number, error, original values
+    return get_import_errors_controller(job_id)
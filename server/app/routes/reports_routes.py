@@ -0,0 +1,65 @@
+from flask import Blueprint
+from app.middleware.conditional_get import conditional_get, default_year, current_month
+from app.controllers.reports_controller import (
+    get_sre_controller,
+    close_sre_period_controller,
+    get_financial_summary_controller,
+    category_breakdown_controller,
+)
+
+reports_bp = Blueprint("reports_bp", __name__)
+
+# STATEMENT OF RECEIPTS AND EXPENDITURES ==================
+@reports_bp.route("/sre", methods=["GET"])
+@conditional_get("collections", "disbursements", "sre_closed_periods", period=default_year)
+def sre():
+    # ?year=2026 (default: current year) [&month=3 | &quarter=1]
+    # ?compare=prior_period|prior_year (optional)
+    # approved collections (receipts) and disbursements (expenditures) by category:
+    # {"period": {"label": "March 2026", "start": "2026-03-01", "end": "2026-03-31", ...},
+    #  "receipts": {"lines": [{"category": "Barangay Clearance", "count": 12, "amount": "1800.00",
+    #                          "prior_amount": "1500.00", "change": "300.00", "change_pct": 20.0}],
+    #               "count": 12, "total": "1800.00", "prior_amount": ..., "change": ..., "change_pct": ...},
+    #  "expenditures": {...}, "net": "...", "net_comparison": {...},
+    #  "closed_months": ["2026-03"]}
+    return get_sre_controller()
+
+@reports_bp.route("/sre/close", methods=["POST"])
+def close_sre_period():
+    # {"year": 2026, "month": 3, "closed_by": 5}
+    # snapshots the month's statement; later ledger edits dated in that month
+    # no longer change it (reopen: flask sre reopen --year 2026 --month 3)
+    # 409 when already closed
+    return close_sre_period_controller()
+
+@reports_bp.route("/financial-summary", methods=["GET"])
+@conditional_get("collections", "disbursements", "sre_closed_periods", period=current_month)
+def financial_summary():
+    # ?year=2026 (default: current year)
+    # {"totalRevenues": 5000000.0, "totalExpenses": 3200000.0, "netBalance": 1800000.0,
+    #  "currentMonthRevenues": 420000.0, "currentMonthExpenses": 310000.0,
+    #  "revenueGrowth": 8.0, "expenseGrowth": -5.0, "year": 2026, "month": 3}
+    # growth: current month against the month before, in percent
+    return get_financial_summary_controller()
+
+# CATEGORY BREAKDOWNS ====================================
+@reports_bp.route("/revenue-by-category", methods=["GET"])
+@conditional_get("collections")
+def revenue_by_category():
+    # collections by nature_of_collection (?by=fund_source to group by fund)
+    # optional ?year=2026 or ?start_date=2026-01-01&end_date=2026-03-31, ?status=approved
+    # ?limit=5 groups, the rest summed into "Other"
+    # [{"category": "Barangay Clearance", "count": 120, "amount": 18000.0, "percentage": 40.0}, ...,
+    #  {"category": "Other", "count": 30, "amount": 4500.0, "percentage": 10.0, "categories": 7}]
+    return category_breakdown_controller("revenue")
+
+@reports_bp.route("/expense-by-category", methods=["GET"])
+@conditional_get("budget_entries", "budget_allocations", "disbursements", period=default_year)
+def expense_by_category():
+    # ?source=budget_entries (default) | disbursements; same options as
+    # /revenue-by-category. Budget entries are grouped by category for an
+    # allocation ?year (default: current year); every allocated category is
+    # listed, with "allocated" next to what was spent
+    # [{"category": "General Public Services", "count": 14, "amount": 250000.0,
+    #   "allocated": 400000.0, "percentage": 47.0}, ...]
+    return category_breakdown_controller("expense")
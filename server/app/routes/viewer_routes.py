@@ -1,4 +1,5 @@
 from flask import Blueprint
+from app.middleware.conditional_get import conditional_get
 from app.controllers.viewer_controller import (
     insert_comment_controller, 
     get_all_comments_controller
@@ -11,5 +12,6 @@ def insert_comment():
     return insert_comment_controller()
 
 @viewer_bp.route('/get-all-comments', methods=['GET'])
+@conditional_get("viewer_comments")
 def get_all_comments():
     return get_all_comments_controller()
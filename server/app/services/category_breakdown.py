@@ -0,0 +1,119 @@
+import threading
+from decimal import Decimal
+from app.config import Config
+from app.utils.execute_query import fetch_all
+from app.services.ledger_tables import LEDGER_TABLES
+from app.services.ledger_summary import dimension_exprs
+from app.services.total_calculation import build_filters
+from app.middleware.conditional_get import get_table_versions
+from app.database.query_registry import register_query, SAMPLE_YEAR, SAMPLE_RANGE
+
+# Revenue / expense breakdowns for the report pie charts: one grouped query
+# per request, trimmed to the top N groups plus an "Other" bucket. Budget
+# entry breakdowns also list every category allocated for the year, from
+# budget_allocations, cached per year until that table changes.
+
+# breakdown -> ledger tables it can be read from (first is the default)
+BREAKDOWN_SOURCES = {
+    "revenue": ("collections",),
+    "expense": ("budget_entries", "disbursements"),
+}
+# ledger_monthly dimensions a breakdown can group by
+GROUP_BY = ("category", "fund_source")
+# sources with a review workflow (?status=)
+REVIEWED_SOURCES = ("collections", "disbursements")
+OTHER = "Other"
+
+def build_breakdown_query(data_name, by="category", year=None, start_date=None, end_date=None, review_status=None):
+    spec = LEDGER_TABLES[data_name]
+    exprs = dimension_exprs(spec)
+    amount = spec["sums"]["total_amount"][0]
+    conditions, params = build_filters(spec, year, start_date, end_date)
+    if review_status is not None:
+        # the bare column, so (review_status, transaction_date, ...) applies
+        conditions.append("review_status = %s")
+        params.append(review_status)
+    query = f"SELECT {exprs[by]} AS category, COUNT(*) AS count, SUM({amount}) AS amount FROM {spec['from']}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += f" GROUP BY {exprs[by]}"
+    return query, tuple(params)
+
+def breakdown_query_name(data_name, start_date=None, end_date=None):
+    # the registered name of the query form build_breakdown_query produces
+    if start_date or end_date:
+        return f"{data_name}.by_category_range"
+    return f"{data_name}.by_category"
+
+for _sources in BREAKDOWN_SOURCES.values():
+    for _name in _sources:
+        register_query(breakdown_query_name(_name), *build_breakdown_query(_name, year=SAMPLE_YEAR))
+        register_query(
+            breakdown_query_name(_name, *SAMPLE_RANGE),
+            *build_breakdown_query(_name, "category", None, *SAMPLE_RANGE, review_status="approved"),
+        )
+
+# reference data ==========================================
+_allocations = {"version": None, "years": {}}
+_allocations_lock = threading.Lock()
+
+def budget_categories(year):
+    # {category: allocated amount} of the year's budget_allocations; read
+    # once per year, again only after budget_allocations changes
+    version = get_table_versions(["budget_allocations"])["budget_allocations"][0]
+    with _allocations_lock:
+        if _allocations["version"] != version:
+            _allocations["version"] = version
+            _allocations["years"] = {}
+        if year in _allocations["years"]:
+            return _allocations["years"][year]
+    rows = fetch_all(
+        "SELECT category, SUM(allocated_amount) AS allocated FROM budget_allocations WHERE year = %s GROUP BY category",
+        (year,),
+    )
+    categories = {row["category"]: Decimal(row["allocated"] or 0) for row in rows}
+    with _allocations_lock:
+        if _allocations["version"] == version:
+            _allocations["years"][year] = categories
+    return categories
+
+# breakdown ===============================================
+def top_categories(groups, limit):
+    # largest `limit` groups by amount, the rest folded into "Other";
+    # percentages are of the grand total
+    groups = sorted(groups, key=lambda g: (-g["amount"], g["category"]))
+    total = sum((g["amount"] for g in groups), Decimal(0))
+    top, rest = groups[:limit], groups[limit:]
+    if rest:
+        top.append({
+            "category": OTHER,
+            "count": sum(g["count"] for g in rest),
+            "amount": sum((g["amount"] for g in rest), Decimal(0)),
+            "categories": len(rest),
+        })
+    for group in top:
+        group["percentage"] = round(float(group["amount"] / total * 100), 2) if total else 0.0
+        group["amount"] = float(group["amount"])
+        if "allocated" in group:
+            group["allocated"] = float(group["allocated"])
+    return top
+
+def category_breakdown(data_name, by="category", year=None, start_date=None, end_date=None,
+                       review_status=None, limit=None):
+    # [{"category", "count", "amount", "percentage"}, ..., {"category": "Other", ...}]
+    limit = limit or Config.CATEGORY_TOP_N
+    query, params = build_breakdown_query(data_name, by, year, start_date, end_date, review_status)
+    groups = {
+        row["category"]: {
+            "category": row["category"],
+            "count": int(row["count"]),
+            "amount": Decimal(row["amount"] or 0),
+        }
+        for row in fetch_all(query, params, name=breakdown_query_name(data_name, start_date, end_date))
+    }
+    if data_name == "budget_entries" and by == "category":
+        # categories with an allocation but nothing spent yet still show
+        for category, allocated in budget_categories(year).items():
+            group = groups.setdefault(category, {"category": category, "count": 0, "amount": Decimal(0)})
+            group["allocated"] = allocated
+    return top_categories(groups.values(), limit)
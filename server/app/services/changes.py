@@ -0,0 +1,97 @@
+import base64
+import json
+from datetime import datetime, timedelta
+from app.config import Config
+from app.model.changes_db import (
+    CHANGE_TABLES,
+    changes_cutoff_db,
+    get_changed_rows_db,
+    get_tombstones_db,
+)
+
+# One delta-sync batch: for each table the rows inserted or updated after
+# the client's cursor (columnar, oldest change first), the ids deleted since
+# its tombstone cursor, and the cursor to send next time. Cost follows the
+# number of changes, not the table sizes.
+
+EPOCH = (datetime(1970, 1, 1), 0)
+
+
+class CursorExpired(Exception):
+    # tombstones this old are purged; the client has to resync from scratch
+    pass
+
+
+def encode_changes_cursor(table_cursors, tombstone_cursor):
+    payload = {
+        "t": {table: [at.isoformat(), row_id] for table, (at, row_id) in table_cursors.items()},
+        "d": [tombstone_cursor[0].isoformat(), tombstone_cursor[1]],
+    }
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_changes_cursor(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        table_cursors = {}
+        for table, (at, row_id) in payload["t"].items():
+            if table not in CHANGE_TABLES or not isinstance(row_id, int):
+                raise ValueError(table)
+            table_cursors[table] = (datetime.fromisoformat(at), row_id)
+        at, tombstone_id = payload["d"]
+        if not isinstance(tombstone_id, int):
+            raise ValueError(tombstone_id)
+        return table_cursors, (datetime.fromisoformat(at), tombstone_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def collect_changes(tables, since=None, limit=None):
+    limit = limit or Config.CHANGES_PAGE_SIZE
+    cutoff = changes_cutoff_db()
+
+    if since:
+        table_cursors, tombstone_cursor = decode_changes_cursor(since)
+        if tombstone_cursor[0] < cutoff - timedelta(days=Config.CHANGES_TOMBSTONE_DAYS):
+            raise CursorExpired("Cursor expired; sync again without ?since")
+    else:
+        # first sync: every current row; only deletes from now on matter
+        table_cursors, tombstone_cursor = {}, (cutoff, 0)
+
+    has_more = False
+    changes = {}
+    for table in tables:
+        after = table_cursors.get(table, EPOCH)
+        rows = get_changed_rows_db(table, after, cutoff, limit + 1)
+        if len(rows) > limit:
+            has_more = True
+            rows = rows[:limit]
+        if rows:
+            last = rows[-1]
+            table_cursors[table] = (last["updated_at"], last["id"])
+            changes[table] = rows.columnar()
+
+    deleted = {}
+    tombstones = get_tombstones_db(tombstone_cursor, cutoff, limit + 1)
+    truncated = len(tombstones) > limit
+    if truncated:
+        has_more = True
+        tombstones = tombstones[:limit]
+    for tombstone in tombstones:
+        if tombstone["table_name"] in tables:
+            deleted.setdefault(tombstone["table_name"], []).append(tombstone["row_id"])
+    if truncated:
+        tombstone_cursor = (tombstones[-1]["deleted_at"], tombstones[-1]["id"])
+    elif tombstones and tombstones[-1]["deleted_at"] == cutoff:
+        tombstone_cursor = (cutoff, tombstones[-1]["id"])
+    else:
+        # every delete up to the cutoff was seen; move the cursor there so a
+        # client syncing through a quiet spell does not age into CursorExpired
+        tombstone_cursor = (cutoff, 0)
+
+    return {
+        "changes": changes,
+        "deleted": deleted,
+        "cursor": encode_changes_cursor(table_cursors, tombstone_cursor),
+        "has_more": has_more,
+    }
@@ -0,0 +1,54 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app.config import Config
+from app.services.total_calculation import result_total_data
+
+# dashboard section -> (ledger table, keys returned; None = all)
+SECTIONS = {
+    "budget_allocation": ("budget_entries", ("total_data", "total_amount")),
+    "collection": ("collections", None),
+    "disbursement": ("disbursements", None),
+    "dfur_project": ("dfur_projects", None),
+}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    # bounded pool shared by all requests; each task checks out its own
+    # pooled connection because worker threads have no request unit of work
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.DASHBOARD_WORKERS,
+                    thread_name_prefix="dashboard",
+                )
+    return _executor
+
+def _timed_totals(data_name, year, keys):
+    started = time.perf_counter()
+    totals = result_total_data(data_name, year)
+    if keys and isinstance(totals, dict):
+        totals = {key: totals[key] for key in keys}
+    return totals, round((time.perf_counter() - started) * 1000, 3)
+
+def dashboard_summary(year, budget_year):
+    # budget totals always need an allocation year; the ledgers are filtered
+    # by year only when one was asked for
+    started = time.perf_counter()
+    executor = get_executor()
+    futures = {}
+    for section, (data_name, keys) in SECTIONS.items():
+        section_year = budget_year if data_name == "budget_entries" else year
+        futures[section] = executor.submit(_timed_totals, data_name, section_year, keys)
+
+    summary = {"year": year, "budget_year": budget_year, "timing_ms": {}}
+    for section, future in futures.items():
+        totals, elapsed = future.result()
+        summary[section] = totals
+        summary["timing_ms"][section] = elapsed
+    summary["timing_ms"]["total"] = round((time.perf_counter() - started) * 1000, 3)
+    return summary
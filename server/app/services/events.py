@@ -0,0 +1,144 @@
+import json
+import queue
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from app.config import Config
+from app.database.unit_of_work import after_commit
+
+# In-process event bus behind /api/events (server-sent events). Write paths
+# publish through publish_after_commit, so subscribers only ever hear about
+# committed changes. Each subscriber has a bounded queue; one that falls
+# too far behind gets a "resync" event and is dropped rather than blocking
+# the writers. Events only reach clients connected to the same process
+# (see gunicorn.conf.py).
+
+EVENT_TYPES = ("created", "updated", "flagged", "approved", "deleted")
+EVENT_TABLES = ("collections", "disbursements", "budget_entries", "dfur_projects")
+
+# what each role's dashboard reacts to
+ROLE_EVENTS = {
+    "superadmin": set(EVENT_TYPES),
+    "admin": set(EVENT_TYPES),
+    "encoder": {"updated", "flagged", "approved", "deleted"},
+    "checker": {"created", "updated", "approved", "deleted"},
+    "reviewer": {"created", "updated", "approved", "deleted"},
+    "approver": {"created", "updated", "flagged", "deleted"},
+}
+
+
+class Subscription:
+    def __init__(self, event_types, tables=None):
+        self.event_types = set(event_types)
+        self.tables = set(tables) if tables else None
+        self.queue = queue.Queue(maxsize=Config.EVENTS_QUEUE_SIZE)
+        self.overflowed = False
+
+    def accepts(self, event):
+        return event["type"] in self.event_types and (
+            self.tables is None or event["table"] in self.tables
+        )
+
+    def offer(self, event):
+        # called by writers; never blocks
+        if self.overflowed or not self.accepts(event):
+            return
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout):
+        # next event, or None when nothing arrived within timeout
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventBus:
+    def __init__(self, backlog=1000):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        # replayed to clients reconnecting with Last-Event-ID
+        self._recent = deque(maxlen=backlog)
+        self._next_id = 1
+
+    def publish(self, event_type, table, ids=(), **data):
+        with self._lock:
+            event = {
+                "id": self._next_id,
+                "type": event_type,
+                "table": table,
+                "ids": list(ids),
+                "at": datetime.now(timezone.utc).isoformat(),
+                **data,
+            }
+            self._next_id += 1
+            self._recent.append(event)
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.offer(event)
+        return event
+
+    def subscribe(self, subscription, last_event_id=None):
+        with self._lock:
+            if last_event_id is not None:
+                oldest = self._recent[0]["id"] if self._recent else self._next_id
+                if last_event_id >= self._next_id or last_event_id < oldest - 1:
+                    # restarted process or events already rotated out
+                    subscription.overflowed = True
+                for event in self._recent:
+                    if event["id"] > last_event_id:
+                        subscription.offer(event)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def stats(self):
+        with self._lock:
+            return {"subscribers": len(self._subscribers), "last_event_id": self._next_id - 1}
+
+
+_bus = None
+_bus_lock = threading.Lock()
+
+def get_event_bus():
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = EventBus(backlog=Config.EVENTS_BACKLOG)
+    return _bus
+
+def publish_after_commit(event_type, table, ids=(), **data):
+    ids = list(ids)
+    after_commit(lambda: get_event_bus().publish(event_type, table, ids, **data))
+
+def review_event_type(review_status):
+    return "approved" if review_status == "approved" else "updated"
+
+def format_sse(event):
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+def stream_events(subscription):
+    # SSE body: events as they arrive, a comment line as heartbeat so
+    # proxies keep the connection open and dead clients are noticed
+    bus = get_event_bus()
+    try:
+        yield f"retry: {Config.EVENTS_RETRY_MS}\n\n"
+        while True:
+            if subscription.overflowed:
+                # events were dropped; the client refetches (or /api/changes)
+                yield "event: resync\ndata: {}\n\n"
+                return
+            event = subscription.get(timeout=Config.EVENTS_HEARTBEAT_SECONDS)
+            if event is None:
+                yield ": heartbeat\n\n"
+            else:
+                yield format_sse(event)
+    finally:
+        bus.unsubscribe(subscription)
@@ -0,0 +1,290 @@
+import csv
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from app.config import Config
+from app.database.unit_of_work import transaction
+from app.model.encoder.bulk_db import existing_transaction_ids_db, existing_allocation_ids_db
+from app.model.encoder.collections_db import insert_collections_bulk_db
+from app.model.encoder.disbursements_db import insert_disbursements_bulk_db
+from app.model.encoder.budget_entries_db import insert_budget_entries_bulk_db
+from app.model.encoder.import_jobs_db import (
+    get_import_job_db,
+    update_import_job_db,
+    checkpoint_import_job_db,
+    claim_import_job_db,
+)
+from app.services.transaction_ids import next_transaction_ids
+from app.validator.validate_ledger_entry import (
+    validate_collection,
+    validate_disbursement,
+    validate_budget_entry,
+)
+
+# CSV/XLSX ledger import. The file is read row by row (csv module, or
+# openpyxl in read-only mode), mapped onto the table's insert fields and
+# processed in batches: validate, reserve transaction ids, insert, and
+# advance the job checkpoint, all committed together per batch. A failed
+# or interrupted job resumes after its last committed row; a job whose
+# worker died mid-run is resumed the same way once its lease (updated_at,
+# renewed by every checkpoint) is older than IMPORT_STALE_MINUTES.
+
+class ImportJobTakenOver(Exception):
+    # another worker claimed this job after its lease ran out
+    pass
+
+IMPORT_TABLES = {
+    "collections": {
+        "prefix": "COLL",
+        "validate": validate_collection,
+        "insert": insert_collections_bulk_db,
+        "fields": (
+            "transaction_id", "transaction_date", "nature_of_collection", "description",
+            "fund_source", "amount", "payor", "or_number", "remarks",
+        ),
+    },
+    "disbursements": {
+        "prefix": "DISB",
+        "validate": validate_disbursement,
+        "insert": insert_disbursements_bulk_db,
+        "fields": (
+            "transaction_id", "transaction_date", "nature_of_disbursement", "description",
+            "fund_source", "amount", "payee", "or_number", "remarks", "allocation_id",
+        ),
+    },
+    "budget_entries": {
+        "prefix": "BUDG",
+        "validate": validate_budget_entry,
+        "insert": insert_budget_entries_bulk_db,
+        "fields": (
+            "transaction_id", "transaction_date", "category", "subcategory", "amount",
+            "fund_source", "payee", "dv_number", "expenditure_program",
+            "program_description", "remarks", "allocation_id",
+        ),
+    },
+}
+
+# common spreadsheet headings (normalized) -> field
+HEADER_ALIASES = {
+    "date": "transaction_date",
+    "txn_date": "transaction_date",
+    "amt": "amount",
+    "or_no": "or_number",
+    "official_receipt": "or_number",
+    "official_receipt_no": "or_number",
+    "receipt_no": "or_number",
+    "received_from": "payor",
+    "paid_to": "payee",
+    "dv_no": "dv_number",
+    "voucher_no": "dv_number",
+    "allocation": "allocation_id",
+}
+# headings that mean the table's own "nature" column
+NATURE_HEADERS = ("nature", "particulars")
+
+FILE_FORMATS = ("csv", "xlsx")
+
+def normalize_header(header):
+    return re.sub(r"[^a-z0-9]+", "_", str(header or "").lower()).strip("_")
+
+def build_column_map(table, headers, mapping=None):
+    # source column index -> field; `mapping` ({"Heading": "field"}) wins
+    fields = IMPORT_TABLES[table]["fields"]
+    nature = next((f for f in fields if f.startswith("nature_of_")), None)
+    explicit = {normalize_header(k): v for k, v in (mapping or {}).items()}
+
+    column_map = {}
+    for index, header in enumerate(headers):
+        key = normalize_header(header)
+        field = explicit.get(key) or HEADER_ALIASES.get(key) or key
+        if field in NATURE_HEADERS and nature:
+            field = nature
+        if field in fields and field not in column_map.values():
+            column_map[index] = field
+    return column_map
+
+def read_rows(path, file_format):
+    # yields (row_number, values); row 1 is the header
+    if file_format == "csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for row_number, values in enumerate(csv.reader(f), start=1):
+                yield row_number, values
+        return
+
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise RuntimeError("XLSX import needs openpyxl (pip install openpyxl)")
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        for row_number, values in enumerate(sheet.iter_rows(values_only=True), start=1):
+            yield row_number, list(values)
+    finally:
+        workbook.close()
+
+def clean_value(field, value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        if field == "amount":
+            # "₱1,250.00" as typed in the paper ledgers
+            value = value.replace(",", "").replace("₱", "").replace("PHP", "").strip()
+    if field == "allocation_id":
+        # "3" from CSV, 3.0 from XLSX; ids compare as ints later on
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        elif isinstance(value, str) and value.isdigit():
+            value = int(value)
+    return value
+
+def map_row(column_map, values, created_by):
+    entry = {"created_by": created_by}
+    for index, field in column_map.items():
+        if index < len(values):
+            entry[field] = clean_value(field, values[index])
+    return entry
+
+# batches ===============================================
+def process_batch(job, spec, batch):
+    # batch: [(row_number, entry, raw_values)]; returns (inserted, errors)
+    errors = []
+    valid = []
+    seen = set()
+    for row_number, entry, raw in batch:
+        is_valid, message = spec["validate"](entry)
+        transaction_id = entry.get("transaction_id")
+        if is_valid and transaction_id is not None:
+            if transaction_id in seen:
+                is_valid, message = False, "Duplicate transaction_id in file"
+            seen.add(transaction_id)
+        if is_valid:
+            valid.append((row_number, entry, raw))
+        else:
+            errors.append((row_number, message, raw))
+
+    taken = existing_transaction_ids_db(job["table_name"], list(seen)) if seen else set()
+    if taken:
+        errors.extend(
+            (row_number, "transaction_id already exists", raw)
+            for row_number, entry, raw in valid
+            if entry.get("transaction_id") in taken
+        )
+        valid = [item for item in valid if item[1].get("transaction_id") not in taken]
+
+    # an unknown allocation would fail the whole batch on its foreign key
+    allocation_ids = {int(entry["allocation_id"]) for _, entry, _ in valid if entry.get("allocation_id") is not None}
+    if allocation_ids:
+        unknown = allocation_ids - existing_allocation_ids_db(sorted(allocation_ids))
+        if unknown:
+            def has_unknown_allocation(entry):
+                return entry.get("allocation_id") is not None and int(entry["allocation_id"]) in unknown
+            errors.extend(
+                (row_number, "allocation_id does not exist", raw)
+                for row_number, entry, raw in valid
+                if has_unknown_allocation(entry)
+            )
+            valid = [item for item in valid if not has_unknown_allocation(item[1])]
+
+    # one id block per batch; reserved (and committed) before the batch
+    # transaction so the sequence row is not locked while rows are written
+    missing = [entry for _, entry, _ in valid if entry.get("transaction_id") is None]
+    if missing:
+        for entry, transaction_id in zip(missing, next_transaction_ids(spec["prefix"], len(missing))):
+            entry["transaction_id"] = transaction_id
+
+    last_row = batch[-1][0]
+    with transaction():
+        if valid:
+            spec["insert"]([entry for _, entry, _ in valid])
+        # rolls the batch back if the job is no longer ours
+        if not checkpoint_import_job_db(
+            job["id"],
+            job["last_row"],
+            last_row,
+            job["inserted_rows"] + len(valid),
+            job["failed_rows"] + len(errors),
+        ):
+            raise ImportJobTakenOver(job["id"])
+    job["last_row"] = last_row
+    job["inserted_rows"] += len(valid)
+    job["failed_rows"] += len(errors)
+    return len(valid), sorted(errors, key=lambda error: error[0])
+
+def error_report_path(job):
+    return os.path.join(Config.IMPORT_DIR, f"import_{job['id']}_errors.csv")
+
+def run_import(job_id):
+    # runs outside a request, so every batch commits on its own
+    if not claim_import_job_db(job_id):
+        return get_import_job_db(job_id)
+    job = get_import_job_db(job_id)
+    spec = IMPORT_TABLES[job["table_name"]]
+    mapping = json.loads(job["column_mapping"]) if job["column_mapping"] else None
+    report_path = job["error_report_path"] or error_report_path(job)
+    update_import_job_db(job_id, error_report_path=report_path)
+
+    try:
+        # appended to on resume; rows already reported were checkpointed
+        with open(report_path, "a", newline="", encoding="utf-8") as report:
+            writer = csv.writer(report)
+            rows = read_rows(job["file_path"], job["file_format"])
+            header_number, headers = next(rows, (0, []))
+            column_map = build_column_map(job["table_name"], headers, mapping)
+            if "amount" not in column_map.values():
+                raise ValueError("No amount column found; pass a column mapping")
+            if report.tell() == 0:
+                writer.writerow(["row", "error"] + [str(h) for h in headers])
+
+            batch = []
+            for row_number, values in rows:
+                if row_number <= job["last_row"]:
+                    continue
+                if not any(v not in (None, "") for v in values):
+                    continue
+                batch.append((row_number, map_row(column_map, values, job["created_by"]), values))
+                if len(batch) >= Config.IMPORT_BATCH_SIZE:
+                    _, errors = process_batch(job, spec, batch)
+                    writer.writerows([row, message] + list(raw) for row, message, raw in errors)
+                    report.flush()
+                    batch = []
+            if batch:
+                _, errors = process_batch(job, spec, batch)
+                writer.writerows([row, message] + list(raw) for row, message, raw in errors)
+
+        update_import_job_db(job_id, status="completed", message=None)
+    except ImportJobTakenOver:
+        # the worker that took over owns the status from here
+        print(f"Import job {job_id} was taken over by another worker")
+    except Exception as e:
+        print(f"Import job {job_id} failed: {e}")
+        update_import_job_db(job_id, status="failed", message=str(e))
+    return get_import_job_db(job_id)
+
+# background runner =====================================
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_import_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.IMPORT_WORKERS,
+                    thread_name_prefix="import",
+                )
+    return _executor
+
+def start_import(job_id):
+    return get_import_executor().submit(run_import, job_id)
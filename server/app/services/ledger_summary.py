@@ -0,0 +1,181 @@
+from contextlib import contextmanager
+from decimal import Decimal
+from app.config import Config
+from app.utils.execute_query import execute_query, fetch_all
+from app.services.ledger_tables import LEDGER_TABLES, COUNTERS, key_column
+
+# ledger_summary keeps running totals per (table, fiscal year, review
+# status, flag, active) bucket. Every write path applies its delta in the
+# same transaction as the base-table change, so reading totals is a lookup
+# over a handful of bucket rows instead of a scan of the ledger.
+# ledger_monthly is kept the same way, by the same track_ledger call, one
+# bucket per (table, fiscal year, month, category, fund source, review
+# status), for the monthly charts. LEDGER_SUMMARY_ENABLED only switches the
+# readers of both tables over.
+
+# rollup table -> its bucket columns
+SUMMARY_TABLES = {
+    "ledger_summary": ("fiscal_year", "review_status", "is_flagged", "is_active"),
+    "ledger_monthly": ("fiscal_year", "month", "category", "fund_source", "review_status"),
+}
+DIMENSIONS = SUMMARY_TABLES["ledger_summary"]
+MEASURES = ("amount_total", "cost_approved_total", "cost_incurred_total")
+
+def is_enabled():
+    # gates the reads only; the write paths always keep the rollups current,
+    # so a rebuild seeds them once and they stay exact from then on
+    return Config.LEDGER_SUMMARY_ENABLED
+
+def _measure_columns(spec):
+    # money column feeding each ledger_summary measure (0 when untracked)
+    sources = {summary: source for source, summary in spec["sums"].values()}
+    return {measure: sources.get(measure) for measure in MEASURES}
+
+def dimension_exprs(spec):
+    # every bucket column of every rollup table, as a base-table expression
+    return {**spec["dimensions"], **spec["monthly"]}
+
+def _projection_columns(spec):
+    columns = [f"{expr} AS {name}" for name, expr in dimension_exprs(spec).items()]
+    for measure, source in _measure_columns(spec).items():
+        columns.append(f"COALESCE({source}, 0) AS {measure}" if source else f"0 AS {measure}")
+    return columns
+
+def project_rows(data_name, column, values, lock=False):
+    # the ledger_summary bucket and amounts of each matching base row
+    if not values:
+        return []
+    spec = LEDGER_TABLES[data_name]
+    placeholders = ", ".join(["%s"] * len(values))
+    query = (
+        f"SELECT {', '.join(_projection_columns(spec))} FROM {spec['from']}"
+        f" WHERE {key_column(spec, column)} IN ({placeholders})"
+    )
+    if lock:
+        # lock the base rows so the before-image stays valid until commit
+        query += f" FOR UPDATE OF {spec['alias']}" if spec["alias"] else " FOR UPDATE"
+    return fetch_all(query, tuple(values))
+
+def _bucket(row, summary_table="ledger_summary"):
+    return tuple(row[name] for name in SUMMARY_TABLES[summary_table])
+
+def _insert_columns(summary_table):
+    return ("table_name",) + SUMMARY_TABLES[summary_table] + ("row_count",) + MEASURES
+
+def apply_deltas(data_name, before, after, summary_table="ledger_summary"):
+    deltas = {}
+    for rows, sign in ((before, -1), (after, 1)):
+        for row in rows:
+            delta = deltas.setdefault(_bucket(row, summary_table), [0] + [Decimal(0)] * len(MEASURES))
+            delta[0] += sign
+            for i, measure in enumerate(MEASURES, start=1):
+                delta[i] += sign * Decimal(row[measure] or 0)
+
+    columns = _insert_columns(summary_table)
+    row_placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    values = []
+    params = []
+    for bucket, delta in deltas.items():
+        if not any(delta):
+            continue
+        values.append(row_placeholders)
+        params.extend((data_name,) + bucket + tuple(delta))
+    if not values:
+        return 0
+
+    totals = ("row_count",) + MEASURES
+    query = f"""
+        INSERT INTO {summary_table} ({", ".join(columns)})
+        VALUES {", ".join(values)}
+        ON DUPLICATE KEY UPDATE
+            {", ".join(f"{name} = {name} + VALUES({name})" for name in totals)}
+    """
+    return execute_query(query, tuple(params))
+
+@contextmanager
+def track_ledger(data_name, column, values, inserting=False):
+    # wrap a base-table write (inside transaction()):
+    #   with track_ledger("collections", "id", [collection_id]):
+    #       execute_query("UPDATE collections ...")
+    # inserts are tracked by a unique column known up front (transaction_id)
+    before = [] if inserting else project_rows(data_name, column, values, lock=True)
+    yield
+    after = project_rows(data_name, column, values)
+    for summary_table in SUMMARY_TABLES:
+        apply_deltas(data_name, before, after, summary_table)
+
+# reads ===============================================
+def read_summary_totals(data_name, year=None):
+    spec = LEDGER_TABLES[data_name]
+    columns = ["SUM(row_count) AS total_data"]
+    for name, condition in spec["counters"].items():
+        columns.append(f"SUM(CASE WHEN {condition} THEN row_count ELSE 0 END) AS {name}")
+    for name, (_, summary_column) in spec["sums"].items():
+        columns.append(f"SUM({summary_column}) AS {name}")
+
+    query = f"SELECT {', '.join(columns)} FROM ledger_summary WHERE table_name = %s"
+    params = [data_name]
+    if year is not None:
+        query += " AND fiscal_year = %s"
+        params.append(year)
+
+    row = fetch_all(query, tuple(params))[0]
+    total_data = {"total_data": int(row["total_data"] or 0)}
+    for name in COUNTERS:
+        total_data[name] = int(row.get(name) or 0)
+    for name in spec["sums"]:
+        total_data[name] = row[name] if row[name] is not None else 0
+    return total_data
+
+# rebuild / verify ====================================
+def _grouped_projection_query(spec, summary_table="ledger_summary"):
+    exprs = dimension_exprs(spec)
+    dims = {name: exprs[name] for name in SUMMARY_TABLES[summary_table]}
+    columns = [f"{expr} AS {name}" for name, expr in dims.items()]
+    columns.append("COUNT(*) AS row_count")
+    for measure, source in _measure_columns(spec).items():
+        columns.append(f"COALESCE(SUM({source}), 0) AS {measure}" if source else f"0 AS {measure}")
+    group_by = ", ".join(dims.values())
+    return f"SELECT {', '.join(columns)} FROM {spec['from']} GROUP BY {group_by}"
+
+def rebuild_summary(data_name, summary_table="ledger_summary"):
+    # recompute one table's buckets from the base table
+    spec = LEDGER_TABLES[data_name]
+    execute_query(f"DELETE FROM {summary_table} WHERE table_name = %s", (data_name,))
+    columns = _insert_columns(summary_table)
+    query = f"""
+        INSERT INTO {summary_table} ({", ".join(columns)})
+        SELECT %s, {", ".join(f"g.{name}" for name in columns[1:])}
+        FROM ({_grouped_projection_query(spec, summary_table)}) AS g
+    """
+    return execute_query(query, (data_name,))
+
+def verify_summary(data_name, summary_table="ledger_summary"):
+    # buckets whose stored totals differ from the base table
+    spec = LEDGER_TABLES[data_name]
+    expected = {
+        _bucket(row, summary_table): row
+        for row in fetch_all(_grouped_projection_query(spec, summary_table))
+    }
+    stored = {
+        _bucket(row, summary_table): row
+        for row in fetch_all(
+            f"SELECT * FROM {summary_table} WHERE table_name = %s AND row_count <> 0",
+            (data_name,),
+        )
+    }
+
+    drift = []
+    for bucket in sorted(set(expected) | set(stored), key=str):
+        want = expected.get(bucket)
+        have = stored.get(bucket)
+        fields = ("row_count",) + MEASURES
+        want_values = [Decimal(want[f]) if want else Decimal(0) for f in fields]
+        have_values = [Decimal(have[f]) if have else Decimal(0) for f in fields]
+        if want_values != have_values:
+            drift.append({
+                "bucket": dict(zip(SUMMARY_TABLES[summary_table], bucket)),
+                "expected": dict(zip(fields, want_values)),
+                "stored": dict(zip(fields, have_values)),
+            })
+    return drift
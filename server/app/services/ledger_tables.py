@@ -0,0 +1,113 @@
+# How each ledger table is aggregated, shared by the totals queries and
+# the ledger_summary maintenance.
+#
+# "counters" are COUNT-style totals (SUM of a boolean condition); the
+# conditions only use review_status / is_flagged / is_active, which are
+# also the dimension columns of ledger_summary, so they work on both.
+# "sums" map a total to (money column, ledger_summary column). Totals a
+# table does not track are reported as 0, like the old per-row functions.
+# "dimensions" project a row onto its ledger_summary bucket; "monthly"
+# adds the further columns of its ledger_monthly bucket (the cube behind
+# /api/monthly-data), which also uses fiscal_year and review_status.
+LEDGER_TABLES = {
+    "collections": {
+        "from": "collections",
+        "alias": None,
+        "date": "transaction_date",
+        "year": None,
+        "counters": {
+            "total_active": "is_active = 1",
+            "total_approved": "review_status = 'approved'",
+            "total_pending": "review_status = 'pending'",
+            "total_flagged": "is_flagged = 1",
+        },
+        "sums": {"total_amount": ("amount", "amount_total")},
+        "dimensions": {
+            "fiscal_year": "YEAR(transaction_date)",
+            "review_status": "COALESCE(review_status, '')",
+            "is_flagged": "COALESCE(is_flagged, 0)",
+            "is_active": "COALESCE(is_active, 0)",
+        },
+        "monthly": {
+            "month": "MONTH(transaction_date)",
+            "category": "COALESCE(nature_of_collection, '')",
+            "fund_source": "COALESCE(fund_source, '')",
+        },
+    },
+    "disbursements": {
+        "from": "disbursements",
+        "alias": None,
+        "date": "transaction_date",
+        "year": None,
+        "counters": {
+            "total_approved": "review_status = 'approved'",
+            "total_pending": "review_status = 'pending'",
+            "total_flagged": "is_flagged = 1",
+        },
+        "sums": {"total_amount": ("amount", "amount_total")},
+        "dimensions": {
+            "fiscal_year": "YEAR(transaction_date)",
+            "review_status": "COALESCE(review_status, '')",
+            "is_flagged": "COALESCE(is_flagged, 0)",
+            "is_active": "1",
+        },
+        "monthly": {
+            "month": "MONTH(transaction_date)",
+            "category": "COALESCE(nature_of_disbursement, '')",
+            "fund_source": "COALESCE(fund_source, '')",
+        },
+    },
+    "budget_entries": {
+        "from": "budget_entries be JOIN budget_allocations ba ON be.allocation_id = ba.id",
+        "alias": "be",
+        "date": "be.transaction_date",
+        # budget entries belong to the fiscal year of their allocation
+        "year": "ba.year",
+        "counters": {},
+        "sums": {"total_amount": ("be.amount", "amount_total")},
+        "dimensions": {
+            "fiscal_year": "ba.year",
+            "review_status": "''",
+            "is_flagged": "0",
+            "is_active": "1",
+        },
+        "monthly": {
+            "month": "MONTH(be.transaction_date)",
+            "category": "COALESCE(be.category, '')",
+            "fund_source": "COALESCE(be.fund_source, '')",
+        },
+    },
+    "dfur_projects": {
+        "from": "dfur_projects",
+        "alias": None,
+        "date": "transaction_date",
+        "year": None,
+        "counters": {
+            "total_active": "is_active = 1",
+            "total_approved": "review_status = 'approved'",
+            "total_pending": "review_status = 'pending'",
+            "total_flagged": "is_flagged = 1",
+        },
+        "sums": {
+            "overall_cost_approved": ("total_cost_approved", "cost_approved_total"),
+            "overall_cost_incurred": ("total_cost_incurred", "cost_incurred_total"),
+        },
+        "dimensions": {
+            "fiscal_year": "YEAR(transaction_date)",
+            "review_status": "COALESCE(review_status, '')",
+            "is_flagged": "COALESCE(is_flagged, 0)",
+            "is_active": "COALESCE(is_active, 0)",
+        },
+        "monthly": {
+            "month": "MONTH(transaction_date)",
+            "category": "COALESCE(name_of_collection, '')",
+            "fund_source": "''",
+        },
+    },
+}
+
+COUNTERS = ("total_active", "total_approved", "total_pending", "total_flagged")
+
+def key_column(spec, column):
+    # qualify a key column for tables queried through a join
+    return f"{spec['alias']}.{column}" if spec["alias"] else column
@@ -0,0 +1,90 @@
+from decimal import Decimal
+from app.utils.execute_query import fetch_all
+from app.services.ledger_tables import LEDGER_TABLES
+from app.services.ledger_summary import is_enabled as summary_enabled, dimension_exprs
+from app.services.total_calculation import build_filters
+from app.database.query_registry import register_query, SAMPLE_YEAR
+
+# Monthly series for the report charts (/api/monthly-data). Every ledger
+# write keeps the ledger_monthly cube current (track_ledger); with
+# LEDGER_SUMMARY_ENABLED the series are read from it, a few hundred bucket
+# rows per year, otherwise grouped from the base table like
+# result_total_data does for totals.
+
+MONTH_NAMES = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# ways to split one table's months
+MONTHLY_DIMENSIONS = ("category", "fund_source", "review_status")
+
+def _group_columns(dimension):
+    return ["month"] + ([dimension] if dimension else [])
+
+def build_cube_query(data_name, year, dimension=None, review_status=None):
+    spec = LEDGER_TABLES[data_name]
+    group = _group_columns(dimension)
+    columns = group + ["SUM(row_count) AS count"]
+    for name, (_, summary_column) in spec["sums"].items():
+        columns.append(f"SUM({summary_column}) AS {name}")
+
+    conditions = ["table_name = %s", "fiscal_year = %s"]
+    params = [data_name, year]
+    if review_status is not None:
+        conditions.append("review_status = %s")
+        params.append(review_status)
+    query = (
+        f"SELECT {', '.join(columns)} FROM ledger_monthly"
+        f" WHERE {' AND '.join(conditions)}"
+        f" GROUP BY {', '.join(group)}"
+        # buckets emptied by deletes and status changes stay behind at 0
+        f" HAVING SUM(row_count) <> 0"
+        f" ORDER BY {', '.join(group)}"
+    )
+    return query, tuple(params)
+
+def build_base_query(data_name, year, dimension=None, review_status=None):
+    spec = LEDGER_TABLES[data_name]
+    exprs = dimension_exprs(spec)
+    group = [exprs[name] for name in _group_columns(dimension)]
+    columns = [f"{exprs[name]} AS {name}" for name in _group_columns(dimension)]
+    columns.append("COUNT(*) AS count")
+    for name, (column, _) in spec["sums"].items():
+        columns.append(f"COALESCE(SUM({column}), 0) AS {name}")
+
+    conditions, params = build_filters(spec, year)
+    if review_status is not None:
+        conditions.append(f"{exprs['review_status']} = %s")
+        params.append(review_status)
+    query = (
+        f"SELECT {', '.join(columns)} FROM {spec['from']}"
+        f" WHERE {' AND '.join(conditions)}"
+        f" GROUP BY {', '.join(group)}"
+        f" ORDER BY {', '.join(group)}"
+    )
+    return query, tuple(params)
+
+for _name in LEDGER_TABLES:
+    register_query(f"{_name}.monthly", *build_cube_query(_name, SAMPLE_YEAR))
+    register_query(f"{_name}.monthly_category", *build_cube_query(_name, SAMPLE_YEAR, "category"))
+
+def monthly_rows(data_name, year, dimension=None, review_status=None):
+    # [{"month": 1, <dimension>, "count": 3, <the table's sums>}, ...]
+    spec = LEDGER_TABLES[data_name]
+    if summary_enabled():
+        query, params = build_cube_query(data_name, year, dimension, review_status)
+    else:
+        query, params = build_base_query(data_name, year, dimension, review_status)
+    rows = fetch_all(query, params, name=f"{data_name}.monthly")
+    for row in rows:
+        row["month"] = int(row["month"])
+        row["count"] = int(row["count"] or 0)
+        for name in spec["sums"]:
+            row[name] = row[name] if row[name] is not None else 0
+    return rows
+
+def monthly_series(year, review_status=None):
+    # the dashboard bar chart: collections vs disbursements, all 12 months
+    series = [{"month": name, "revenues": 0.0, "expenses": 0.0} for name in MONTH_NAMES]
+    for data_name, key in (("collections", "revenues"), ("disbursements", "expenses")):
+        for row in monthly_rows(data_name, year, review_status=review_status):
+            series[row["month"] - 1][key] = float(Decimal(row["total_amount"]))
+    return series
@@ -0,0 +1,271 @@
+import json
+import threading
+from datetime import date, timedelta
+from decimal import Decimal
+from app.utils.execute_query import execute_query, fetch_all
+from app.database.unit_of_work import transaction, current_unit_of_work
+from app.database.query_registry import register_query, SAMPLE_RANGE
+from app.middleware.conditional_get import get_table_versions
+
+# Statement of Receipts and Expenditures: approved collections (receipts)
+# and disbursements (expenditures) per category over a run of whole months,
+# optionally next to a comparative period. Open months are read with one
+# grouped query over both ledgers per contiguous run of months; closed
+# months come from the snapshot taken when they were closed
+# (sre_closed_periods), kept in-process until that table changes.
+
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+SECTIONS = ("receipts", "expenditures")
+# prior_period: the run of months just before (the prior month for a
+# monthly statement); prior_year: the same months one year earlier
+COMPARISONS = ("prior_period", "prior_year")
+# only approved entries are part of the statement
+SRE_STATUS = "approved"
+
+SRE_LINES_QUERY = """
+    SELECT 'receipts' AS section, YEAR(transaction_date) AS fiscal_year,
+           MONTH(transaction_date) AS month,
+           COALESCE(nature_of_collection, '') AS category,
+           COUNT(*) AS count, SUM(amount) AS amount
+    FROM collections
+    WHERE review_status = %s AND transaction_date >= %s AND transaction_date < %s
+    GROUP BY fiscal_year, month, category
+    UNION ALL
+    SELECT 'expenditures', YEAR(transaction_date), MONTH(transaction_date),
+           COALESCE(nature_of_disbursement, ''),
+           COUNT(*), SUM(amount)
+    FROM disbursements
+    WHERE review_status = %s AND transaction_date >= %s AND transaction_date < %s
+    GROUP BY YEAR(transaction_date), MONTH(transaction_date), COALESCE(nature_of_disbursement, '')
+"""
+
+register_query("sre.lines", SRE_LINES_QUERY, (SRE_STATUS, *SAMPLE_RANGE, SRE_STATUS, *SAMPLE_RANGE))
+
+
+class PeriodAlreadyClosed(Exception):
+    pass
+
+
+# periods ================================================
+def period_months(year, month=None, quarter=None):
+    # [(year, month), ...] covered by a monthly, quarterly or yearly statement
+    if month is not None:
+        first, count = month, 1
+    elif quarter is not None:
+        first, count = 3 * (quarter - 1) + 1, 3
+    else:
+        first, count = 1, 12
+    return [(year, m) for m in range(first, first + count)]
+
+def shift_months(months, offset):
+    shifted = []
+    for year, month in months:
+        index = year * 12 + month - 1 + offset
+        shifted.append((index // 12, index % 12 + 1))
+    return shifted
+
+def comparison_months(months, compare):
+    if compare == "prior_year":
+        return shift_months(months, -12)
+    return shift_months(months, -len(months))
+
+def month_bounds(year, month):
+    # [first day, first day of the next month)
+    return date(year, month, 1), date(year + month // 12, month % 12 + 1, 1)
+
+def _contiguous_runs(months):
+    runs = []
+    for key in sorted(months):
+        if runs and shift_months([runs[-1][-1]], 1)[0] == key:
+            runs[-1].append(key)
+        else:
+            runs.append([key])
+    return runs
+
+def _describe(months):
+    start = month_bounds(*months[0])[0]
+    end = month_bounds(*months[-1])[1] - timedelta(days=1)
+    return {"start": start.isoformat(), "end": end.isoformat()}
+
+def period_label(year, month=None, quarter=None):
+    if month is not None:
+        return f"{MONTH_NAMES[month - 1]} {year}"
+    if quarter is not None:
+        return f"Q{quarter} {year}"
+    return f"FY {year}"
+
+# statement lines =========================================
+def compute_month_lines(months):
+    # {(year, month): [{"section", "category", "count", "amount"}, ...]}
+    lines = {key: [] for key in months}
+    for run in _contiguous_runs(months):
+        start = month_bounds(*run[0])[0]
+        end = month_bounds(*run[-1])[1]
+        rows = fetch_all(
+            SRE_LINES_QUERY,
+            (SRE_STATUS, start, end, SRE_STATUS, start, end),
+            name="sre.lines",
+        )
+        for row in rows:
+            lines[(int(row["fiscal_year"]), int(row["month"]))].append({
+                "section": row["section"],
+                "category": row["category"],
+                "count": int(row["count"]),
+                "amount": Decimal(row["amount"] or 0),
+            })
+    return lines
+
+def _load_lines(statement):
+    if isinstance(statement, (bytes, bytearray)):
+        statement = statement.decode("utf-8")
+    lines = json.loads(statement) if isinstance(statement, str) else statement
+    return [{**line, "amount": Decimal(line["amount"])} for line in lines]
+
+_closed = {"version": None, "months": {}}
+_closed_lock = threading.Lock()
+
+def _closed_rows():
+    rows = fetch_all("SELECT fiscal_year, month, statement FROM sre_closed_periods")
+    return {(row["fiscal_year"], row["month"]): _load_lines(row["statement"]) for row in rows}
+
+def closed_month_lines():
+    # {(year, month): lines} of every closed month; reloaded only when the
+    # sre_closed_periods stamp in table_versions moves (close / reopen)
+    uow = current_unit_of_work()
+    if uow and "sre_closed_periods" in uow.written_tables:
+        # uncommitted close/reopen: read it, but never cache it under the
+        # old stamp (it may still roll back)
+        return _closed_rows()
+    version = get_table_versions(["sre_closed_periods"])["sre_closed_periods"][0]
+    with _closed_lock:
+        if _closed["version"] == version:
+            return _closed["months"]
+    months = _closed_rows()
+    with _closed_lock:
+        _closed["version"] = version
+        _closed["months"] = months
+    return months
+
+def month_lines(months):
+    # lines of each month, closed ones from their snapshot
+    closed = closed_month_lines()
+    lines = {key: closed[key] for key in months if key in closed}
+    lines.update(compute_month_lines([key for key in months if key not in closed]))
+    return lines
+
+# statement ===============================================
+def _sum_sections(lines_by_month):
+    sections = {section: {} for section in SECTIONS}
+    for lines in lines_by_month:
+        for line in lines:
+            entry = sections[line["section"]].setdefault(line["category"], {"count": 0, "amount": Decimal(0)})
+            entry["count"] += line["count"]
+            entry["amount"] += line["amount"]
+    return sections
+
+def _comparison(amount, prior_amount):
+    change = amount - prior_amount
+    return {
+        "prior_amount": prior_amount,
+        "change": change,
+        # no percentage against an empty prior period
+        "change_pct": round(float(change / prior_amount * 100), 2) if prior_amount else None,
+    }
+
+def _section(current, prior=None):
+    categories = set(current) | set(prior or {})
+    empty = {"count": 0, "amount": Decimal(0)}
+    lines = []
+    for category in sorted(categories, key=lambda c: (-current.get(c, empty)["amount"], c)):
+        entry = current.get(category, empty)
+        line = {"category": category, "count": entry["count"], "amount": entry["amount"]}
+        if prior is not None:
+            line.update(_comparison(entry["amount"], prior.get(category, empty)["amount"]))
+        lines.append(line)
+    section = {
+        "lines": lines,
+        "count": sum(entry["count"] for entry in current.values()),
+        "total": sum((entry["amount"] for entry in current.values()), Decimal(0)),
+    }
+    if prior is not None:
+        prior_total = sum((entry["amount"] for entry in prior.values()), Decimal(0))
+        section.update(_comparison(section["total"], prior_total))
+    return section
+
+def build_statement(year, month=None, quarter=None, compare=None):
+    months = period_months(year, month, quarter)
+    prior_months = comparison_months(months, compare) if compare else []
+    lines = month_lines(months + [key for key in prior_months if key not in months])
+
+    current = _sum_sections(lines[key] for key in months)
+    prior = _sum_sections(lines[key] for key in prior_months) if compare else {}
+    statement = {
+        "period": {"year": year, "month": month, "quarter": quarter,
+                   "label": period_label(year, month, quarter), **_describe(months)},
+        "compare": compare,
+    }
+    for section in SECTIONS:
+        statement[section] = _section(current[section], prior.get(section))
+    statement["net"] = statement["receipts"]["total"] - statement["expenditures"]["total"]
+    if compare:
+        statement["prior_period"] = _describe(prior_months)
+        statement["net_comparison"] = _comparison(
+            statement["net"],
+            statement["receipts"]["prior_amount"] - statement["expenditures"]["prior_amount"],
+        )
+    closed = closed_month_lines()
+    statement["closed_months"] = [f"{y}-{m:02d}" for y, m in months if (y, m) in closed]
+    return statement
+
+# closing =================================================
+def close_period(year, month, closed_by=None):
+    # snapshot one finished month; later ledger edits no longer change it.
+    # Callers build the statement once the close has committed.
+    today = date.today()
+    if (year, month) >= (today.year, today.month):
+        raise ValueError("Only months that have ended can be closed")
+    lines = compute_month_lines([(year, month)])[(year, month)]
+    statement = json.dumps(
+        [{**line, "amount": str(line["amount"])} for line in lines],
+        separators=(",", ":"),
+    )
+    try:
+        with transaction():
+            execute_query(
+                "INSERT INTO sre_closed_periods (fiscal_year, month, statement, closed_by) VALUES (%s, %s, %s, %s)",
+                (year, month, statement, closed_by),
+            )
+    except Exception as e:
+        if getattr(e, "errno", None) == 1062:
+            raise PeriodAlreadyClosed(f"{period_label(year, month)} is already closed")
+        raise
+
+def reopen_period(year, month):
+    with transaction():
+        return execute_query(
+            "DELETE FROM sre_closed_periods WHERE fiscal_year = %s AND month = %s",
+            (year, month),
+        )
+
+# dashboard ===============================================
+def financial_summary(year, today=None):
+    # the reports dashboard cards: the year's totals, and the current month
+    # (December for past years) against the month before
+    today = today or date.today()
+    current_month = today.month if year == today.year else 12
+    totals = build_statement(year)
+    month = build_statement(year, month=current_month, compare="prior_period")
+    return {
+        "year": year,
+        "month": current_month,
+        "totalRevenues": float(totals["receipts"]["total"]),
+        "totalExpenses": float(totals["expenditures"]["total"]),
+        "netBalance": float(totals["net"]),
+        "currentMonthRevenues": float(month["receipts"]["total"]),
+        "currentMonthExpenses": float(month["expenditures"]["total"]),
+        "revenueGrowth": month["receipts"]["change_pct"] or 0,
+        "expenseGrowth": month["expenditures"]["change_pct"] or 0,
+    }
@@ -1,124 +1,68 @@
-from app.model.encoder.budget_entries_db import get_budget_entries_db
-from app.model.encoder.dfur_db import get_all_dfur_db
-from app.model.encoder.disbursements_db import get_disbursement_db
-from app.model.encoder.collections_db import get_collection_db
+from app.utils.execute_query import fetch_all
+from app.services.ledger_tables import LEDGER_TABLES, COUNTERS
+from app.services.ledger_summary import is_enabled as summary_enabled, read_summary_totals
+from app.database.query_registry import register_query, SAMPLE_YEAR, SAMPLE_RANGE
 
-def handle_data(data_name, year):
-    try:
-        if data_name == "budget_entries":
-            data = get_budget_entries_db(year)
-        elif data_name == "dfur_projects":
-            data = get_all_dfur_db()
-        elif data_name == "disbursements":
-            data = get_disbursement_db()
-        elif data_name == "collections":
-            data = get_collection_db()
-        else:
-            data = []
-        return data
-    except Exception as e:
-        print(e)
-        return []
+def build_filters(spec, year=None, start_date=None, end_date=None):
+    conditions = []
+    params = []
+    if year is not None and spec["year"]:
+        conditions.append(f"{spec['year']} = %s")
+        params.append(year)
+    elif year is not None:
+        # range on the date column instead of YEAR(...) so an index can be used
+        conditions.append(f"{spec['date']} >= %s AND {spec['date']} < %s")
+        params.extend([f"{int(year)}-01-01", f"{int(year) + 1}-01-01"])
+    if start_date:
+        conditions.append(f"{spec['date']} >= %s")
+        params.append(start_date)
+    if end_date:
+        conditions.append(f"{spec['date']} < DATE_ADD(%s, INTERVAL 1 DAY)")
+        params.append(end_date)
+    return conditions, params
 
-def total_count(data):
-    try:
-        ...
-        return len(data)
-    except Exception as e:
-        print(e)
-        return 0
+def build_totals_query(data_name, year=None, start_date=None, end_date=None):
+    # every total for one table in a single scan
+    spec = LEDGER_TABLES[data_name]
 
-def total_amount(data):
-    try:
-        ...
-        if data[0]["amount"] is None:
-            return 0
-        return sum(item["amount"] for item in data)
-    except Exception as e:
-        print(e)
-        return 0
+    columns = ["COUNT(*) AS total_data"]
+    for name, condition in spec["counters"].items():
+        columns.append(f"SUM(CASE WHEN {condition} THEN 1 ELSE 0 END) AS {name}")
+    for name, (column, _) in spec["sums"].items():
+        columns.append(f"SUM({column}) AS {name}")
 
-def overall_cost_approved(data):
-    try:
-        ...
-        if data[0]["total_cost_approved"] is None:
-            return 0
-        return sum(item["total_cost_approved"] for item in data)
-    except Exception as e:
-        print(e)
-        return 0
+    conditions, params = build_filters(spec, year, start_date, end_date)
+    query = f"SELECT {', '.join(columns)} FROM {spec['from']}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return query, tuple(params)
 
-def overall_cost_incurred(data):
-    try:
-        ...
-        if data[0]["total_cost_incurred"] is None:
-            return 0
-        return sum(item["total_cost_incurred"] for item in data)
-    except Exception as e:
-        print(e)
-        return 0
+def aggregate_totals(data_name, year=None, start_date=None, end_date=None):
+    spec = LEDGER_TABLES[data_name]
+    query, params = build_totals_query(data_name, year, start_date, end_date)
+    row = fetch_all(query, params, name=f"{data_name}.totals")[0]
 
-def total_active(data):
-    try:
-        ...
-        if data[0]["is_active"] is None:
-            return 0
-        return len([item for item in data if item["is_active"] == 1])
-    except Exception as e:
-        print(e)
-        return 0
-    
-def total_approved(data):
-    try:
-        ...
-        if data[0]["review_status"] is None:
-            return 0
-        return len([item for item in data if item["review_status"] == "approved"])
-    except Exception as e:
-        print(e)
-        return 0
+    # SUM() over integers comes back as Decimal and as NULL on empty tables
+    total_data = {"total_data": int(row["total_data"] or 0)}
+    for name in COUNTERS:
+        total_data[name] = int(row.get(name) or 0)
+    for name in spec["sums"]:
+        total_data[name] = row[name] if row[name] is not None else 0
+    return total_data
 
-def total_pending(data):
-    try:
-        ...
-        if data[0]["review_status"] is None:
-            return 0
-        return len([item for item in data if item["review_status"] == "pending"])
-    except Exception as e:
-        print(e)
-        return 0
-    
-def total_flagged(data):
+for _name in LEDGER_TABLES:
+    register_query(f"{_name}.totals", *build_totals_query(_name))
+    register_query(f"{_name}.totals_year", *build_totals_query(_name, year=SAMPLE_YEAR))
+    register_query(f"{_name}.totals_range", *build_totals_query(_name, None, *SAMPLE_RANGE))
+
+def result_total_data(data_name, year=None, start_date=None, end_date=None):
     try:
         ...
-        if data[0]["is_flagged"] is None:
-            return 0
-        return len([item for item in data if item["is_flagged"] == 1])
+        # year is required for budget entries (allocation year), optional elsewhere
+        if summary_enabled() and not start_date and not end_date:
+            # whole years are served from the incrementally kept ledger_summary
+            return read_summary_totals(data_name, year)
+        return aggregate_totals(data_name, year, start_date, end_date)
     except Exception as e:
         print(e)
         return 0
-    
-def result_total_data(data_name, year=None):
-    try:
-        ...
-        # year is for budget entries
-        data = handle_data(data_name, year)
-            
-        # call the function and create a data
-        total_data = {}
-        total_data["total_data"] = total_count(data)
-        total_data["total_active"] = total_active(data)
-        total_data["total_approved"] = total_approved(data)
-        total_data["total_pending"] = total_pending(data)
-        total_data["total_flagged"] = total_flagged(data)
-        # if dfur there is no amount so change the data
-        if data_name == "dfur_projects":
-            total_data["overall_cost_approved"] = overall_cost_approved(data)
-            total_data["overall_cost_incurred"] = overall_cost_incurred(data)
-        else:
-            total_data["total_amount"] = total_amount(data)
-        
-        return total_data
-    except Exception as e:
-        print(e)
-        return 0
\ No newline at end of file
@@ -0,0 +1,12 @@
+from datetime import datetime
+from app.model.encoder.sequence_db import reserve_sequence_db
+
+def format_transaction_id(prefix, year, number):
+    return f"{prefix}-{year}-{number:03d}"
+
+def next_transaction_ids(prefix, count=1, year=None):
+    # block of `count` unique ids, e.g. COLL-2026-014 .. COLL-2026-113;
+    # a new year starts its own counter
+    year = year or datetime.now().year
+    first = reserve_sequence_db(prefix, year, count)
+    return [format_transaction_id(prefix, year, first + i) for i in range(count)]
@@ -1,28 +1,221 @@
+import time
+from app.config import Config
 from app.database.connection import get_db_connection
+from app.database.unit_of_work import current_unit_of_work, add_commit_listener, notify_committed
+from app.database.table_versions import bump_table_versions
+from app.utils.query_cache import (
+    MISS,
+    current_stamp,
+    get_query_cache,
+    invalidate_tables,
+    is_cacheable_query,
+    query_tables,
+    estimate_size,
+)
+from app.utils.metrics import record_query, caller_query_name
+from app.utils.rowset import RowSet
 
-def fetch_all(query, params=None, dictionary=True):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=dictionary)
+# committed writes drop the cached reads of the tables they touched
+add_commit_listener(invalidate_tables)
+
+def _copy_rows(rows):
+    # callers may mutate what they get back; never hand out the cached list
+    if isinstance(rows, RowSet):
+        return RowSet(rows.columns, list(rows.rows))
+    return [dict(row) if isinstance(row, dict) else row for row in rows]
+
+def _fetch(query, params, dictionary, name, rowset=False):
+    uow = current_unit_of_work()
+
+    cache = get_query_cache()
+    cache_key = None
+    if cache is not None and is_cacheable_query(query):
+        tables = query_tables(query)
+        # read-your-writes: skip the cache for tables this transaction changed
+        if not (uow and uow.written_tables & tables):
+            cache_key = (query, tuple(params or ()), "rowset" if rowset else dictionary)
+            cached = cache.get(cache_key)
+            if cached is not MISS:
+                return _copy_rows(cached)
+
+    if uow and uow.snapshot_stamp is None:
+        uow.snapshot_stamp = current_stamp()
+    read_stamp = uow.snapshot_stamp if uow else current_stamp()
 
-    cursor.execute(query, params or ())
-    results = cursor.fetchall()
+    conn = uow.connection() if uow else get_db_connection()
+    started = time.perf_counter()
+    try:
+        cursor = conn.cursor(dictionary=dictionary)
 
-    cursor.close()
-    conn.close()
+        cursor.execute(query, params or ())
+        results = cursor.fetchall()
+        if rowset:
+            results = RowSet(cursor.column_names, results)
 
+        cursor.close()
+    except Exception as e:
+        record_query(name, "read", time.perf_counter() - started, error=e, query=query, params=params)
+        raise
+    finally:
+        # hand the connection back to the pool even when the query fails
+        if not uow:
+            conn.close()
+    record_query(
+        name, "read", time.perf_counter() - started,
+        rows=len(results), size=estimate_size(results), query=query, params=params,
+    )
+
+    if cache_key is not None:
+        cache.put(cache_key, results, tables, read_stamp)
+        return _copy_rows(results)
     return results
 
-def execute_query(query, params=None):
+def fetch_all(query, params=None, dictionary=True, name=None):
+    # name labels the query in the metrics; defaults to the calling function
+    return _fetch(query, params, dictionary, name or caller_query_name())
+
+def fetch_rowset(query, params=None, name=None):
+    # tuple rows plus one shared column header (see app.utils.rowset)
+    return _fetch(query, params, False, name or caller_query_name(), rowset=True)
+
+def execute_query(query, params=None, name=None):
+    name = name or caller_query_name()
+    uow = current_unit_of_work()
+    if uow:
+        # committed once by the unit of work (end of request / transaction())
+        if uow.snapshot_stamp is None:
+            uow.snapshot_stamp = current_stamp()
+        conn = uow.connection()
+        cursor = conn.cursor()
+        started = time.perf_counter()
+        try:
+            cursor.execute(query, params or ())
+            affected_rows = cursor.rowcount
+        except Exception as e:
+            record_query(name, "write", time.perf_counter() - started, error=e, query=query, params=params)
+            uow.mark_failed()
+            raise
+        finally:
+            cursor.close()
+        record_query(name, "write", time.perf_counter() - started, rows=affected_rows, query=query, params=params)
+        uow.dirty = True
+        uow.written_tables |= query_tables(query)
+        return affected_rows
+
+    conn = get_db_connection()
+    started = time.perf_counter()
+    try:
+        cursor = conn.cursor()
+
+        cursor.execute(query, params or ())
+        bump_table_versions(conn, query_tables(query))
+        conn.commit()
+
+        affected_rows = cursor.rowcount
+
+        cursor.close()
+    except Exception as e:
+        record_query(name, "write", time.perf_counter() - started, error=e, query=query, params=params)
+        raise
+    finally:
+        conn.close()
+    record_query(name, "write", time.perf_counter() - started, rows=affected_rows, query=query, params=params)
+
+    # same listeners as a unit of work commit (query cache, ETag versions)
+    notify_committed(query_tables(query))
+    return affected_rows
+
+def execute_many(query, seq_params, name=None):
+    # one statement for many parameter tuples; for INSERT ... VALUES the
+    # driver sends a single multi-row INSERT instead of one per tuple
+    name = name or caller_query_name()
+    seq_params = list(seq_params)
+    if not seq_params:
+        return 0
+    uow = current_unit_of_work()
+    if uow:
+        if uow.snapshot_stamp is None:
+            uow.snapshot_stamp = current_stamp()
+        conn = uow.connection()
+        cursor = conn.cursor()
+        started = time.perf_counter()
+        try:
+            cursor.executemany(query, seq_params)
+            affected_rows = cursor.rowcount
+        except Exception as e:
+            record_query(name, "write", time.perf_counter() - started, error=e, query=query, params=seq_params[0])
+            uow.mark_failed()
+            raise
+        finally:
+            cursor.close()
+        record_query(name, "write", time.perf_counter() - started, rows=affected_rows, query=query, params=seq_params[0])
+        uow.dirty = True
+        uow.written_tables |= query_tables(query)
+        return affected_rows
+
     conn = get_db_connection()
-    cursor = conn.cursor()
+    started = time.perf_counter()
+    try:
+        cursor = conn.cursor()
 
-    cursor.execute(query, params or ())
-    conn.commit()
+        cursor.executemany(query, seq_params)
+        bump_table_versions(conn, query_tables(query))
+        conn.commit()
 
-    affected_rows = cursor.rowcount
+        affected_rows = cursor.rowcount
 
-    cursor.close()
-    conn.close()
+        cursor.close()
+    except Exception as e:
+        record_query(name, "write", time.perf_counter() - started, error=e, query=query, params=seq_params[0])
+        raise
+    finally:
+        conn.close()
+    record_query(name, "write", time.perf_counter() - started, rows=affected_rows, query=query, params=seq_params[0])
 
+    # same listeners as a unit of work commit (query cache, ETag versions)
+    notify_committed(query_tables(query))
     return affected_rows
 
+def iter_rows(query, params=None, dictionary=True, batch_size=None, name=None):
+    # unbuffered server-side cursor: rows are pulled from MySQL batch by
+    # batch while the caller consumes them, so memory stays flat. Always runs
+    # on its own pooled connection because the connection is busy until the
+    # result set is fully read.
+    # the name is taken here: the generator body runs later, from the response
+    name = name or caller_query_name()
+    return _iter_rows(query, params, dictionary, batch_size or Config.DB_FETCH_BATCH_SIZE, name)
+
+def _iter_rows(query, params, dictionary, batch_size, name):
+    conn = get_db_connection()
+    cursor = None
+    started = time.perf_counter()
+    rows_read = 0
+    size = 0
+    error = None
+    try:
+        cursor = conn.cursor(dictionary=dictionary, buffered=False)
+        cursor.execute(query, params or ())
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            rows_read += len(rows)
+            size += estimate_size(rows)
+            yield from rows
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        # duration covers the whole stream, including time spent sending it
+        record_query(
+            name, "stream", time.perf_counter() - started,
+            rows=rows_read, size=size, error=error, query=query, params=params,
+        )
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                # abandoned mid-stream; the pool drops the connection
+                pass
+        conn.close()
@@ -0,0 +1,59 @@
+from datetime import date
+from decimal import Decimal
+from flask.json.provider import DefaultJSONProvider, _default
+from werkzeug.http import http_date
+from app.config import Config
+from app.utils.rowset import RowSet
+
+try:
+    import orjson
+except ImportError:  # optional speedup; falls back to the stdlib encoder
+    orjson = None
+
+# Flask JSON provider for the list-heavy routes. Output matches the default
+# provider (Decimal -> "123.45", dates -> HTTP date strings, sorted keys),
+# but with orjson installed the encoding runs in C instead of walking every
+# row in Python. RowSet results serialise as a list of objects.
+
+# dumps() arguments orjson can honour; anything else goes to the stdlib
+FAST_DUMP_ARGS = {"indent", "separators", "default", "sort_keys"}
+
+
+def _json_default(o):
+    if isinstance(o, RowSet):
+        return o.as_dicts()
+    return _default(o)
+
+def _fast_default(o):
+    # orjson handles str/int/float/list/dict/tuple/dataclass itself
+    if isinstance(o, Decimal):
+        return str(o)
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, RowSet):
+        return [dict(zip(o.columns, row)) for row in o.rows]
+    return _default(o)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    default = staticmethod(_json_default)
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.fast = orjson is not None and Config.JSON_FAST_ENCODER
+
+    def dumps(self, obj, **kwargs):
+        if not self.fast or not set(kwargs) <= FAST_DUMP_ARGS:
+            return super().dumps(obj, **kwargs)
+
+        # datetimes go through _fast_default so they keep the HTTP date format
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_fast_default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder copes
+            return super().dumps(obj, **kwargs)
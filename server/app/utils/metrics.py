@@ -0,0 +1,201 @@
+import logging
+import re
+import sys
+import threading
+import time
+from flask import g, request
+from app.config import Config
+
+# In-process metrics for the model layer and the HTTP endpoints, rendered
+# in the Prometheus text format by /api/metrics. Each worker process keeps
+# its own numbers; Prometheus sums them across scrape targets.
+
+# seconds; covers cached lookups up to month-end report scans
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# helpers between a model function and the driver; query names skip them
+PASS_THROUGH_MODULES = {
+    __name__,
+    "app.utils.execute_query",
+    "app.utils.pagination",
+}
+
+slow_query_logger = logging.getLogger("app.slow_query")
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}  # (metric, labels) -> Histogram
+        self._counters = {}  # (metric, labels) -> number
+
+    def observe(self, metric, labels, value):
+        key = (metric, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def inc(self, metric, labels, amount=1):
+        key = (metric, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def render(self):
+        with self._lock:
+            histograms = {
+                key: (list(h.counts), h.count, h.sum, h.buckets)
+                for key, h in self._histograms.items()
+            }
+            counters = dict(self._counters)
+
+        lines = []
+        for metric in sorted({metric for metric, _ in histograms}):
+            lines.append(f"# HELP {metric} {METRIC_HELP.get(metric, metric)}")
+            lines.append(f"# TYPE {metric} histogram")
+            for (name, labels), (counts, count, total, buckets) in sorted(histograms.items()):
+                if name != metric:
+                    continue
+                cumulative = 0
+                for bound, bucket_count in zip(buckets, counts):
+                    cumulative += bucket_count
+                    lines.append(f"{metric}_bucket{format_labels(labels + (('le', repr(float(bound))),))} {cumulative}")
+                lines.append(f"{metric}_bucket{format_labels(labels + (('le', '+Inf'),))} {count}")
+                lines.append(f"{metric}_sum{format_labels(labels)} {total:.6f}")
+                lines.append(f"{metric}_count{format_labels(labels)} {count}")
+
+        for metric in sorted({metric for metric, _ in counters}):
+            lines.append(f"# HELP {metric} {METRIC_HELP.get(metric, metric)}")
+            lines.append(f"# TYPE {metric} counter")
+            for (name, labels), value in sorted(counters.items()):
+                if name == metric:
+                    lines.append(f"{metric}{format_labels(labels)} {value}")
+        return lines
+
+
+METRIC_HELP = {
+    "db_query_duration_seconds": "Time spent running a model query, by query name.",
+    "db_query_rows_total": "Rows returned (reads) or affected (writes), by query name.",
+    "db_query_bytes_total": "Approximate in-memory size of rows returned, by query name.",
+    "db_query_errors_total": "Queries that raised, by query name.",
+    "db_slow_queries_total": "Queries slower than SLOW_QUERY_MS, by query name.",
+    "http_request_duration_seconds": "Time to produce a response, by Flask endpoint.",
+}
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels) + "}"
+
+_registry = MetricsRegistry()
+
+def get_metrics():
+    return _registry
+
+def caller_query_name(depth=2):
+    # "<model module>.<function>" of the code that issued the query
+    frame = sys._getframe(depth)
+    while frame is not None and frame.f_globals.get("__name__") in PASS_THROUGH_MODULES:
+        frame = frame.f_back
+    if frame is None:
+        return "unknown"
+    module = frame.f_globals.get("__name__", "").rsplit(".", 1)[-1]
+    return f"{module}.{frame.f_code.co_name}"
+
+def params_shape(params):
+    # types only: parameter values can be personal data
+    if not params:
+        return "()"
+    if isinstance(params, dict):
+        return "{" + ", ".join(f"{k}: {type(v).__name__}" for k, v in params.items()) + "}"
+    return "(" + ", ".join(type(v).__name__ for v in params) + ")"
+
+def _compact_sql(query):
+    return re.sub(r"\s+", " ", query).strip()
+
+def record_query(name, kind, duration, rows=0, size=0, error=None, query=None, params=None):
+    labels = (("query", name), ("kind", kind))
+    _registry.observe("db_query_duration_seconds", labels, duration)
+    if rows:
+        _registry.inc("db_query_rows_total", labels, rows)
+    if size:
+        _registry.inc("db_query_bytes_total", labels, size)
+    if error is not None:
+        _registry.inc("db_query_errors_total", labels + (("error", type(error).__name__),))
+
+    threshold = Config.SLOW_QUERY_MS
+    if threshold and duration * 1000 >= threshold:
+        _registry.inc("db_slow_queries_total", labels)
+        slow_query_logger.warning(
+            "slow query %s (%s) %.1fms rows=%s params=%s sql=%s",
+            name,
+            kind,
+            duration * 1000,
+            rows,
+            params_shape(params),
+            _compact_sql(query or ""),
+        )
+
+def render_metrics(extra_gauges=None):
+    # extra_gauges: {metric: (help, value)} sampled at scrape time;
+    # *_total values are running counts kept elsewhere (pool, cache)
+    lines = _registry.render()
+    for metric, (help_text, value) in sorted((extra_gauges or {}).items()):
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {'counter' if metric.endswith('_total') else 'gauge'}")
+        lines.append(f"{metric} {value}")
+    return "\n".join(lines) + "\n"
+
+# per-endpoint latency =================================
+def _start_timer():
+    g.request_started_at = time.perf_counter()
+
+def _record_request(response):
+    started = g.pop("request_started_at", None)
+    if started is not None:
+        labels = (
+            ("endpoint", request.endpoint or "unmatched"),
+            ("method", request.method),
+            ("status", str(response.status_code)),
+        )
+        _registry.observe("http_request_duration_seconds", labels, time.perf_counter() - started)
+    return response
+
+def init_metrics(app):
+    if not slow_query_logger.handlers:
+        if Config.SLOW_QUERY_LOG_FILE:
+            handler = logging.FileHandler(Config.SLOW_QUERY_LOG_FILE)
+        else:
+            handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.WARNING)
+    slow_query_logger.propagate = False
+
+    app.before_request(_start_timer)
+    app.after_request(_record_request)
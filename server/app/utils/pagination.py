@@ -0,0 +1,140 @@
+import base64
+import json
+from datetime import datetime
+from flask import jsonify, request
+from app.config import Config
+from app.utils.execute_query import fetch_all
+
+# keyset (cursor) pagination on (created_at, id): every page is an index
+# range scan of `limit` rows no matter how deep the client pages
+
+def encode_cursor(created_at, row_id, direction):
+    payload = {
+        "k": [created_at.isoformat() if created_at else None, row_id],
+        "d": direction,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(token):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        created_at, row_id = payload["k"]
+        direction = payload["d"]
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        if not isinstance(row_id, (int, str)):
+            raise ValueError(row_id)
+        return datetime.fromisoformat(created_at), row_id, direction
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def get_page_args(always=False):
+    # None means the caller did not ask for paging (legacy full list)
+    args = request.args
+    if not always and "limit" not in args and "cursor" not in args:
+        return None
+
+    try:
+        limit = int(args.get("limit", Config.PAGE_SIZE_DEFAULT))
+    except ValueError:
+        raise ValueError("limit must be a number")
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    limit = min(limit, Config.PAGE_SIZE_MAX)
+
+    page = {
+        "limit": limit,
+        "after": None,
+        "direction": "next",
+        "include_total": args.get("include_total", "").lower() in ("1", "true"),
+    }
+    if args.get("cursor"):
+        created_at, row_id, direction = decode_cursor(args["cursor"])
+        page["after"] = (created_at, row_id)
+        page["direction"] = direction
+    return page
+
+def keyset_condition(page, created_col="created_at", id_col="id"):
+    # WHERE fragment (and its params) selecting the rows after the cursor
+    if not page["after"]:
+        return None, []
+    op = "<" if page["direction"] == "next" else ">"
+    created_at, row_id = page["after"]
+    # expanded form of (created_at, id) < (%s, %s) so MySQL can range-scan
+    condition = f"({created_col} {op} %s OR ({created_col} = %s AND {id_col} {op} %s))"
+    return condition, [created_at, created_at, row_id]
+
+def keyset_order(page, created_col="created_at", id_col="id"):
+    order = "DESC" if page["direction"] == "next" else "ASC"
+    return f"ORDER BY {created_col} {order}, {id_col} {order}"
+
+def build_page_result(rows, page, created_key="created_at", id_key="id"):
+    # rows: up to limit + 1 rows in query order
+    forward = page["direction"] == "next"
+    has_more = len(rows) > page["limit"]
+    rows = rows[:page["limit"]]
+    if not forward:
+        rows.reverse()
+
+    next_cursor = None
+    prev_cursor = None
+    if rows:
+        first, last = rows[0], rows[-1]
+        # a "prev" page was reached from an older page, so one always follows
+        if has_more or not forward:
+            next_cursor = encode_cursor(last[created_key], last[id_key], "next")
+        if (forward and page["after"]) or (not forward and has_more):
+            prev_cursor = encode_cursor(first[created_key], first[id_key], "prev")
+
+    return {"rows": rows, "next_cursor": next_cursor, "prev_cursor": prev_cursor}
+
+def build_keyset_query(
+    select_from,
+    page,
+    where=None,
+    params=(),
+    created_col="created_at",
+    id_col="id",
+):
+    # select_from: "SELECT ... FROM ... [JOIN ...]" without WHERE/ORDER/LIMIT
+    conditions = [where] if where else []
+    args = list(params)
+
+    condition, condition_args = keyset_condition(page, created_col, id_col)
+    if condition:
+        conditions.append(condition)
+        args.extend(condition_args)
+
+    query = select_from
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += f" {keyset_order(page, created_col, id_col)} LIMIT %s"
+    args.append(page["limit"] + 1)
+    return query, tuple(args)
+
+def fetch_keyset_page(
+    select_from,
+    page,
+    where=None,
+    params=(),
+    created_col="created_at",
+    id_col="id",
+    created_key="created_at",
+    id_key="id",
+):
+    # *_col are the SQL key expressions, *_key their names in the result rows
+    query, args = build_keyset_query(select_from, page, where, params, created_col, id_col)
+    rows = fetch_all(query, args)
+    return build_page_result(rows, page, created_key, id_key)
+
+def paginated_response(body, result, total=None):
+    response = jsonify(body)
+    if result["next_cursor"]:
+        response.headers["X-Next-Cursor"] = result["next_cursor"]
+    if result["prev_cursor"]:
+        response.headers["X-Prev-Cursor"] = result["prev_cursor"]
+    if total is not None:
+        response.headers["X-Total-Count"] = str(total)
+    return response, 200
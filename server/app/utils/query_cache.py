@@ -0,0 +1,191 @@
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from app.config import Config
+
+# In-process cache of fetch_all results keyed by SQL + params. Each entry
+# is tagged with the tables its query reads; committing a write to one of
+# those tables drops every entry tagged with it. Entries also expire after
+# a TTL, which bounds staleness when several worker processes each keep
+# their own cache.
+
+TABLE_PATTERN = re.compile(r"\b(?:FROM|JOIN|UPDATE|INTO)\s+`?(\w+)`?", re.IGNORECASE)
+# results that change with the clock alone (lease expiry, settle windows)
+CLOCK_PATTERN = re.compile(r"\b(?:NOW|CURRENT_TIMESTAMP|UTC_TIMESTAMP|CURDATE|SYSDATE)\s*\(", re.IGNORECASE)
+LOCKING_PATTERN = re.compile(r"\bFOR\s+UPDATE\b|\bLOCK\s+IN\s+SHARE\s+MODE\b|\bFOR\s+SHARE\b", re.IGNORECASE)
+# bumped on a raw cursor at commit, outside the invalidation this cache
+# relies on; conditional_get keeps its own short-lived copy of the stamps
+UNCACHED_TABLES = frozenset({"table_versions"})
+
+MISS = object()
+
+@lru_cache(maxsize=2048)
+def query_tables(query):
+    return frozenset(name.lower() for name in TABLE_PATTERN.findall(query))
+
+@lru_cache(maxsize=2048)
+def is_cacheable_query(query):
+    # table-less selects (LAST_INSERT_ID(), NOW(), ...) are session/time
+    # dependent and can never be invalidated, so they are not cached
+    stripped = query.lstrip().upper()
+    return (stripped.startswith("SELECT") or stripped.startswith("WITH")) \
+        and not LOCKING_PATTERN.search(query) \
+        and not CLOCK_PATTERN.search(query) \
+        and bool(query_tables(query)) \
+        and not query_tables(query) & UNCACHED_TABLES
+
+def estimate_size(rows):
+    # sample a few rows instead of walking the whole result
+    rows = getattr(rows, "rows", rows)  # RowSet: size the tuples
+    if not rows:
+        return sys.getsizeof(rows)
+    sample = rows[:16]
+    per_row = 0
+    for row in sample:
+        values = row.values() if isinstance(row, dict) else row
+        per_row += sys.getsizeof(row) + sum(sys.getsizeof(v) for v in values)
+    return sys.getsizeof(rows) + per_row * len(rows) // len(sample)
+
+
+class QueryCache:
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024, ttl=60):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries = OrderedDict()  # key -> (rows, tables, size, expires_at)
+        self._by_table = {}  # table -> set of keys
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # monotonic stamp of the last invalidation per table, used to refuse
+        # results read before a concurrent write committed
+        self._clock = 0
+        self._invalidated_at = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.rejected = 0
+
+    def stamp(self):
+        with self._lock:
+            return self._clock
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS
+            if entry[3] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, rows, tables, read_stamp):
+        size = estimate_size(rows)
+        with self._lock:
+            if size > self.max_bytes or any(
+                self._invalidated_at.get(table, -1) > read_stamp for table in tables
+            ):
+                # too big, or a write committed while the query was running
+                self.rejected += 1
+                return False
+
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (rows, tables, size, time.monotonic() + self.ttl)
+            self._bytes += size
+            for table in tables:
+                self._by_table.setdefault(table, set()).add(key)
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+            return True
+
+    def invalidate_tables(self, tables):
+        with self._lock:
+            self._clock += 1
+            for table in tables:
+                table = table.lower()
+                self._invalidated_at[table] = self._clock
+                for key in self._by_table.pop(table, ()):
+                    if key in self._entries:
+                        self._remove(key)
+                        self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_table.clear()
+            self._bytes = 0
+
+    def _remove(self, key):
+        rows, tables, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        for table in tables:
+            keys = self._by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_table[table]
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "rejected": self.rejected,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_query_cache():
+    # None while the cache is switched off (QUERY_CACHE_ENABLED)
+    global _cache
+    if not Config.QUERY_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = QueryCache(
+                    max_entries=Config.QUERY_CACHE_MAX_ENTRIES,
+                    max_bytes=Config.QUERY_CACHE_MAX_BYTES,
+                    ttl=Config.QUERY_CACHE_TTL,
+                )
+    return _cache
+
+def current_stamp():
+    cache = get_query_cache()
+    return cache.stamp() if cache is not None else 0
+
+def invalidate_tables(tables):
+    cache = get_query_cache()
+    if cache is not None and tables:
+        cache.invalidate_tables(tables)
@@ -0,0 +1,57 @@
+from flask import request
+
+# Compact query result: one shared tuple of column names plus plain tuple
+# rows, instead of a dict (and its key references) per row. Iterating or
+# indexing still yields dicts, so code written for fetch_all keeps working;
+# the JSON provider serialises it directly.
+
+ROW_SHAPES = ("objects", "columnar")
+
+
+class RowSet:
+    __slots__ = ("columns", "rows")
+
+    def __init__(self, columns, rows):
+        self.columns = tuple(columns)
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __bool__(self):
+        return bool(self.rows)
+
+    def __iter__(self):
+        columns = self.columns
+        for row in self.rows:
+            yield dict(zip(columns, row))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return RowSet(self.columns, self.rows[index])
+        return dict(zip(self.columns, self.rows[index]))
+
+    def as_dicts(self):
+        return list(self)
+
+    def columnar(self):
+        # {"columns": [...], "rows": [[...], ...]}: keys sent once per response
+        return {"columns": list(self.columns), "rows": self.rows}
+
+
+def get_row_shape():
+    # ?shape=columnar -> {"columns": [...], "rows": [[...], ...]}
+    shape = request.args.get("shape", "objects")
+    if shape not in ROW_SHAPES:
+        raise ValueError(f"shape must be one of: {', '.join(ROW_SHAPES)}")
+    return shape
+
+def shape_rows(rows, shape):
+    # body for a list route in the requested shape
+    if shape != "columnar":
+        return rows
+    if isinstance(rows, RowSet):
+        return rows.columnar()
+    rows = list(rows or [])
+    columns = list(rows[0]) if rows else []
+    return {"columns": columns, "rows": [[row[c] for c in columns] for row in rows]}
@@ -0,0 +1,156 @@
+import csv
+import io
+import os
+import tempfile
+import zlib
+from flask import Response, current_app, request, stream_with_context
+
+# flush to the client roughly every 64 KiB instead of once per row
+CHUNK_SIZE = 64 * 1024
+
+STREAM_MODES = ("json", "ndjson")
+
+def get_stream_mode():
+    # ?stream=json   -> JSON array (same body as the buffered route)
+    # ?stream=ndjson -> one JSON document per line
+    mode = request.args.get("stream")
+    if mode in STREAM_MODES:
+        return mode
+    if mode is None and request.accept_mimetypes.best == "application/x-ndjson":
+        return "ndjson"
+    return None
+
+def _dumps(obj):
+    return current_app.json.dumps(obj, separators=(",", ":"))
+
+def _chunked(pieces):
+    pieces = iter(pieces)
+    # send the opening bytes right away, before the first batch arrives
+    for piece in pieces:
+        yield piece
+        break
+
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+def _json_array(rows, prefix, suffix):
+    yield prefix + "["
+    first = True
+    for row in rows:
+        if first:
+            first = False
+            yield _dumps(row)
+        else:
+            yield "," + _dumps(row)
+    yield "]" + suffix
+
+def _ndjson(rows):
+    for row in rows:
+        yield _dumps(row) + "\n"
+
+def stream_rows(rows, mode, envelope=None):
+    # envelope wraps the array for routes whose body is {"...": ..., "data": [...]}
+    if mode == "ndjson":
+        body = _ndjson(rows)
+        mimetype = "application/x-ndjson"
+    else:
+        prefix, suffix = "", ""
+        if envelope:
+            head = _dumps(envelope["meta"])[:-1]
+            prefix = head + ("," if head != "{" else "") + _dumps(envelope["key"]) + ":"
+            suffix = "}"
+        body = _json_array(rows, prefix, suffix)
+        mimetype = "application/json"
+
+    return Response(stream_with_context(_chunked(body)), mimetype=mimetype)
+
+# file exports ==========================================
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+def _csv_lines(columns, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+def _ndjson_records(columns, rows):
+    for row in rows:
+        yield _dumps(dict(zip(columns, row))) + "\n"
+
+def _xlsx_file(columns, rows):
+    # openpyxl's write-only mode spills rows to a temp file instead of
+    # holding them; the zip can only be sent once the sheet is complete
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(list(columns))
+    for row in rows:
+        sheet.append(list(row))
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        workbook.save(path)
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+    finally:
+        os.remove(path)
+
+def _encoded(pieces):
+    for piece in pieces:
+        yield piece.encode("utf-8") if isinstance(piece, str) else piece
+
+def _gzipped(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # 31: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def wants_gzip():
+    return request.args.get("gzip", "").lower() in ("1", "true") or "gzip" in request.accept_encodings
+
+def stream_export(columns, rows, file_format, filename, gzip=False):
+    # rows: tuples in `columns` order, typically from iter_rows(dictionary=False)
+    if file_format == "csv":
+        body = _encoded(_chunked(_csv_lines(columns, rows)))
+    elif file_format == "ndjson":
+        body = _encoded(_chunked(_ndjson_records(columns, rows)))
+    else:
+        # already zip-compressed
+        body = _xlsx_file(columns, rows)
+        gzip = False
+
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if gzip:
+        body = _gzipped(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+
+    # no Content-Length: the WSGI server sends it with chunked encoding
+    return Response(stream_with_context(body), mimetype=EXPORT_FORMATS[file_format], headers=headers)
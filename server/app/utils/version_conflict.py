@@ -0,0 +1,14 @@
+from flask import jsonify
+from app.model.row_version_db import get_current_row_db
+
+def version_conflict_response(table, row_id, row_version):
+    # 409 with the current row when a versioned update matched nothing
+    # because someone else changed the row first; None for any other
+    # failure (missing row, database error) so the caller answers as before
+    current = get_current_row_db(table, row_id)
+    if current is None or current["row_version"] == row_version:
+        return None
+    return jsonify({
+        "message": "This record was changed by someone else; review the current version and try again",
+        "current": current,
+    }), 409
@@ -0,0 +1,74 @@
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+# Field checks for collection / disbursement / budget entry payloads,
+# mirroring the columns the insert queries read. transaction_id is optional:
+# bulk inserts assign missing ids from transaction_sequences.
+
+def _check_required(entry, fields):
+    for field in fields:
+        if field not in entry or entry[field] is None or not str(entry[field]).strip():
+            return f"Missing field: {field}"
+    return None
+
+def _check_date(entry, field):
+    try:
+        date.fromisoformat(str(entry[field]))
+    except ValueError:
+        return f"{field} must be a date (YYYY-MM-DD)"
+    return None
+
+def _check_amount(entry, field):
+    value = entry[field]
+    if isinstance(value, bool):
+        return f"{field} must be a number"
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        return f"{field} must be a number"
+    if not amount.is_finite() or amount <= 0:
+        return f"{field} must be greater than 0"
+    return None
+
+def _check_id(entry, field):
+    value = entry.get(field)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not str(value).isdigit():
+        return f"{field} must be a positive integer"
+    return None
+
+def _validate(entry, required, id_fields):
+    if not entry or not isinstance(entry, dict):
+        return False, "Invalid entry payload"
+
+    checks = [_check_required(entry, required)]
+    if checks[0] is None:
+        checks.append(_check_date(entry, "transaction_date"))
+        checks.append(_check_amount(entry, "amount"))
+        checks.extend(_check_id(entry, field) for field in id_fields)
+    transaction_id = entry.get("transaction_id")
+    if transaction_id is not None and (not isinstance(transaction_id, str) or not transaction_id.strip()):
+        checks.append("transaction_id must be a non-empty string")
+
+    for message in checks:
+        if message:
+            return False, message
+    return True, "Valid entry"
+
+def validate_collection(entry):
+    return _validate(entry, ["transaction_date", "amount", "created_by"], ["created_by"])
+
+def validate_disbursement(entry):
+    return _validate(
+        entry,
+        ["transaction_date", "amount", "created_by", "allocation_id"],
+        ["created_by", "allocation_id"],
+    )
+
+def validate_budget_entry(entry):
+    return _validate(
+        entry,
+        ["transaction_date", "category", "amount", "created_by"],
+        ["created_by", "allocation_id"],
+    )
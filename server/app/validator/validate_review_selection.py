@@ -0,0 +1,44 @@
+from datetime import date
+
+# Bulk review payloads pick rows either by id or by a filter:
+#   {"ids": [1, 2, 3]}
+#   {"filter": {"start_date": "2026-01-01", "end_date": "2026-01-31"}}
+
+def _check_date(value, field):
+    try:
+        date.fromisoformat(str(value))
+    except ValueError:
+        return f"{field} must be a date (YYYY-MM-DD)"
+    return None
+
+def validate_review_selection(data, max_rows):
+    if not data or not isinstance(data, dict):
+        return False, "Invalid payload"
+
+    ids = data.get("ids")
+    selection_filter = data.get("filter")
+    if (ids is None) == (selection_filter is None):
+        return False, "Provide either ids or filter"
+
+    if ids is not None:
+        if not isinstance(ids, list) or not ids:
+            return False, "ids must be a non-empty list"
+        if any(isinstance(i, bool) or not isinstance(i, int) or i < 1 for i in ids):
+            return False, "ids must be positive integers"
+        if len(ids) > max_rows:
+            return False, f"At most {max_rows} ids per request"
+        return True, "Valid selection"
+
+    if not isinstance(selection_filter, dict):
+        return False, "filter must be an object"
+    unknown = set(selection_filter) - {"start_date", "end_date"}
+    if unknown:
+        return False, f"Unknown filter fields: {', '.join(sorted(unknown))}"
+    if not selection_filter.get("start_date") or not selection_filter.get("end_date"):
+        # a filter without a range would sweep the whole table
+        return False, "filter needs start_date and end_date"
+    for field in ("start_date", "end_date"):
+        message = _check_date(selection_filter[field], field)
+        if message:
+            return False, message
+    return True, "Valid selection"
@@ -0,0 +1,12 @@
+# Update payloads carry the row_version they were loaded with (every row
+# returned by the API has one); see migration 0007.
+
+def validate_row_version(data):
+    if not data or not isinstance(data, dict):
+        return False, "Invalid payload"
+    row_version = data.get("row_version")
+    if row_version is None:
+        return False, "row_version is required; reload the row and try again"
+    if isinstance(row_version, bool) or not isinstance(row_version, int) or row_version < 1:
+        return False, "row_version must be a positive integer"
+    return True, "Valid row_version"
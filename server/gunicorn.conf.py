@@ -0,0 +1,25 @@
+import os
+
+# Production server: gunicorn -c gunicorn.conf.py run:app
+#
+# gevent workers serve each connection from a greenlet, so the long-lived
+# /api/events streams do not each hold an OS thread. The event bus lives
+# in-process: an event only reaches streams held by the worker that made
+# the write, so keep one worker unless the bus is moved out of process.
+# (flask run works for development, with one thread per open stream.)
+#
+# Database access must cooperate with gevent too: mysql-connector's C
+# extension blocks the whole worker while a query runs, so under gevent
+# app/database/connection.py opens connections with use_pure=True. Any
+# other blocking C driver added later needs the same treatment, or the
+# event streams should move to a gthread worker.
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("GUNICORN_WORKERS", 1))
+worker_class = "gevent"
+# concurrent connections (requests + event streams) per worker; keep the
+# DB pool (DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW) sized for the requests
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+# event streams stay open; heartbeats keep them well inside this
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+keepalive = 5
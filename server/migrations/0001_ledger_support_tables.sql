@@ -0,0 +1,26 @@
+-- =========================================
+-- LEDGER SUMMARY (running totals per bucket)
+-- maintained by the write paths; rebuild with `flask ledger-summary rebuild`
+-- =========================================
+CREATE TABLE IF NOT EXISTS ledger_summary (
+  table_name VARCHAR(50) NOT NULL,
+  fiscal_year INT NOT NULL,
+  review_status VARCHAR(20) NOT NULL DEFAULT '',
+  is_flagged TINYINT NOT NULL DEFAULT 0,
+  is_active TINYINT NOT NULL DEFAULT 1,
+  row_count INT NOT NULL DEFAULT 0,
+  amount_total DECIMAL(16,2) NOT NULL DEFAULT 0,
+  cost_approved_total DECIMAL(16,2) NOT NULL DEFAULT 0,
+  cost_incurred_total DECIMAL(16,2) NOT NULL DEFAULT 0,
+  PRIMARY KEY (table_name, fiscal_year, review_status, is_flagged, is_active)
+) ENGINE=InnoDB;
+
+-- =========================================
+-- TRANSACTION ID SEQUENCES (one counter per prefix per year)
+-- =========================================
+CREATE TABLE IF NOT EXISTS transaction_sequences (
+  prefix VARCHAR(10) NOT NULL,
+  year INT NOT NULL,
+  last_value INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (prefix, year)
+) ENGINE=InnoDB;
@@ -0,0 +1,33 @@
+-- =========================================
+-- Indexes matching the model queries. Checked by `flask db explain`.
+-- InnoDB appends the primary key to every secondary index; (created_at, id)
+-- spells it out because the keyset pages order and seek on both.
+-- =========================================
+
+-- COLLECTIONS
+-- list pages / activity feed: ORDER BY created_at DESC, id DESC
+CREATE INDEX idx_collections_created ON collections (created_at, id);
+-- activity feed filtered by ?status=
+CREATE INDEX idx_collections_status_created ON collections (review_status, created_at, id);
+CREATE INDEX idx_collections_flagged_created ON collections (is_flagged, created_at, id);
+-- date range reports and totals; covering, so the totals never touch rows
+CREATE INDEX idx_collections_date_totals ON collections (transaction_date, review_status, is_flagged, is_active, amount);
+
+-- DISBURSEMENTS
+CREATE INDEX idx_disbursements_created ON disbursements (created_at, id);
+CREATE INDEX idx_disbursements_status_created ON disbursements (review_status, created_at, id);
+CREATE INDEX idx_disbursements_flagged_created ON disbursements (is_flagged, created_at, id);
+CREATE INDEX idx_disbursements_date_totals ON disbursements (transaction_date, review_status, is_flagged, amount);
+
+-- DFUR PROJECTS
+CREATE INDEX idx_dfur_projects_created ON dfur_projects (created_at, id);
+CREATE INDEX idx_dfur_projects_status_created ON dfur_projects (review_status, created_at, id);
+CREATE INDEX idx_dfur_projects_flagged_created ON dfur_projects (is_flagged, created_at, id);
+CREATE INDEX idx_dfur_projects_date_totals ON dfur_projects (transaction_date, review_status, is_flagged, is_active, total_cost_approved, total_cost_incurred);
+
+-- BUDGET ENTRIES (read through budget_allocations by fiscal year)
+-- allocations of one year, then their entries in created_at order
+CREATE INDEX idx_budget_allocations_year ON budget_allocations (year, id);
+CREATE INDEX idx_budget_entries_allocation_created ON budget_entries (allocation_id, created_at, id);
+CREATE INDEX idx_budget_entries_created ON budget_entries (created_at, id);
+CREATE INDEX idx_budget_entries_date_totals ON budget_entries (transaction_date, allocation_id, amount);
@@ -0,0 +1,25 @@
+-- =========================================
+-- IMPORT JOBS (CSV/XLSX ledger imports, resumable)
+-- last_row is the last source row whose batch committed; a resumed job
+-- skips everything up to it.
+-- =========================================
+CREATE TABLE IF NOT EXISTS import_jobs (
+  id INT AUTO_INCREMENT PRIMARY KEY,
+  table_name VARCHAR(50) NOT NULL,
+  file_name VARCHAR(255) NOT NULL,
+  file_path VARCHAR(500) NOT NULL,
+  file_format ENUM('csv','xlsx') NOT NULL,
+  column_mapping TEXT,
+  status ENUM('pending','running','completed','failed') NOT NULL DEFAULT 'pending',
+  last_row INT NOT NULL DEFAULT 0,
+  inserted_rows INT NOT NULL DEFAULT 0,
+  failed_rows INT NOT NULL DEFAULT 0,
+  error_report_path VARCHAR(500),
+  message TEXT,
+  created_by INT NOT NULL,
+  created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+  updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+  CONSTRAINT fk_import_jobs_creator
+    FOREIGN KEY (created_by) REFERENCES users(id)
+) ENGINE=InnoDB;
@@ -0,0 +1,10 @@
+-- =========================================
+-- TABLE VERSIONS (conditional GET)
+-- one row per table, bumped in the same transaction as every write to it;
+-- read endpoints derive their ETag / Last-Modified from these rows.
+-- =========================================
+CREATE TABLE IF NOT EXISTS table_versions (
+  table_name VARCHAR(64) PRIMARY KEY,
+  version BIGINT UNSIGNED NOT NULL DEFAULT 0,
+  updated_at DATETIME(6) NOT NULL
+) ENGINE=InnoDB;
@@ -0,0 +1,36 @@
+-- =========================================
+-- CHANGE TRACKING (delta sync, /api/changes)
+-- updated_at is maintained by MySQL on every INSERT/UPDATE, so every write
+-- path is covered; microsecond precision keeps the (updated_at, id)
+-- cursors tight. Deletes leave a row_tombstones row in the same
+-- transaction (see app.model.changes_db).
+-- =========================================
+ALTER TABLE collections
+  ADD COLUMN updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+ALTER TABLE disbursements
+  ADD COLUMN updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+ALTER TABLE budget_entries
+  ADD COLUMN updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+ALTER TABLE dfur_projects
+  ADD COLUMN updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+
+-- users already has a seconds-precision updated_at
+UPDATE users SET updated_at = COALESCE(created_at, NOW()) WHERE updated_at IS NULL;
+ALTER TABLE users
+  MODIFY COLUMN updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6);
+
+CREATE INDEX idx_collections_updated ON collections (updated_at, id);
+CREATE INDEX idx_disbursements_updated ON disbursements (updated_at, id);
+CREATE INDEX idx_budget_entries_updated ON budget_entries (updated_at, id);
+CREATE INDEX idx_dfur_projects_updated ON dfur_projects (updated_at, id);
+CREATE INDEX idx_users_updated ON users (updated_at, id);
+
+CREATE TABLE IF NOT EXISTS row_tombstones (
+  id BIGINT AUTO_INCREMENT PRIMARY KEY,
+  table_name VARCHAR(64) NOT NULL,
+  row_id INT NOT NULL,
+  transaction_id VARCHAR(50),
+  deleted_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+
+  INDEX idx_row_tombstones_deleted (deleted_at, id)
+) ENGINE=InnoDB;
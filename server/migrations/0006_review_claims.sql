@@ -0,0 +1,25 @@
+-- =========================================
+-- REVIEW QUEUE CLAIMS (/api/review-queue)
+-- a checker claims pending rows for CLAIM seconds; other checkers skip
+-- them (SELECT ... FOR UPDATE SKIP LOCKED while claiming, claimed_by /
+-- claim_expires_at afterwards) until the lease runs out.
+-- =========================================
+ALTER TABLE collections
+  ADD COLUMN claimed_by INT NULL,
+  ADD COLUMN claim_expires_at DATETIME(6) NULL;
+ALTER TABLE disbursements
+  ADD COLUMN claimed_by INT NULL,
+  ADD COLUMN claim_expires_at DATETIME(6) NULL;
+ALTER TABLE dfur_projects
+  ADD COLUMN claimed_by INT NULL,
+  ADD COLUMN claim_expires_at DATETIME(6) NULL;
+
+-- queue order: pending, unflagged, oldest first
+CREATE INDEX idx_collections_review_queue ON collections (review_status, is_flagged, created_at, id);
+CREATE INDEX idx_disbursements_review_queue ON disbursements (review_status, is_flagged, created_at, id);
+CREATE INDEX idx_dfur_projects_review_queue ON dfur_projects (review_status, is_flagged, created_at, id);
+
+-- a checker's own claims
+CREATE INDEX idx_collections_claimed_by ON collections (claimed_by, claim_expires_at);
+CREATE INDEX idx_disbursements_claimed_by ON disbursements (claimed_by, claim_expires_at);
+CREATE INDEX idx_dfur_projects_claimed_by ON dfur_projects (claimed_by, claim_expires_at);
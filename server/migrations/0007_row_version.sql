@@ -0,0 +1,10 @@
+-- =========================================
+-- ROW VERSIONS (optimistic concurrency)
+-- every edit, review and flag bumps row_version; update payloads send the
+-- version they were loaded with and only apply while it still matches
+-- (UPDATE ... WHERE id = %s AND row_version = %s), 409 otherwise.
+-- =========================================
+ALTER TABLE collections ADD COLUMN row_version INT UNSIGNED NOT NULL DEFAULT 1;
+ALTER TABLE disbursements ADD COLUMN row_version INT UNSIGNED NOT NULL DEFAULT 1;
+ALTER TABLE budget_entries ADD COLUMN row_version INT UNSIGNED NOT NULL DEFAULT 1;
+ALTER TABLE dfur_projects ADD COLUMN row_version INT UNSIGNED NOT NULL DEFAULT 1;
@@ -0,0 +1,19 @@
+-- =========================================
+-- LEDGER MONTHLY (rollup cube behind /api/monthly-data)
+-- running totals per table x fiscal year x month x category x fund source
+-- x review status; maintained by the write paths alongside ledger_summary
+-- (LEDGER_SUMMARY_ENABLED), rebuild with `flask ledger-summary rebuild`
+-- =========================================
+CREATE TABLE IF NOT EXISTS ledger_monthly (
+  table_name VARCHAR(50) NOT NULL,
+  fiscal_year INT NOT NULL,
+  month TINYINT NOT NULL,
+  category VARCHAR(200) NOT NULL DEFAULT '',
+  fund_source VARCHAR(150) NOT NULL DEFAULT '',
+  review_status VARCHAR(20) NOT NULL DEFAULT '',
+  row_count INT NOT NULL DEFAULT 0,
+  amount_total DECIMAL(16,2) NOT NULL DEFAULT 0,
+  cost_approved_total DECIMAL(16,2) NOT NULL DEFAULT 0,
+  cost_incurred_total DECIMAL(16,2) NOT NULL DEFAULT 0,
+  PRIMARY KEY (table_name, fiscal_year, month, category, fund_source, review_status)
+) ENGINE=InnoDB;
@@ -0,0 +1,19 @@
+-- =========================================
+-- STATEMENT OF RECEIPTS AND EXPENDITURES (/api/sre)
+-- a closed month keeps the statement lines it had when it was closed;
+-- reports read them from here instead of the ledgers
+-- (reopen with `flask sre reopen --year --month`)
+-- =========================================
+CREATE TABLE IF NOT EXISTS sre_closed_periods (
+  fiscal_year INT NOT NULL,
+  month TINYINT NOT NULL,
+  statement JSON NOT NULL,
+  closed_by INT NULL,
+  closed_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (fiscal_year, month)
+) ENGINE=InnoDB;
+
+-- open months: approved rows of a date range grouped by category, read from
+-- the index alone
+CREATE INDEX idx_collections_sre ON collections (review_status, transaction_date, nature_of_collection, amount);
+CREATE INDEX idx_disbursements_sre ON disbursements (review_status, transaction_date, nature_of_disbursement, amount);
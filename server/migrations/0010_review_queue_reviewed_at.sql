@@ -0,0 +1,16 @@
+-- =========================================
+-- REVIEW QUEUE INDEX: reviewed_at in the key
+-- reviewed rows keep review_status 'pending' / is_flagged 0 and only set
+-- reviewed_at, so under (review_status, is_flagged, created_at, id) they
+-- sat at the front of the range and every claim scanned (and FOR UPDATE
+-- locked) the whole review history. With reviewed_at ahead of created_at,
+-- `reviewed_at IS NULL` is part of the index range and the scan starts at
+-- the first unreviewed row.
+-- =========================================
+DROP INDEX idx_collections_review_queue ON collections;
+DROP INDEX idx_disbursements_review_queue ON disbursements;
+DROP INDEX idx_dfur_projects_review_queue ON dfur_projects;
+
+CREATE INDEX idx_collections_review_queue ON collections (review_status, is_flagged, reviewed_at, created_at, id);
+CREATE INDEX idx_disbursements_review_queue ON disbursements (review_status, is_flagged, reviewed_at, created_at, id);
+CREATE INDEX idx_dfur_projects_review_queue ON dfur_projects (review_status, is_flagged, reviewed_at, created_at, id);
@@ -292,4 +292,7 @@ VALUES
 ('F. Infrastructure Projects - 20% Development Fund', 1000000.00, 0.00, 2026),
 ('G. Other Services', 200000.00, 0.00, 2026);
 
-
+-- =========================================
+-- Schema changes from here on are versioned migrations in
+-- server/migrations; apply them with `flask db upgrade`.
+-- =========================================